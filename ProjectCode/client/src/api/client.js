@@ -3,7 +3,19 @@
  * and consistent error handling.
  */
 
-const API_BASE_URL = process.env.REACT_APP_API_BASE_URL || 'http://localhost:8000';
+export const API_BASE_URL = process.env.REACT_APP_API_BASE_URL || 'http://localhost:8000';
+
+/**
+ * Resolve an image URL from the API for use in src/href. Uploaded images
+ * are stored as server-relative /media/{hash} URLs, and lists point images
+ * still stored inline at their /api/.../image endpoint; anything else
+ * (external URLs, data URLs, files in public/) is returned unchanged.
+ * @param {string|null} url - Image URL as returned by the API
+ * @returns {string|null} - URL the browser can load
+ */
+export const mediaUrl = (url) => (
+  url && (url.startsWith('/media/') || url.startsWith('/api/')) ? `${API_BASE_URL}${url}` : url
+);
 
 /**
  * Custom error class for API errors
@@ -3,7 +3,7 @@
  * Handles all engagement-related API calls (likes, reactions, comments)
  */
 
-import { api } from './client';
+import { api, API_BASE_URL } from './client';
 
 // Available reaction emojis
 export const ALLOWED_EMOJIS = ['🏃', '🎉', '💪', '👏', '❤️', '🔥', '🐝', '⭐'];
@@ -23,22 +23,24 @@ export const getAnonymousId = () => {
 // COMMENT ENDPOINTS
 
 /**
- * Get visible comments for an event
+ * Get a page of visible comments for an event (highlighted first, then newest)
  * @param {number} eventId - Event ID
- * @returns {Promise<Array>} - List of comments
+ * @param {string|null} cursor - next_cursor from the previous page
+ * @returns {Promise<Object>} - { comments, next_cursor, total } (total on the first page only)
  */
-export const getEventComments = async (eventId) => {
-  return api.get(`/api/events/${eventId}/comments`);
+export const getEventComments = async (eventId, cursor = null) => {
+  return api.get(`/api/events/${eventId}/comments`, cursor ? { cursor } : {});
 };
 
 /**
- * Get all comments including hidden (admin only)
+ * Get a page of all comments including hidden (admin only)
  * @param {number} eventId - Event ID
  * @param {string} firebaseUid - Admin's Firebase UID
- * @returns {Promise<Array>} - List of all comments with moderation info
+ * @param {string|null} cursor - next_cursor from the previous page
+ * @returns {Promise<Object>} - { comments, next_cursor, total, hidden_count } (counts on the first page only)
  */
-export const getAllEventComments = async (eventId, firebaseUid) => {
-  return api.get(`/api/events/${eventId}/comments/all`, {}, {
+export const getAllEventComments = async (eventId, firebaseUid, cursor = null) => {
+  return api.get(`/api/events/${eventId}/comments/all`, cursor ? { cursor } : {}, {
     'X-Firebase-UID': firebaseUid,
   });
 };
@@ -183,6 +185,41 @@ export const removeReaction = async (eventId, emoji, firebaseUid = null) => {
   return api.delete(`/api/events/${eventId}/reactions/${encodeURIComponent(emoji)}?${new URLSearchParams(params)}`, headers);
 };
 
+/**
+ * Get reaction counts for multiple events (batch). The response is
+ * columnar: { event_ids, emojis, counts, user_reacted } arrays where entry i
+ * belongs to event event_ids[i]; use groupBatchReactions for a per-event map.
+ * @param {Array<number>} eventIds - Event IDs
+ * @param {string|null} firebaseUid - Optional Firebase UID
+ * @returns {Promise<Object>} - Columnar reaction counts
+ */
+export const getBatchReactions = async (eventIds, firebaseUid = null) => {
+  const body = firebaseUid
+    ? { event_ids: eventIds }
+    : { event_ids: eventIds, anonymous_id: getAnonymousId() };
+  const headers = firebaseUid ? { 'X-Firebase-UID': firebaseUid } : {};
+  return api.post('/api/events/reactions/batch', body, headers);
+};
+
+/**
+ * Turn a getBatchReactions response into { [eventId]: reactions } with the
+ * same reaction objects getEventReactions returns. Events without
+ * reactions are absent.
+ * @param {Object} columns - getBatchReactions response
+ * @returns {Object} - Reactions per event ID
+ */
+export const groupBatchReactions = (columns) => {
+  const grouped = {};
+  columns.event_ids.forEach((eventId, i) => {
+    (grouped[eventId] = grouped[eventId] || []).push({
+      emoji: columns.emojis[i],
+      count: columns.counts[i],
+      user_reacted: columns.user_reacted ? columns.user_reacted[i] : false,
+    });
+  });
+  return grouped;
+};
+
 // AGGREGATED ENGAGEMENT ENDPOINTS
 
 /**
@@ -211,6 +248,57 @@ export const getBatchEngagement = async (eventIds, firebaseUid = null) => {
   return api.post('/api/events/engagement/batch', body, headers);
 };
 
+/**
+ * Subscribe to live engagement updates for an event (server-sent events).
+ * Each update holds only the counts that changed, e.g. { likes: 12 },
+ * { reactions: { '🔥': 4 } } or { comment_count: 7 }; merge it with
+ * applyEngagementUpdate. The browser reconnects on its own after errors.
+ * @param {number} eventId - Event ID
+ * @param {Function} onUpdate - Called with each update
+ * @returns {Function} - Unsubscribe (closes the stream)
+ */
+export const subscribeEventEngagement = (eventId, onUpdate) => {
+  if (typeof EventSource === 'undefined') {
+    return () => {};
+  }
+  const source = new EventSource(`${API_BASE_URL}/api/events/${eventId}/engagement/stream`);
+  source.addEventListener('engagement', (e) => {
+    onUpdate(JSON.parse(e.data));
+  });
+  return () => source.close();
+};
+
+/**
+ * Merge a live engagement update into an engagement object
+ * (the viewer's own liked/reacted flags are kept)
+ * @param {Object} engagement - Engagement from getEventEngagement
+ * @param {Object} update - Update from subscribeEventEngagement
+ * @returns {Object} - New engagement object
+ */
+export const applyEngagementUpdate = (engagement, update) => {
+  const next = { ...engagement };
+  if (update.likes !== undefined) {
+    next.likes = { ...engagement.likes, count: update.likes };
+  }
+  if (update.comment_count !== undefined) {
+    next.comment_count = update.comment_count;
+  }
+  if (update.reactions) {
+    const reactions = engagement.reactions.map((r) => (
+      update.reactions[r.emoji] !== undefined ? { ...r, count: update.reactions[r.emoji] } : r
+    ));
+    Object.entries(update.reactions).forEach(([emoji, count]) => {
+      if (!reactions.some((r) => r.emoji === emoji)) {
+        reactions.push({ emoji, count, user_reacted: false });
+      }
+    });
+    next.reactions = reactions
+      .filter((r) => r.count > 0)
+      .sort((a, b) => (a.emoji < b.emoji ? -1 : a.emoji > b.emoji ? 1 : 0));
+  }
+  return next;
+};
+
 // EVENT SETTINGS ENDPOINTS
 
 /**
@@ -39,12 +39,13 @@ export const getEventGalleryPreview = async (eventId, limit = 5, firebaseUid = n
  * Get gallery previews for multiple events in a single request
  * @param {Array<number>} eventIds - Event IDs
  * @param {string|null} firebaseUid - Optional Firebase UID
+ * @param {number} limit - Max preview images per event (default 5)
  * @returns {Promise<Object>} - Map of event_id to preview data
  */
-export const getBatchGalleryPreview = async (eventIds, firebaseUid = null) => {
+export const getBatchGalleryPreview = async (eventIds, firebaseUid = null, limit = 5) => {
   const body = firebaseUid
-    ? { event_ids: eventIds }
-    : { event_ids: eventIds, anonymous_id: getAnonymousId() };
+    ? { event_ids: eventIds, limit }
+    : { event_ids: eventIds, limit, anonymous_id: getAnonymousId() };
   const headers = firebaseUid ? { 'X-Firebase-UID': firebaseUid } : {};
   return api.post('/api/events/gallery/batch-preview', body, headers);
 };
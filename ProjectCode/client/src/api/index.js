@@ -2,9 +2,9 @@
  * Central API exports
  */
 
-export { api, ApiError } from './client';
+export { api, ApiError, mediaUrl } from './client';
 export { getMeetingFiles, getMeetingContent } from './meetings';
-export { getAvailableYears, getMenRecords, getWomenRecords, getAllRaces } from './records';
+export { getAvailableYears, getMenRecords, getWomenRecords, getAllRaces, getAgeGradeLeaderboard } from './records';
 export {
   syncFirebaseUser,
   getMemberByFirebaseUid,
@@ -50,8 +50,12 @@ export {
   getEventReactions,
   toggleReaction,
   removeReaction,
+  getBatchReactions,
+  groupBatchReactions,
   getEventEngagement,
   getBatchEngagement,
+  subscribeEventEngagement,
+  applyEngagementUpdate,
   getEventSettings,
   updateEventSettings
 } from './engagement';
@@ -33,9 +33,24 @@ export async function getWomenRecords(year = null) {
 }
 
 /**
- * Get all race names
- * @returns {Promise<{races: string[]}>}
+ * Get races and distances, newest first
+ * @param {string|null} cursor - next_cursor from the previous page
+ * @returns {Promise<{races: Array, next_cursor: string|null}>}
  */
-export async function getAllRaces() {
-  return api.get('/api/results/all-races');
+export async function getAllRaces(cursor = null) {
+  const params = cursor ? { cursor } : {};
+  return api.get('/api/results/all-races', params);
+}
+
+/**
+ * Get the club age-grade leaderboard
+ * @param {Object} [options] - Optional filters
+ * @param {string} [options.distance] - Race distance, or "ALL" (default) across distances
+ * @param {string} [options.gender] - "M" or "W"
+ * @param {string} [options.age_group] - Age group like "30-34"
+ * @param {number} [options.limit] - Number of runners (default 50, max 200)
+ * @returns {Promise<{leaderboard: Array}>}
+ */
+export async function getAgeGradeLeaderboard(options = {}) {
+  return api.get('/api/results/age-grade-leaderboard', options);
 }
@@ -10,15 +10,40 @@ import { api } from './client';
  * @param {Object} [options] - Optional parameters for more precise matching
  * @param {string} [options.gender] - "M" or "F" for gender_age matching
  * @param {number} [options.birth_year] - Birth year for gender_age calculation
- * @returns {Promise<Object>} Race results and statistics
+ * @param {string} [options.cursor] - next_cursor from the previous page
+ * @param {number} [options.limit] - Page size (server default 50, max 200)
+ * @returns {Promise<Object>} One page of race results, next_cursor and statistics
  */
 export async function getMemberRaceResults(searchKey, options = {}) {
   const params = {};
   if (options.gender) params.gender = options.gender;
   if (options.birth_year) params.birth_year = options.birth_year;
+  if (options.cursor) params.cursor = options.cursor;
+  if (options.limit) params.limit = options.limit;
   return api.get(`/api/results/member/${encodeURIComponent(searchKey)}`, params);
 }
 
+/**
+ * Get the finisher list of a single race
+ * @param {string} race - Race name
+ * @param {Object} [options] - Sorting, filter and pagination options
+ * @param {string} [options.sort] - "overall" (default), "gender" or "age_group" place
+ * @param {string} [options.gender] - "M" or "W"
+ * @param {string} [options.age_group] - Age range like "30-34" or "70+"
+ * @param {string} [options.cursor] - next_cursor from the previous page
+ * @param {number} [options.limit] - Page size (server default 50, max 200)
+ * @returns {Promise<Object>} One page of results and next_cursor
+ */
+export async function getRaceResults(race, options = {}) {
+  const params = {};
+  if (options.sort) params.sort = options.sort;
+  if (options.gender) params.gender = options.gender;
+  if (options.age_group) params.age_group = options.age_group;
+  if (options.cursor) params.cursor = options.cursor;
+  if (options.limit) params.limit = options.limit;
+  return api.get(`/api/results/race/${encodeURIComponent(race)}`, params);
+}
+
 /**
  * Search race results with filters
  * @param {Object} filters - Search filters
@@ -67,3 +92,16 @@ export async function getWomenRecords(year = null) {
 export async function getAllRaces() {
   return api.get('/api/results/all-races');
 }
+
+/**
+ * Get a member's age-grade summary (per distance plus "ALL")
+ * @param {string} searchKey - Member's NYRR ID or display name
+ * @param {Object} [options] - Same gender/birth_year matching as getMemberRaceResults
+ * @returns {Promise<{age_grades: Array}>} Age grades, club rank and percentiles
+ */
+export async function getMemberAgeGrades(searchKey, options = {}) {
+  const params = {};
+  if (options.gender) params.gender = options.gender;
+  if (options.birth_year) params.birth_year = options.birth_year;
+  return api.get(`/api/results/member/${encodeURIComponent(searchKey)}/age-grades`, params);
+}
@@ -19,6 +19,10 @@ export default function CommentSection({ eventId, commentsEnabled = true, onComm
   const { currentUser } = useAuth();
   const { adminModeEnabled } = useAdmin();
   const [comments, setComments] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [totalCount, setTotalCount] = useState(0);
+  const [hiddenCount, setHiddenCount] = useState(0);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [newComment, setNewComment] = useState('');
   const [loading, setLoading] = useState(true);
   const [submitting, setSubmitting] = useState(false);
@@ -28,20 +32,24 @@ export default function CommentSection({ eventId, commentsEnabled = true, onComm
     fetchComments();
   }, [eventId, adminModeEnabled, currentUser?.uid]);
 
+  const fetchPage = (cursor = null) => (
+    adminModeEnabled && currentUser?.uid
+      ? getAllEventComments(eventId, currentUser.uid, cursor)
+      : getEventComments(eventId, cursor)
+  );
+
   const fetchComments = async () => {
     setLoading(true);
     setError(null);
     try {
-      let fetchedComments;
-      if (adminModeEnabled && currentUser?.uid) {
-        fetchedComments = await getAllEventComments(eventId, currentUser.uid);
-      } else {
-        fetchedComments = await getEventComments(eventId);
-      }
-      setComments(fetchedComments);
+      // First page carries the counts
+      const page = await fetchPage();
+      setComments(page.comments);
+      setNextCursor(page.next_cursor);
+      setTotalCount(page.total ?? page.comments.length);
+      setHiddenCount(page.hidden_count ?? 0);
       if (onCommentCountChange) {
-        const visibleCount = fetchedComments.filter(c => !c.is_hidden).length;
-        onCommentCountChange(visibleCount);
+        onCommentCountChange((page.total ?? 0) - (page.hidden_count ?? 0));
       }
     } catch (err) {
       console.error('Error fetching comments:', err);
@@ -51,6 +59,22 @@ export default function CommentSection({ eventId, commentsEnabled = true, onComm
     }
   };
 
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+
+    setLoadingMore(true);
+    try {
+      const page = await fetchPage(nextCursor);
+      setComments(prev => [...prev, ...page.comments]);
+      setNextCursor(page.next_cursor);
+    } catch (err) {
+      console.error('Error fetching comments:', err);
+      setError('Failed to load comments');
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleSubmit = async (e) => {
     e.preventDefault();
     e.stopPropagation();
@@ -61,9 +85,10 @@ export default function CommentSection({ eventId, commentsEnabled = true, onComm
     try {
       const created = await createComment(eventId, newComment.trim(), currentUser.uid);
       setComments([created, ...comments]);
+      setTotalCount(totalCount + 1);
       setNewComment('');
       if (onCommentCountChange) {
-        onCommentCountChange(comments.length + 1);
+        onCommentCountChange(totalCount - hiddenCount + 1);
       }
     } catch (err) {
       console.error('Error creating comment:', err);
@@ -74,13 +99,25 @@ export default function CommentSection({ eventId, commentsEnabled = true, onComm
   };
 
   const handleCommentUpdate = (updatedComment) => {
+    const previous = comments.find(c => c.id === updatedComment.id);
+    if (previous && Boolean(previous.is_hidden) !== Boolean(updatedComment.is_hidden)) {
+      const newHiddenCount = hiddenCount + (updatedComment.is_hidden ? 1 : -1);
+      setHiddenCount(newHiddenCount);
+      if (onCommentCountChange) {
+        onCommentCountChange(totalCount - newHiddenCount);
+      }
+    }
     setComments(comments.map(c => c.id === updatedComment.id ? updatedComment : c));
   };
 
   const handleCommentDelete = (commentId) => {
+    const deleted = comments.find(c => c.id === commentId);
     setComments(comments.filter(c => c.id !== commentId));
-    if (onCommentCountChange) {
-      onCommentCountChange(comments.length - 1);
+    setTotalCount(totalCount - 1);
+    if (deleted?.is_hidden) {
+      setHiddenCount(hiddenCount - 1);
+    } else if (onCommentCountChange) {
+      onCommentCountChange(totalCount - hiddenCount - 1);
     }
   };
 
@@ -94,7 +131,7 @@ export default function CommentSection({ eventId, commentsEnabled = true, onComm
       <Box sx={{ display: 'flex', alignItems: 'center', gap: 1, mb: 2 }}>
         <ChatBubbleOutlineIcon sx={{ color: '#757575' }} />
         <Typography variant="h6" sx={{ fontWeight: 600 }}>
-          Comments ({displayedComments.length})
+          Comments ({adminModeEnabled ? totalCount : totalCount - hiddenCount})
         </Typography>
       </Box>
 
@@ -176,9 +213,17 @@ export default function CommentSection({ eventId, commentsEnabled = true, onComm
         </Box>
       )}
 
-      {adminModeEnabled && comments.some(c => c.is_hidden) && (
+      {!loading && nextCursor && (
+        <Box sx={{ display: 'flex', justifyContent: 'center', pt: 2 }}>
+          <Button onClick={handleLoadMore} disabled={loadingMore} sx={{ color: '#FFB84D' }}>
+            {loadingMore ? <CircularProgress size={20} color="inherit" /> : 'Load more comments'}
+          </Button>
+        </Box>
+      )}
+
+      {adminModeEnabled && hiddenCount > 0 && (
         <Typography variant="caption" color="text.secondary" sx={{ display: 'block', mt: 2 }}>
-          Admin view: Showing {comments.filter(c => c.is_hidden).length} hidden comment(s)
+          Admin view: {hiddenCount} hidden comment(s)
         </Typography>
       )}
     </Box>
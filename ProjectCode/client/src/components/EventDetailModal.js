@@ -13,7 +13,7 @@ import {
 import CollectionsIcon from '@mui/icons-material/Collections';
 import { useAuth } from '../context/AuthContext';
 import { useAdmin } from '../context/AdminContext';
-import { getEventEngagement } from '../api';
+import { getEventEngagement, subscribeEventEngagement, applyEngagementUpdate } from '../api';
 import LikeButton from './LikeButton';
 import ReactionPicker from './ReactionPicker';
 import CommentSection from './CommentSection';
@@ -33,6 +33,14 @@ export default function EventDetailModal({ event, onClose }) {
     }
   }, [event?.id, currentUser?.uid]);
 
+  // Live counts while the modal is open, instead of re-fetching
+  useEffect(() => {
+    if (!event?.id) return undefined;
+    return subscribeEventEngagement(event.id, (update) => {
+      setEngagement((current) => (current ? applyEngagementUpdate(current, update) : current));
+    });
+  }, [event?.id]);
+
   const fetchEngagement = async () => {
     setLoading(true);
     try {
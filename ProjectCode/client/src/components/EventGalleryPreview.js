@@ -3,6 +3,7 @@ import { Box, Avatar, Typography, Skeleton, Tooltip } from '@mui/material';
 import { useNavigate } from 'react-router-dom';
 import CollectionsIcon from '@mui/icons-material/Collections';
 import { getEventGalleryPreview } from '../api/gallery';
+import { mediaUrl } from '../api/client';
 import { useAuth } from '../context/AuthContext';
 
 /**
@@ -103,7 +104,7 @@ const EventGalleryPreview = ({ eventId, maxImages = 4, size = 48 }) => {
         {displayImages.map((image, index) => (
           <Avatar
             key={image.id}
-            src={image.image_url}
+            src={mediaUrl(image.thumbnail_url || image.image_url)}
             variant="rounded"
             sx={{
               width: size,
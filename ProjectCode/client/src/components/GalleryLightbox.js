@@ -19,6 +19,7 @@ import FavoriteBorderIcon from '@mui/icons-material/FavoriteBorder';
 import DownloadIcon from '@mui/icons-material/Download';
 import ShareIcon from '@mui/icons-material/Share';
 import { toggleGalleryImageLike, downloadImage, shareImage } from '../api/gallery';
+import { mediaUrl } from '../api/client';
 import { useAuth } from '../context/AuthContext';
 
 const Transition = React.forwardRef(function Transition(props, ref) {
@@ -107,7 +108,7 @@ const GalleryLightbox = ({
   const handleDownload = () => {
     if (!currentImage) return;
     const filename = `gallery-${currentImage.id}.jpg`;
-    downloadImage(currentImage.image_url, filename);
+    downloadImage(mediaUrl(currentImage.image_url), filename);
     setSnackbar({
       open: true,
       message: 'Download started / 开始下载',
@@ -210,7 +211,7 @@ const GalleryLightbox = ({
             {/* Image */}
             <Box
               component="img"
-              src={currentImage.image_url}
+              src={mediaUrl(currentImage.full_url || currentImage.image_url)}
               alt={currentImage.caption || 'Gallery image'}
               sx={{
                 maxWidth: '100%',
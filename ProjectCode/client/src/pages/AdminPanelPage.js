@@ -42,6 +42,7 @@ import { createEvent, getAllEvents, updateEvent, deleteEvent } from '../api/even
 import { getDonationSummary } from '../api/donors';
 import { getAllBanners, createBanner, updateBanner, deleteBanner } from '../api/banners';
 import { getAllSections, createSection, updateSection, deleteSection } from '../api/homepageSections';
+import { mediaUrl } from '../api/client';
 import { getPendingActivities, verifyActivity, getMemberActivities } from '../api/activities';
 import { committeeMembers } from '../data/committeeMembers';
 import EditIcon from '@mui/icons-material/Edit';
@@ -1021,7 +1022,7 @@ export default function AdminPanelPage() {
                     <TableCell>
                       <Box
                         component="img"
-                        src={banner.image_url}
+                        src={mediaUrl(banner.image_url)}
                         alt={banner.alt_text || 'Banner preview'}
                         sx={{ width: 100, height: 60, objectFit: 'cover', borderRadius: 1 }}
                         onError={(e) => { e.target.src = '/master-image-1.jpg'; }}
@@ -1112,7 +1113,7 @@ export default function AdminPanelPage() {
                       {section.image_url ? (
                         <Box
                           component="img"
-                          src={section.image_url}
+                          src={mediaUrl(section.image_url)}
                           alt={section.title_en}
                           sx={{ width: 100, height: 60, objectFit: 'cover', borderRadius: 1 }}
                           onError={(e) => { e.target.src = '/placeholder-section.png'; }}
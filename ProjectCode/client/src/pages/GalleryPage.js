@@ -27,6 +27,7 @@ import ArrowBackIcon from '@mui/icons-material/ArrowBack';
 import DeleteIcon from '@mui/icons-material/Delete';
 import { getEventGallery, toggleGalleryImageLike, deleteGalleryImage } from '../api/gallery';
 import { getEventById } from '../api/events';
+import { mediaUrl } from '../api/client';
 import { useAuth } from '../context/AuthContext';
 import { useAdmin } from '../context/AdminContext';
 import GalleryLightbox from '../components/GalleryLightbox';
@@ -296,7 +297,7 @@ const GalleryPage = () => {
                 <Box sx={{ position: 'relative', paddingTop: '100%', overflow: 'hidden', backgroundColor: '#f5f5f5' }}>
                   <Box
                     component="img"
-                    src={image.image_url}
+                    src={mediaUrl(image.medium_url || image.image_url)}
                     alt={image.caption || 'Gallery image'}
                     sx={{
                       position: 'absolute',
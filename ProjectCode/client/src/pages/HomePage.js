@@ -66,6 +66,7 @@ import { useAuth } from '../context/AuthContext';
 import { useAdmin } from '../context/AdminContext';
 import { getCarouselBanners } from '../api/banners';
 import { getActiveSections, updateSection, reorderSections, uploadImage } from '../api/homepageSections';
+import { mediaUrl } from '../api/client';
 
 // Quill editor configuration for meeting minutes
 const quillModules = {
@@ -168,7 +169,7 @@ function SortableSection({ section, adminModeEnabled, onEdit }) {
           {section.image_url ? (
             <Box
               component="img"
-              src={section.image_url}
+              src={mediaUrl(section.image_url)}
               alt={section.title_en}
               sx={{
                 width: '100%',
@@ -632,7 +633,7 @@ export default function HomePage() {
       is_active: section.is_active !== false
     });
     setSelectedFile(null);
-    setImagePreview(section.image_url || null);
+    setImagePreview(mediaUrl(section.image_url) || null);
     setEditDialogOpen(true);
   };
 
@@ -772,7 +773,7 @@ export default function HomePage() {
               <Box
                 key={image.id || index}
                 component="img"
-                src={image.image_url}
+                src={mediaUrl(image.image_url)}
                 alt={image.alt_text || image.label_en}
                 sx={{
                   width: '100%',
@@ -67,6 +67,8 @@ const ProfilePage = () => {
   // Race results state
   const [raceData, setRaceData] = useState({ results: [], stats: { total_races: 0, prs: {}, recent_results: [] } });
   const [loadingRaces, setLoadingRaces] = useState(false);
+  const [raceQuery, setRaceQuery] = useState(null);
+  const [loadingMoreRaces, setLoadingMoreRaces] = useState(false);
 
   // Race history sorting state
   const [sortColumn, setSortColumn] = useState('race_date');
@@ -140,6 +142,10 @@ const ProfilePage = () => {
           if (response.birth_year) options.birth_year = response.birth_year;
           const raceResponse = await getMemberRaceResults(searchKey, options);
           setRaceData(raceResponse);
+          setRaceQuery({ searchKey, options });
+          // A fresh first page is in server order (newest first)
+          setSortColumn('race_date');
+          setSortDirection('desc');
         } catch (raceErr) {
           console.error('Failed to fetch race results:', raceErr);
         } finally {
@@ -328,16 +334,72 @@ const ProfilePage = () => {
     return isNaN(num) ? 0 : num * 1000;
   };
 
-  // Handle sorting for race history table
-  const handleSortClick = (column) => {
-    if (sortColumn === column) {
-      setSortDirection(sortDirection === 'asc' ? 'desc' : 'asc');
-    } else {
-      setSortColumn(column);
-      setSortDirection('asc');
+  // Fetch the next page of race history and append it
+  const handleLoadMoreRaces = async () => {
+    if (!raceQuery || !raceData.next_cursor) return;
+
+    setLoadingMoreRaces(true);
+    try {
+      const raceResponse = await getMemberRaceResults(raceQuery.searchKey, {
+        ...raceQuery.options,
+        cursor: raceData.next_cursor
+      });
+      setRaceData(prev => ({
+        ...prev,
+        results: [...prev.results, ...raceResponse.results],
+        next_cursor: raceResponse.next_cursor
+      }));
+    } catch (raceErr) {
+      console.error('Failed to fetch more race results:', raceErr);
+    } finally {
+      setLoadingMoreRaces(false);
     }
   };
 
+  // Fetch every remaining page of race history (largest page size).
+  // Returns false if a page failed to load.
+  const loadAllRaces = async () => {
+    let cursor = raceData.next_cursor;
+    if (!raceQuery || !cursor) return true;
+
+    setLoadingMoreRaces(true);
+    try {
+      const remaining = [];
+      while (cursor) {
+        const raceResponse = await getMemberRaceResults(raceQuery.searchKey, {
+          ...raceQuery.options,
+          cursor,
+          limit: 200
+        });
+        remaining.push(...raceResponse.results);
+        cursor = raceResponse.next_cursor;
+      }
+      setRaceData(prev => ({
+        ...prev,
+        results: [...prev.results, ...remaining],
+        next_cursor: null
+      }));
+      return true;
+    } catch (raceErr) {
+      console.error('Failed to fetch race history for sorting:', raceErr);
+      return false;
+    } finally {
+      setLoadingMoreRaces(false);
+    }
+  };
+
+  // Handle sorting for race history table. Pages arrive newest first, so
+  // any other order needs the whole history loaded before sorting it
+  // (otherwise e.g. "fastest first" would only rank the loaded pages).
+  const handleSortClick = async (column) => {
+    const direction = sortColumn === column && sortDirection === 'asc' ? 'desc' : 'asc';
+    const serverOrder = column === 'race_date' && direction === 'desc';
+    if (!serverOrder && !(await loadAllRaces())) return;
+
+    setSortColumn(column);
+    setSortDirection(direction);
+  };
+
   // Sort race results
   const sortedResults = [...(raceData.results || [])].sort((a, b) => {
     let aVal, bVal;
@@ -727,6 +789,7 @@ const ProfilePage = () => {
                     <TableSortLabel
                       active={sortColumn === 'race_date'}
                       direction={sortColumn === 'race_date' ? sortDirection : 'asc'}
+                      disabled={loadingMoreRaces}
                       onClick={() => handleSortClick('race_date')}
                     >
                       Date / 日期
@@ -736,6 +799,7 @@ const ProfilePage = () => {
                     <TableSortLabel
                       active={sortColumn === 'race'}
                       direction={sortColumn === 'race' ? sortDirection : 'asc'}
+                      disabled={loadingMoreRaces}
                       onClick={() => handleSortClick('race')}
                     >
                       Race / 比赛
@@ -745,6 +809,7 @@ const ProfilePage = () => {
                     <TableSortLabel
                       active={sortColumn === 'distance'}
                       direction={sortColumn === 'distance' ? sortDirection : 'asc'}
+                      disabled={loadingMoreRaces}
                       onClick={() => handleSortClick('distance')}
                     >
                       Distance / 距离
@@ -754,6 +819,7 @@ const ProfilePage = () => {
                     <TableSortLabel
                       active={sortColumn === 'overall_time'}
                       direction={sortColumn === 'overall_time' ? sortDirection : 'asc'}
+                      disabled={loadingMoreRaces}
                       onClick={() => handleSortClick('overall_time')}
                     >
                       Time / 成绩
@@ -763,6 +829,7 @@ const ProfilePage = () => {
                     <TableSortLabel
                       active={sortColumn === 'pace'}
                       direction={sortColumn === 'pace' ? sortDirection : 'asc'}
+                      disabled={loadingMoreRaces}
                       onClick={() => handleSortClick('pace')}
                     >
                       Pace / 配速
@@ -772,6 +839,7 @@ const ProfilePage = () => {
                     <TableSortLabel
                       active={sortColumn === 'overall_place'}
                       direction={sortColumn === 'overall_place' ? sortDirection : 'asc'}
+                      disabled={loadingMoreRaces}
                       onClick={() => handleSortClick('overall_place')}
                     >
                       Place / 名次
@@ -799,6 +867,13 @@ const ProfilePage = () => {
                 ))}
               </TableBody>
             </Table>
+            {raceData.next_cursor && (
+              <Box sx={{ display: 'flex', justifyContent: 'center', pt: 2 }}>
+                <Button onClick={handleLoadMoreRaces} disabled={loadingMoreRaces}>
+                  {loadingMoreRaces ? <CircularProgress size={20} /> : 'Load more / 加载更多'}
+                </Button>
+              </Box>
+            )}
           </TableContainer>
         )}
       </Paper>
@@ -0,0 +1,140 @@
+"""
+Age-Grade Summaries
+
+Maintains the age_grade_summary table: one row per (runner, race distance)
+plus one cross-distance row per runner under race_distance "ALL". Each row
+holds the runner's best and average NYRR age-graded percent and their
+rankings within the club:
+- club_rank: the club age-grade leaderboard
+- age_group_rank / age_group_percentile: standing within gender + age group
+- distance_percentile: where the runner's best time sits among same-gender
+  club runners at that distance, so a 5K and a half marathon can be compared
+
+Percentiles depend on every runner, so the table is recomputed as a whole
+with vectorized pandas passes over the results table. The importers call
+rebuild_age_grades() once per run after their rows are committed; the API
+only reads the summary table.
+"""
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from database import Results, AgeGradeSummary
+
+ALL_DISTANCES = "ALL"  # race_distance value of the cross-distance rows
+
+RANK_COLUMNS = ('club_rank', 'age_group_rank', 'race_count')
+PERCENT_COLUMNS = ('best_age_graded_percent', 'avg_age_graded_percent', 'age_group_percentile', 'distance_percentile')
+
+
+def age_group_labels(ages: pd.Series) -> pd.Series:
+    """Five-year age groups as "30-34", with "1-19" and "80+" at the ends."""
+    lows = (np.clip(ages.fillna(0), 20, 80) // 5 * 5).astype(int)
+    labels = lows.astype(str) + '-' + (lows + 4).astype(str)
+    labels = labels.where(ages >= 20, '1-19').where(ages < 80, '80+')
+    return labels.where(ages.notna(), None)
+
+
+def _load_results(db: Session) -> pd.DataFrame:
+    query = db.query(
+        Results.id.label('result_id'),
+        Results.runner_id,
+        Results.name,
+        Results.gender,
+        Results.age,
+        Results.race_distance,
+        Results.race,
+        Results.race_time,
+        Results.overall_time,
+        Results.finish_seconds,
+        Results.age_graded_percent
+    ).filter(Results.runner_id.isnot(None))
+
+    df = pd.read_sql(query.statement, db.connection())
+    df['percent'] = pd.to_numeric(df['age_graded_percent'], errors='coerce')
+    return df
+
+
+def _summarize(df: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """Best/average age grade, race count and best finish per `keys` group."""
+    grouped = df.groupby(keys)
+    summary = grouped.size().rename('race_count').to_frame()
+    summary['avg_age_graded_percent'] = grouped['percent'].mean()
+    summary['best_seconds'] = grouped['finish_seconds'].min()
+
+    best = df[df['percent'].notna()].sort_values(
+        ['percent', 'result_id'], ascending=[False, True]
+    ).drop_duplicates(keys).set_index(keys)
+    summary['best_result_id'] = best['result_id']
+    summary['best_age_graded_percent'] = best['percent']
+    summary['best_race'] = best['race']
+    summary['best_race_time'] = best['race_time']
+    summary['best_overall_time'] = best['overall_time']
+    return summary.reset_index()
+
+
+def compute_age_grades(df: pd.DataFrame) -> pd.DataFrame:
+    """Summary rows (one per runner/distance plus one "ALL" per runner) with rankings."""
+    # Name, gender and age group come from each runner's latest result
+    latest = df.sort_values(['race_time', 'result_id']).drop_duplicates('runner_id', keep='last')
+    runners = pd.DataFrame({
+        'runner_id': latest['runner_id'],
+        'runner_name': latest['name'],
+        'gender': latest['gender'],
+        'age_group': age_group_labels(latest['age'])
+    })
+
+    by_distance = _summarize(df, ['runner_id', 'race_distance'])
+    across = _summarize(df, ['runner_id'])
+    across['race_distance'] = ALL_DISTANCES
+    rows = pd.concat([by_distance, across], ignore_index=True).merge(runners, on='runner_id')
+
+    percent = rows.groupby('race_distance')['best_age_graded_percent']
+    rows['club_rank'] = percent.rank(ascending=False, method='min')
+
+    group = rows.groupby(['race_distance', 'gender', 'age_group'])['best_age_graded_percent']
+    rows['age_group_rank'] = group.rank(ascending=False, method='min')
+    rows['age_group_percentile'] = group.rank(method='max', pct=True) * 100
+
+    # Share of same-gender runners at the distance whose best time is at or slower than this one
+    seconds = rows['best_seconds'].where(rows['race_distance'] != ALL_DISTANCES)
+    rows['distance_percentile'] = seconds.groupby(
+        [rows['race_distance'], rows['gender']]
+    ).rank(ascending=False, method='max', pct=True) * 100
+
+    return rows.drop(columns=['best_seconds'])
+
+
+def _to_mappings(rows: pd.DataFrame) -> list:
+    """DataFrame -> insert mappings with NaN/NaT as None and ints/2-dp percents."""
+    for column in RANK_COLUMNS:
+        rows[column] = rows[column].astype('Int64')
+    for column in PERCENT_COLUMNS:
+        rows[column] = rows[column].round(2)
+    rows['best_result_id'] = rows['best_result_id'].astype('Int64')
+    rows['best_race_time'] = rows['best_race_time'].astype(object)
+
+    records = rows.astype(object).where(rows.notna(), None).to_dict('records')
+    for record in records:
+        if record['best_race_time'] is not None:
+            record['best_race_time'] = pd.Timestamp(record['best_race_time']).to_pydatetime()
+    return records
+
+
+def rebuild_age_grades(db: Session) -> int:
+    """
+    Recompute the whole age_grade_summary table. The caller commits.
+
+    Returns:
+        Number of summary rows written
+    """
+    df = _load_results(db)
+    db.query(AgeGradeSummary).delete(synchronize_session=False)
+    if df.empty:
+        return 0
+
+    mappings = _to_mappings(compute_age_grades(df))
+    db.execute(insert(AgeGradeSummary), mappings)
+    return len(mappings)
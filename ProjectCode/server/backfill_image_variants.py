@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Gallery Image Variant Backfill for NewBee Running Club
+Generates thumbnail/medium/full variants for gallery images that don't
+have them yet (uploaded before the pipeline existed, while it was off, or
+whose processing failed).
+
+This script:
+1. Finds event_gallery_images rows stored in the blob store (/media URLs)
+   without a thumbnail_url (all of them with --force)
+2. Renders each distinct image once in a process pool
+3. Writes the variant URLs to every row sharing that image, committing
+   as each image finishes
+
+Rows still holding data URLs are skipped; run
+migrations/extract_image_data_urls.py first.
+
+Usage:
+    python3 backfill_image_variants.py                # Missing variants only
+    python3 backfill_image_variants.py --force        # Regenerate all
+    python3 backfill_image_variants.py --workers 4 --limit 100
+"""
+
+import argparse
+import time
+from concurrent.futures import as_completed
+
+from database import SessionLocal, EventGalleryImage
+from blob_store import blob_hash_from_url
+from image_variants import (
+    apply_variants, create_variant_pool, generate_variants, pillow_available, IMAGE_VARIANT_WORKERS
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate missing gallery image variants")
+    parser.add_argument("--workers", type=int, default=max(IMAGE_VARIANT_WORKERS, 1), help="Worker processes")
+    parser.add_argument("--limit", type=int, help="Process at most this many distinct images")
+    parser.add_argument("--force", action="store_true", help="Regenerate variants that already exist")
+    args = parser.parse_args()
+
+    if not pillow_available():
+        print("✗ Pillow is not installed (pip install -r requirements.txt)")
+        return
+
+    db = SessionLocal()
+    try:
+        query = db.query(EventGalleryImage.id, EventGalleryImage.image_url).filter(
+            EventGalleryImage.image_url.like('/media/%')
+        )
+        if not args.force:
+            query = query.filter(EventGalleryImage.thumbnail_url.is_(None))
+
+        # Rows sharing an image are rendered once
+        image_ids = {}
+        for row in query.order_by(EventGalleryImage.id).all():
+            source_hash = blob_hash_from_url(row.image_url)
+            if source_hash:
+                image_ids.setdefault(source_hash, []).append(row.id)
+        sources = list(image_ids)[:args.limit] if args.limit else list(image_ids)
+        print(f"{len(sources)} images to process ({sum(len(image_ids[h]) for h in sources)} gallery rows)")
+        if not sources:
+            return
+
+        start = time.perf_counter()
+        done = failed = 0
+        with create_variant_pool(args.workers) as pool:
+            futures = {pool.submit(generate_variants, source_hash): source_hash for source_hash in sources}
+            for future in as_completed(futures):
+                source_hash = futures[future]
+                try:
+                    apply_variants(db, image_ids[source_hash], future.result())
+                    db.commit()
+                    done += 1
+                except Exception as e:
+                    db.rollback()
+                    failed += 1
+                    print(f"✗ {source_hash} (rows {image_ids[source_hash]}): {e}")
+                if (done + failed) % 50 == 0:
+                    print(f"  {done + failed}/{len(sources)}")
+
+        print(f"✓ {done} images processed, {failed} failed in {time.perf_counter() - start:.1f}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
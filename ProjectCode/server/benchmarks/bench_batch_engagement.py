@@ -0,0 +1,173 @@
+"""
+Benchmark: Batch Engagement (per-event loop vs set-based queries)
+
+Builds a throwaway SQLite database with events, likes, reactions and
+comments, then counts the SQL statements and time spent by the old
+/api/events/engagement/batch implementation (7+ queries per event, plus a
+commit for every event without a settings row) and by
+engagement.load_engagements, which issues the same fixed set of queries for
+any number of event IDs (counts come from event_engagement_counters).
+
+Usage:
+    python benchmarks/bench_batch_engagement.py
+    python benchmarks/bench_batch_engagement.py --sizes 1 10 30 100
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, event, func, insert
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, Event, Member, EventCommentSettings, Like, Reaction, Comment
+from engagement import load_engagements, reconcile_engagement_counters
+from models import EventEngagementResponse, LikeCountResponse, ReactionCountResponse
+
+EVENT_COUNT = 200
+EMOJIS = ["👍", "❤️", "🎉", "🔥", "👏", "💪"]
+
+
+def build_database(path):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(insert(Member), [
+            {"id": i, "username": f"runner{i}", "email": f"runner{i}@example.com", "password_hash": "x", "status": "runner"}
+            for i in range(1, 51)
+        ])
+        conn.execute(insert(Event), [
+            {"id": i, "name": f"Event {i}", "date": date(2025, 1, 1)}
+            for i in range(1, EVENT_COUNT + 1)
+        ])
+        # Half of the events already have a settings row
+        conn.execute(insert(EventCommentSettings), [
+            {"event_id": i} for i in range(1, EVENT_COUNT + 1, 2)
+        ])
+        likes, reactions, comments = [], [], []
+        for event_id in range(1, EVENT_COUNT + 1):
+            for anon in range(rng.randint(0, 40)):
+                likes.append({"event_id": event_id, "anonymous_id": f"anon-{anon}"})
+                reactions.append({"event_id": event_id, "anonymous_id": f"anon-{anon}", "emoji": rng.choice(EMOJIS)})
+            for member_id in rng.sample(range(1, 51), rng.randint(0, 5)):
+                comments.append({"event_id": event_id, "member_id": member_id, "firebase_uid": f"uid-{member_id}",
+                                 "content": "Great run!", "is_hidden": rng.random() < 0.1})
+        conn.execute(insert(Like), likes)
+        conn.execute(insert(Reaction), reactions)
+        conn.execute(insert(Comment), comments)
+
+    # Fill event_engagement_counters the way the migration does
+    db = sessionmaker(bind=engine)()
+    try:
+        reconcile_engagement_counters(db)
+    finally:
+        db.close()
+    return engine
+
+
+def old_batch(db, event_ids, anonymous_id):
+    """The batch endpoint before the rewrite: a query loop per event."""
+    engagements = {}
+    for event_id in event_ids:
+        found = db.query(Event).filter(Event.id == event_id).first()
+        if not found:
+            continue
+
+        settings = db.query(EventCommentSettings).filter(EventCommentSettings.event_id == event_id).first()
+        if not settings:
+            settings = EventCommentSettings(event_id=event_id)
+            db.add(settings)
+            db.commit()
+            db.refresh(settings)
+
+        like_count = db.query(Like).filter(Like.event_id == event_id).count()
+        user_liked = db.query(Like).filter(
+            Like.event_id == event_id, Like.anonymous_id == anonymous_id
+        ).first() is not None
+
+        reaction_counts = db.query(
+            Reaction.emoji, func.count(Reaction.id).label('count')
+        ).filter(Reaction.event_id == event_id).group_by(Reaction.emoji).all()
+        user_reactions = {r.emoji for r in db.query(Reaction.emoji).filter(
+            Reaction.event_id == event_id, Reaction.anonymous_id == anonymous_id
+        ).all()}
+
+        comment_count = db.query(Comment).filter(
+            Comment.event_id == event_id, Comment.is_hidden == False
+        ).count()
+
+        engagements[event_id] = EventEngagementResponse(
+            event_id=event_id,
+            likes=LikeCountResponse(count=like_count, user_liked=user_liked),
+            reactions=[ReactionCountResponse(emoji=e, count=c, user_reacted=e in user_reactions) for e, c in reaction_counts],
+            comment_count=comment_count,
+            comments_enabled=settings.comments_enabled,
+            likes_enabled=settings.likes_enabled,
+            reactions_enabled=settings.reactions_enabled
+        )
+    return engagements
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def measure(label, fn, counter):
+    counter.count = 0
+    start = time.perf_counter()
+    result = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  {label:<22} {counter.count:5d} queries {elapsed:9.1f} ms   events returned: {len(result)}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch engagement queries")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 30, 100], help="Batch sizes to test")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_database(os.path.join(tmp, "bench_engagement.db"))
+        counter = QueryCounter(engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        # Warm up mapper/statement caches so the first size isn't penalized
+        db = Session()
+        load_engagements(db, [EVENT_COUNT], None, "anon-1")
+        db.close()
+
+        offset = 0
+        for size in args.sizes:
+            # Fresh events for each size so the old path still sees missing settings rows
+            event_ids = [((offset + i) % EVENT_COUNT) + 1 for i in range(size)]
+            offset += size
+            print(f"\nBatch of {size} event IDs:")
+
+            db = Session()
+            try:
+                new = measure("new (set-based)", lambda: load_engagements(db, event_ids, None, "anon-1"), counter)
+                old = measure("old (per-event loop)", lambda: old_batch(db, event_ids, "anon-1"), counter)
+                assert {k: v.model_dump() for k, v in new.items()} == {k: v.model_dump() for k, v in old.items()}
+            finally:
+                db.close()
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
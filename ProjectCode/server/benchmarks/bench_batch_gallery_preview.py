@@ -0,0 +1,141 @@
+"""
+Benchmark: Gallery Previews for a List Page (per-event calls vs one batch)
+
+Builds a throwaway SQLite database with events, gallery images and likes and
+serves it through the real app (FastAPI TestClient, get_db overridden). For
+each batch size it compares N calls to GET /api/events/{event_id}/gallery/preview
+with one POST /api/events/gallery/batch-preview: SQL statements and wall
+time. The batch answers with a grouped count, a ROW_NUMBER() top-N query and
+one likes query whatever the number of events; its previews are checked
+against the single-event ones.
+
+Usage:
+    python benchmarks/bench_batch_gallery_preview.py
+    python benchmarks/bench_batch_gallery_preview.py --sizes 10 30 100 --limit 3
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("USE_SQLITE", "true")  # main's own engine is never used here
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, Event, EventGalleryImage, EventGalleryImageLike, get_db
+import main as api
+
+EVENT_COUNT = 200
+ANONYMOUS_ID = "anon-1"
+
+
+def build_database(path):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(42)
+    start = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(Event), [
+            {"id": i, "name": f"Event {i}", "date": date(2025, 1, 1)}
+            for i in range(1, EVENT_COUNT + 1)
+        ])
+        images = []
+        for event_id in range(1, EVENT_COUNT + 1):
+            for n in range(rng.choice([0, 0, 2, 5, 12, 40])):
+                images.append({
+                    "id": len(images) + 1,
+                    "event_id": event_id,
+                    "image_url": f"/media/{len(images) + 1:064x}",
+                    "display_order": rng.randint(0, 3),
+                    "is_active": rng.random() > 0.1,
+                    "created_at": start + timedelta(minutes=len(images)),  # distinct: a total order
+                })
+        conn.execute(insert(EventGalleryImage), images)
+        conn.execute(insert(EventGalleryImageLike), [
+            {"image_id": image["id"], "anonymous_id": ANONYMOUS_ID}
+            for image in images if rng.random() < 0.3
+        ])
+    return engine
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def per_event(client, event_ids, limit):
+    return {
+        event_id: client.get(
+            f"/api/events/{event_id}/gallery/preview", params={"limit": limit, "anonymous_id": ANONYMOUS_ID}
+        ).json()
+        for event_id in event_ids
+    }
+
+
+def batch(client, event_ids, limit):
+    response = client.post("/api/events/gallery/batch-preview", json={
+        "event_ids": event_ids, "anonymous_id": ANONYMOUS_ID, "limit": limit
+    })
+    return {int(event_id): preview for event_id, preview in response.json()["previews"].items()}
+
+
+def measure(label, fn, counter):
+    counter.count = 0
+    start = time.perf_counter()
+    result = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  {label:<12} {counter.count:5d} queries {elapsed:9.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch gallery previews against per-event calls")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 30, 100], help="Batch sizes to test")
+    parser.add_argument("--limit", type=int, default=5, help="Preview images per event")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_database(os.path.join(tmp, "bench_gallery.db"))
+        counter = QueryCounter(engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        def override_get_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        logging.getLogger("httpx").setLevel(logging.WARNING)  # one line per request otherwise
+        api.app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(api.app)
+        batch(client, [EVENT_COUNT], args.limit)  # warm up mapper/statement caches
+
+        for size in args.sizes:
+            event_ids = list(range(1, min(size, EVENT_COUNT) + 1))
+            print(f"\nGallery previews for {len(event_ids)} events (limit {args.limit}):")
+            batched = measure("batch", lambda: batch(client, event_ids, args.limit), counter)
+            single = measure("per-event", lambda: per_event(client, event_ids, args.limit), counter)
+            assert batched == single, "batch previews differ from single-event previews"
+
+        api.app.dependency_overrides.clear()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
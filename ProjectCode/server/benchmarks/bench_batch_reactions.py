@@ -0,0 +1,167 @@
+"""
+Benchmark: Reaction Counts for a List Page (per-event calls vs one batch)
+
+Builds a throwaway SQLite database with events and reactions and serves it
+through the real app (FastAPI TestClient, get_db overridden). For each
+batch size it compares N calls to GET /api/events/{event_id}/reactions with
+one POST /api/events/reactions/batch: response bytes, SQL statements and
+wall time, both with a cold engagement cache and a warm one. The batch
+response is checked against the per-event responses.
+
+For reference it also times the single grouped query over `reactions`
+(event_id IN (...) GROUP BY event_id, emoji) that recounting would need; the
+batch endpoint reads the maintained counters instead.
+
+Usage:
+    python benchmarks/bench_batch_reactions.py
+    python benchmarks/bench_batch_reactions.py --sizes 10 30 100
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("USE_SQLITE", "true")  # main's own engine is never used here
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, func, insert
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, Event, Reaction, get_db
+from engagement import reconcile_engagement_counters
+from engagement_cache import engagement_cache
+from models import ALLOWED_EMOJIS
+import main as api
+
+EVENT_COUNT = 200
+ANONYMOUS_ID = "anon-1"
+
+
+def build_database(path):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(insert(Event), [
+            {"id": i, "name": f"Event {i}", "date": date(2025, 1, 1)}
+            for i in range(1, EVENT_COUNT + 1)
+        ])
+        reactions = []
+        for event_id in range(1, EVENT_COUNT + 1):
+            for anon in range(rng.randint(0, 60)):
+                for emoji in rng.sample(ALLOWED_EMOJIS, rng.randint(1, 3)):
+                    reactions.append({"event_id": event_id, "anonymous_id": f"anon-{anon}", "emoji": emoji})
+        conn.execute(insert(Reaction), reactions)
+
+    # Fill event_engagement_counters the way the migration does
+    db = sessionmaker(bind=engine)()
+    try:
+        reconcile_engagement_counters(db)
+    finally:
+        db.close()
+    return engine
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def per_event(client, event_ids):
+    responses = [client.get(f"/api/events/{event_id}/reactions", params={"anonymous_id": ANONYMOUS_ID})
+                 for event_id in event_ids]
+    return responses, sum(len(response.content) for response in responses)
+
+
+def batch(client, event_ids):
+    response = client.post("/api/events/reactions/batch", json={"event_ids": event_ids, "anonymous_id": ANONYMOUS_ID})
+    return response, len(response.content)
+
+
+def grouped_query(Session, event_ids):
+    db = Session()
+    try:
+        return db.query(Reaction.event_id, Reaction.emoji, func.count(Reaction.id)).filter(
+            Reaction.event_id.in_(event_ids)
+        ).group_by(Reaction.event_id, Reaction.emoji).all()
+    finally:
+        db.close()
+
+
+def measure(label, fn, counter):
+    counter.count = 0
+    start = time.perf_counter()
+    result, size = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"  {label:<26} {counter.count:5d} queries {elapsed:9.1f} ms {size:9d} bytes")
+    return result
+
+
+def check(per_event_responses, batch_response, event_ids):
+    columns = batch_response.json()
+    grouped = {}
+    for i, event_id in enumerate(columns["event_ids"]):
+        grouped.setdefault(event_id, []).append(
+            {"emoji": columns["emojis"][i], "count": columns["counts"][i], "user_reacted": columns["user_reacted"][i]}
+        )
+    for event_id, response in zip(event_ids, per_event_responses):
+        assert response.json()["reactions"] == grouped.get(event_id, []), f"event {event_id} differs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch reaction counts against per-event calls")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 30, 100], help="Batch sizes to test")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_database(os.path.join(tmp, "bench_reactions.db"))
+        counter = QueryCounter(engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        def override_get_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        logging.getLogger("httpx").setLevel(logging.WARNING)  # one line per request otherwise
+        api.app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(api.app)
+        batch(client, [EVENT_COUNT])  # warm up mapper/statement caches
+
+        for size in args.sizes:
+            event_ids = list(range(1, min(size, EVENT_COUNT) + 1))
+            print(f"\nReactions for {len(event_ids)} events:")
+
+            engagement_cache.clear()
+            cold_batch = measure("batch (cold cache)", lambda: batch(client, event_ids), counter)
+            measure("batch (warm cache)", lambda: batch(client, event_ids), counter)
+            engagement_cache.clear()
+            measure("per-event (cold cache)", lambda: per_event(client, event_ids), counter)
+            responses = measure("per-event (warm cache)", lambda: per_event(client, event_ids), counter)
+            measure("grouped reactions query", lambda: (None, len(json.dumps(
+                [list(row) for row in grouped_query(Session, event_ids)], ensure_ascii=False
+            ).encode())), counter)
+            check(responses, cold_batch, event_ids)
+
+        api.app.dependency_overrides.clear()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
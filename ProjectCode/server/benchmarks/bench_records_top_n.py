@@ -0,0 +1,140 @@
+"""
+Benchmark: Records Top-N (Python grouping vs ROW_NUMBER window query)
+
+Builds a throwaway SQLite database with a synthetic results table and times
+the old records implementation (load every matching row, group and sort in
+Python) against leaderboard.top_results_by_distance, which ranks with
+ROW_NUMBER() OVER (PARTITION BY race_distance ...) and returns only the top
+10 per distance.
+
+Usage:
+    python benchmarks/bench_records_top_n.py                 # 500k rows
+    python benchmarks/bench_records_top_n.py --rows 100000
+    python benchmarks/bench_records_top_n.py --year 2023
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, func, insert
+from sqlalchemy.orm import sessionmaker
+
+from database import Results
+from leaderboard import top_results_by_distance
+
+DISTANCES = {"5K": 1500, "4M": 1900, "10K": 3000, "10M": 4800, "Half Marathon": 6300, "Marathon": 13500}
+YEARS = list(range(2015, 2026))
+INSERT_BATCH = 10000
+
+
+def format_time(seconds):
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+def build_database(path, row_count):
+    engine = create_engine(f"sqlite:///{path}")
+    Results.__table__.create(bind=engine)
+
+    rng = random.Random(42)
+    distances = list(DISTANCES.items())
+    with engine.begin() as conn:
+        batch = []
+        for i in range(row_count):
+            distance, base = rng.choice(distances)
+            seconds = int(base * rng.uniform(0.7, 2.2))
+            gender = rng.choice("MW")
+            race_time = datetime(rng.choice(YEARS), rng.randint(1, 12), rng.randint(1, 28), 8, 0)
+            batch.append({
+                "name": f"Runner {i % 20000}",
+                "gender_age": f"{gender}{rng.randint(18, 75)}",
+                "gender": gender,
+                "overall_time": format_time(seconds),
+                "finish_seconds": seconds,
+                "pace": format_time(seconds // 6),
+                "race": f"race {i % 300}",
+                "race_time": race_time,
+                "race_year": race_time.year,
+                "race_distance": distance,
+            })
+            if len(batch) == INSERT_BATCH:
+                conn.execute(insert(Results), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(Results), batch)
+    return engine
+
+
+def old_records(db, gender, year):
+    """The records endpoint before the rewrite: full scan + Python sort."""
+    query = db.query(Results).filter(Results.gender_age.like(f'{gender}%'))
+    if year:
+        query = query.filter(func.extract('year', Results.race_time) == year)
+
+    distance_records = {}
+    for result in query.all():
+        distance_records.setdefault(result.race_distance, []).append(result)
+
+    records = []
+    for distance, results in distance_records.items():
+        sorted_results = sorted(results, key=lambda x: x.overall_time or 'ZZ:ZZ:ZZ')[:10]
+        records.extend(sorted_results)
+    return records
+
+
+def new_records(db, gender, year):
+    return top_results_by_distance(db, gender, year)
+
+
+def time_call(label, fn, repeats):
+    timings = []
+    rows = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        rows = fn()
+        timings.append(time.perf_counter() - start)
+    best = min(timings) * 1000
+    print(f"  {label:<28} best {best:9.1f} ms   rows returned: {len(rows)}")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark records top-N queries")
+    parser.add_argument("--rows", type=int, default=500000, help="Synthetic results rows (default 500000)")
+    parser.add_argument("--year", type=int, default=None, help="Optional year filter")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per variant (best is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench_results.db")
+        print(f"Building synthetic results table ({args.rows:,} rows)...")
+        start = time.perf_counter()
+        engine = build_database(path, args.rows)
+        print(f"  built in {time.perf_counter() - start:.1f}s")
+
+        Session = sessionmaker(bind=engine)
+        db = Session()
+        try:
+            for gender in ("M", "W"):
+                print(f"\nGender {gender}, year {args.year or 'all-time'}:")
+                old_ms = time_call("old (query.all + sort)", lambda: old_records(db, gender, args.year), args.repeats)
+                db.expunge_all()
+                new_ms = time_call("new (ROW_NUMBER window)", lambda: new_records(db, gender, args.year), args.repeats)
+                print(f"  speedup: {old_ms / new_ms:.1f}x")
+        finally:
+            db.close()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
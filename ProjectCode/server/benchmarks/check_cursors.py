@@ -0,0 +1,137 @@
+"""
+Check: Tampered Pagination Cursors Are Rejected
+
+Cursor tokens come back from clients, so anything can be in them. This
+decodes a set of malformed and mistyped tokens with pagination.decode_cursor
+and checks each raises ValueError (which the endpoints turn into 400
+"Invalid cursor"), then sends them through the real app (FastAPI
+TestClient, throwaway SQLite database) to the paginated results and
+comments endpoints and checks for 400, never 500. A genuine cursor must
+still decode and page.
+
+Exits non-zero if any check fails.
+
+Usage:
+    python benchmarks/check_cursors.py
+"""
+
+import base64
+import json
+import logging
+import os
+import sys
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("USE_SQLITE", "true")  # main's own engine is never used here
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, Event, Results, get_db
+from pagination import decode_cursor, encode_cursor
+import main as api
+
+RUNNER = "Jane Doe"
+
+
+def token(payload) -> str:
+    """Cursor token for an arbitrary JSON payload (what a tampering client can send)."""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+TAMPERED = {
+    "not base64": "!!!",
+    "not JSON": base64.urlsafe_b64encode(b"{nope").decode(),
+    "not a list": token({"dt": "2024-01-01T00:00:00"}),
+    "dt not a string": token([{"dt": 5}, 1]),
+    "dt null": token([{"dt": None}, 1]),
+    "dt not ISO": token([{"dt": "yesterday"}, 1]),
+    "dt with extra keys": token([{"dt": "2024-01-01T00:00:00", "x": 1}, 1]),
+    "nested list": token([[1], 1]),
+    "string for datetime": token(["2024-01-01", 1]),
+    "string for id": token([{"dt": "2024-01-01T00:00:00"}, "1"]),
+    "bool for id": token([{"dt": "2024-01-01T00:00:00"}, True]),
+    "wrong length": token([{"dt": "2024-01-01T00:00:00"}]),
+}
+
+# Endpoints paginated on (race_time, ..., id) / (is_highlighted, created_at, id)
+ENDPOINTS = [
+    f"/api/results/member/{RUNNER}",
+    "/api/results/race/Race 1",
+    "/api/events/1/comments",
+]
+
+
+def build_database(path):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Event), [{"id": 1, "name": "Event 1", "date": date(2025, 1, 1)}])
+        conn.execute(insert(Results), [
+            {"name": RUNNER, "race": "Race 1", "race_distance": "5K", "race_time": datetime(2024, 1, day)}
+            for day in range(1, 6)
+        ])
+    return engine
+
+
+def main():
+    failures = []
+
+    def check(ok, label):
+        print(f"  {'✓' if ok else '✗'} {label}")
+        if not ok:
+            failures.append(label)
+
+    print("decode_cursor:")
+    for label, cursor in TAMPERED.items():
+        try:
+            decode_cursor(cursor)
+            rejected = label in ("string for datetime", "string for id", "bool for id", "wrong length")
+            check(rejected, f"{label}: decodes (type/length checked by paginate)" if rejected else f"{label}: accepted")
+        except ValueError:
+            check(True, f"{label}: ValueError")
+        except Exception as e:
+            check(False, f"{label}: {type(e).__name__} instead of ValueError")
+    genuine = [datetime(2024, 1, 3), 7]
+    check(decode_cursor(encode_cursor(genuine)) == genuine, "genuine cursor round-trips")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_database(os.path.join(tmp, "check_cursors.db"))
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        def override_get_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        logging.getLogger("httpx").setLevel(logging.WARNING)  # one line per request otherwise
+        api.app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(api.app)
+
+        for path in ENDPOINTS:
+            print(f"\n{path}:")
+            for label, cursor in TAMPERED.items():
+                status_code = client.get(path, params={"cursor": cursor}).status_code
+                check(status_code == 400, f"{label}: HTTP {status_code}")
+
+        print(f"\n{ENDPOINTS[1]} (genuine cursor):")
+        first = client.get(ENDPOINTS[1], params={"limit": 2}).json()
+        second = client.get(ENDPOINTS[1], params={"limit": 2, "cursor": first["next_cursor"]})
+        check(second.status_code == 200 and len(second.json()["results"]) == 2, "next page loads")
+
+        api.app.dependency_overrides.clear()
+        engine.dispose()
+
+    print(f"\n{'✗ ' + str(len(failures)) + ' checks failed' if failures else '✓ All checks passed'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Check: Gallery Image Variants Render
+
+Smoke test for image_variants.py against a throwaway local blob store.
+Stores a 3000x2000 JPEG and renders its variants twice: once in this
+process and once in a spawned worker (create_variant_pool), the same path
+uploads and backfill_image_variants.py take. Checks that:
+
+- every variant is stored under its /media URL as WebP (or JPEG with
+  IMAGE_VARIANT_FORMAT=jpeg), with the expected longest edge,
+- a small image is never upscaled,
+- the pipeline stays off, and spawns no pool, until an image is submitted.
+
+Needs Pillow (requirements.txt); without it the check fails after
+verifying that the app's pipeline stays disabled.
+
+Exits non-zero if any check fails.
+
+Usage:
+    python benchmarks/check_image_variants.py
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("USE_SQLITE", "true")  # the database is never used here
+if "CHECK_VARIANTS_DIR" not in os.environ:  # spawned workers re-import this module; keep the parent's store
+    os.environ["CHECK_VARIANTS_DIR"] = tempfile.mkdtemp(prefix="check_variants_")
+os.environ["BLOB_STORE"] = "local"
+os.environ["BLOB_STORE_DIR"] = os.environ["CHECK_VARIANTS_DIR"]
+
+from blob_store import blob_store, blob_hash_from_url, blob_url
+from image_variants import (
+    create_variant_pool, generate_variants, pillow_available, IMAGE_VARIANT_FORMAT, IMAGE_VARIANT_SIZES,
+    VariantPipeline
+)
+
+
+def main():
+    failures = []
+
+    def check(ok, label):
+        print(f"  {'✓' if ok else '✗'} {label}")
+        if not ok:
+            failures.append(label)
+
+    print("pipeline:")
+    pipeline = VariantPipeline(workers=1)
+    check(not pipeline.submit(1, blob_url("0" * 64)), "submit before start is refused")
+    pipeline.start()
+    check(pipeline._pool is None, "start spawns no worker processes")
+    if not pillow_available():
+        check(not pipeline._enabled, "stays disabled without Pillow")
+        check(False, "Pillow is not installed (pip install -r requirements.txt); variants not rendered")
+        print(f"\n✗ {len(failures)} checks failed")
+        sys.exit(1)
+    pipeline.stop()
+
+    from PIL import Image
+
+    def stored_image(url):
+        with blob_store.open(blob_hash_from_url(url)) as blob:
+            image = Image.open(io.BytesIO(blob.read()))
+            image.load()
+        return image
+
+    def source(size):
+        out = io.BytesIO()
+        Image.new("RGB", size, (200, 40, 40)).save(out, "JPEG", quality=90)
+        return blob_store.put(out.getvalue(), "image/jpeg")
+
+    expected_format = "JPEG" if IMAGE_VARIANT_FORMAT == "jpeg" else "WEBP"
+    large = source((3000, 2000))
+    small = source((300, 200))
+
+    print("\nin process:")
+    urls = generate_variants(large)
+    check(set(urls) == set(IMAGE_VARIANT_SIZES), f"variants {sorted(urls)}")
+    for name, max_edge in IMAGE_VARIANT_SIZES.items():
+        image = stored_image(urls[name])
+        check(image.format == expected_format and max(image.size) == max_edge,
+              f"{name}: {image.format} {image.size[0]}x{image.size[1]}")
+    small_urls = generate_variants(small)
+    check(all(stored_image(url).size == (300, 200) for url in small_urls.values()), "small image is not upscaled")
+
+    print("\nworker process:")
+    with create_variant_pool(1) as pool:
+        pooled = pool.submit(generate_variants, large).result(timeout=120)
+    check(pooled == urls, "same variant URLs as in process (content-addressed)")
+
+    print(f"\n{'✗ ' + str(len(failures)) + ' checks failed' if failures else '✓ All checks passed'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    finally:
+        shutil.rmtree(os.environ["CHECK_VARIANTS_DIR"], ignore_errors=True)
@@ -0,0 +1,189 @@
+"""
+Check: List Endpoints Leave Image Payloads Unloaded
+
+image_url on gallery images, homepage sections and banners may hold a
+whole base64 image (see image_payloads.py). This serves a throwaway SQLite
+database holding both inline (data URL) and /media images through the real
+app (FastAPI TestClient, get_db overridden), records the columns every
+SELECT returns, and checks that:
+
+- no list endpoint selects an image_url column by default,
+- with include_payload=true each one does, and returns the data URLs,
+- inline images are listed as their /api/.../image URL, which serves the
+  decoded bytes, while /media URLs are listed unchanged.
+
+Exits non-zero if any check fails.
+
+Usage:
+    python benchmarks/check_list_payloads.py
+"""
+
+import base64
+import logging
+import os
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("USE_SQLITE", "true")  # main's own engine is never used here
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, BannerImage, Event, EventGalleryImage, HomepageSection, Member, get_db
+import main as api
+
+ADMIN_UID = "admin-uid"
+SMALL_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mP8z8BQDwAEhQGAhKmMIQAAAABJRU5ErkJggg=="
+)
+PNG = SMALL_PNG + b"\0" * 150_000  # trailing padding: a heavy row, still a PNG to sniff
+
+
+def data_url(image: bytes) -> str:
+    return "data:image/png;base64," + base64.b64encode(image).decode()
+
+
+DATA_URL = data_url(PNG)
+BANNER_DATA_URL = data_url(SMALL_PNG)  # banner image_url is String(500)
+MEDIA_URL = "/media/" + "ab" * 32
+
+HEAVY_COLUMNS = {
+    EventGalleryImage.__table__.c.image_url: "event_gallery_images.image_url",
+    HomepageSection.__table__.c.image_url: "homepage_sections.image_url",
+    BannerImage.__table__.c.image_url: "banner_images.image_url",
+}
+
+# (label, method, path, body, headers, image paths of the inline rows)
+LIST_ENDPOINTS = [
+    ("gallery", "GET", "/api/events/1/gallery", None, {}, ["/api/gallery/1/image"]),
+    ("gallery preview", "GET", "/api/events/1/gallery/preview", None, {}, ["/api/gallery/1/image"]),
+    ("gallery batch preview", "POST", "/api/events/gallery/batch-preview", {"event_ids": [1, 2]}, {},
+     ["/api/gallery/1/image"]),
+    ("homepage sections", "GET", "/api/homepage-sections", None, {}, ["/api/homepage-sections/1/image"]),
+    ("homepage sections (admin)", "GET", "/api/homepage-sections/all", None, {"X-Firebase-UID": ADMIN_UID},
+     ["/api/homepage-sections/1/image"]),
+    ("banners", "GET", "/api/banners", None, {}, ["/api/banners/1/image"]),
+    ("banners (admin)", "GET", "/api/banners/all", None, {"X-Firebase-UID": ADMIN_UID}, ["/api/banners/1/image"]),
+    ("carousel", "GET", "/api/banners/carousel", None, {}, ["/api/banners/1/image"]),
+]
+
+
+def build_database(path):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Event), [{"id": i, "name": f"Event {i}", "date": date(2025, 1, 1)} for i in (1, 2)])
+        conn.execute(insert(Member), [{
+            "username": "admin", "email": "admin@example.com", "password_hash": "-",
+            "status": "admin", "firebase_uid": ADMIN_UID
+        }])
+        conn.execute(insert(EventGalleryImage), [
+            {"id": 1, "event_id": 1, "image_url": DATA_URL, "display_order": 1},
+            {"id": 2, "event_id": 1, "image_url": MEDIA_URL, "display_order": 2},
+            {"id": 3, "event_id": 2, "image_url": MEDIA_URL, "display_order": 1},
+        ])
+        conn.execute(insert(HomepageSection), [
+            {"id": 1, "title_en": "Inline", "image_url": DATA_URL, "link_path": "/a", "display_order": 1},
+            {"id": 2, "title_en": "Media", "image_url": MEDIA_URL, "link_path": "/b", "display_order": 2},
+        ])
+        conn.execute(insert(BannerImage), [
+            {"id": 1, "image_url": BANNER_DATA_URL, "display_order": 1},
+            {"id": 2, "image_url": MEDIA_URL, "display_order": 2},
+        ])
+    return engine
+
+
+class SelectedColumns:
+    """Records which heavy columns each statement returns."""
+
+    def __init__(self, engine):
+        self.selected = set()
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        compiled = getattr(context, "compiled", None)
+        for entry in getattr(compiled, "_result_columns", None) or []:
+            for obj in entry[2]:
+                if obj in HEAVY_COLUMNS:
+                    self.selected.add(HEAVY_COLUMNS[obj])
+
+
+def listed_urls(body):
+    """Every image_url in a list/preview response."""
+    if isinstance(body, list):
+        return [item["image_url"] for item in body]
+    if "previews" in body:
+        return [img["image_url"] for preview in body["previews"].values() for img in preview["images"]]
+    return [img["image_url"] for img in body["images"]]
+
+
+def main():
+    failures = []
+
+    def check(ok, label):
+        print(f"  {'✓' if ok else '✗'} {label}")
+        if not ok:
+            failures.append(label)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = build_database(os.path.join(tmp, "check_payloads.db"))
+        recorder = SelectedColumns(engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        def override_get_db():
+            db = Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        logging.getLogger("httpx").setLevel(logging.WARNING)  # one line per request otherwise
+        api.app.dependency_overrides[get_db] = override_get_db
+        client = TestClient(api.app)
+
+        for label, method, path, body, headers, inline_paths in LIST_ENDPOINTS:
+            print(f"\n{label} ({method} {path}):")
+            for include_payload in (False, True):
+                recorder.selected.clear()
+                params = {"include_payload": "true"} if include_payload else {}
+                response = client.request(method, path, json=body, headers=headers, params=params)
+                if response.status_code != 200:
+                    check(False, f"include_payload={include_payload}: HTTP {response.status_code}")
+                    continue
+                urls = listed_urls(response.json())
+                if include_payload:
+                    check(bool(recorder.selected), f"include_payload=true selects {sorted(recorder.selected)}")
+                    check(DATA_URL in urls or BANNER_DATA_URL in urls, "include_payload=true returns the data URLs")
+                else:
+                    check(not recorder.selected, f"default selects no image_url column {sorted(recorder.selected)}")
+                    check(all(p in urls for p in inline_paths) and MEDIA_URL in urls and not any(url.startswith("data:") for url in urls),
+                          f"default lists inline images as {inline_paths}, /media URLs unchanged "
+                          f"({len(response.content)} bytes)")
+
+        print("\nimage endpoints:")
+        for path, image in (
+            ("/api/gallery/1/image", PNG),
+            ("/api/homepage-sections/1/image", PNG),
+            ("/api/banners/1/image", SMALL_PNG),
+        ):
+            response = client.get(path)
+            check(response.status_code == 200 and response.content == image, f"{path} serves the inline image")
+        response = client.get("/api/gallery/2/image", follow_redirects=False)
+        check(response.status_code == 307 and response.headers["location"] == MEDIA_URL,
+              "/api/gallery/2/image redirects to its /media URL")
+        check(client.get("/api/gallery/99/image").status_code == 404, "/api/gallery/99/image is 404")
+
+        api.app.dependency_overrides.clear()
+        engine.dispose()
+
+    print(f"\n{'✗ ' + str(len(failures)) + ' checks failed' if failures else '✓ All checks passed'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
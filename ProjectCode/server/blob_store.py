@@ -0,0 +1,273 @@
+"""
+Content-Addressed Blob Store
+
+Uploaded images are stored once, keyed by the SHA-256 of their bytes, and
+referenced from the database by a short URL, /media/{hash}, instead of a
+base64 data URL in the row. Uploading the same bytes twice stores one blob.
+Blobs are immutable and never rewritten, so the /media endpoint serves
+them with the hash as a strong ETag and lets clients cache them forever.
+
+Backends (BLOB_STORE):
+    local  Files under BLOB_STORE_DIR (default ./media), fanned out by the
+           first two hex digits of the hash. Uploads are written in chunks
+           to a staging file (StagedBlob) and renamed into place, so a
+           reader never sees a partial blob.
+    s3     Any S3-compatible bucket (AWS, R2, MinIO): BLOB_S3_BUCKET,
+           optional BLOB_S3_ENDPOINT_URL and BLOB_S3_PREFIX; credentials
+           come from the usual AWS environment. Needs boto3.
+
+Deleting a gallery image doesn't delete its blob, since other rows may
+share it.
+"""
+
+import base64
+import binascii
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+
+BLOB_STORE = os.getenv("BLOB_STORE", "local")
+BLOB_STORE_DIR = os.getenv("BLOB_STORE_DIR", "./media")
+BLOB_S3_BUCKET = os.getenv("BLOB_S3_BUCKET")
+BLOB_S3_ENDPOINT_URL = os.getenv("BLOB_S3_ENDPOINT_URL")
+BLOB_S3_PREFIX = os.getenv("BLOB_S3_PREFIX", "media/")
+
+MEDIA_URL_PREFIX = "/media/"
+BLOB_HASH_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+_MEDIA_URL_PATTERN = re.compile(r"^/media/([0-9a-f]{64})$")
+_DATA_URL_PATTERN = re.compile(r"^data:([\w.+-]+/[\w.+-]+)?(?:;[^,;]+=[^,;]+)*;base64,", re.IGNORECASE)
+
+
+def blob_url(blob_hash: str) -> str:
+    return f"{MEDIA_URL_PREFIX}{blob_hash}"
+
+
+def blob_hash_from_url(url: Optional[str]) -> Optional[str]:
+    """The hash in a /media/{hash} URL, or None for any other URL."""
+    match = _MEDIA_URL_PATTERN.match(url or "")
+    return match.group(1) if match else None
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """MIME type of a JPEG, PNG, GIF or WebP from its first bytes, else None."""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+def decode_data_url(url: str) -> Optional[Tuple[str, bytes]]:
+    """(declared MIME type, bytes) of a base64 data URL, or None if url isn't one."""
+    match = _DATA_URL_PATTERN.match(url)
+    if not match:
+        return None
+    try:
+        data = base64.b64decode(url[match.end():], validate=True)
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid base64 data URL")
+    return match.group(1) or "application/octet-stream", data
+
+
+class LocalBlobStore:
+    """Blobs as files under a root directory."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+        self.staging_dir = self.root  # same filesystem, so put_file is a rename
+
+    def path(self, blob_hash: str) -> Path:
+        return self.root / blob_hash[:2] / blob_hash
+
+    def local_path(self, blob_hash: str) -> Optional[Path]:
+        """Path of a stored blob; FileNotFoundError if it isn't stored."""
+        path = self.path(blob_hash)
+        if not path.is_file():
+            raise FileNotFoundError(blob_hash)
+        return path
+
+    def exists(self, blob_hash: str) -> bool:
+        return self.path(blob_hash).is_file()
+
+    def put(self, data: bytes, content_type: Optional[str] = None) -> str:
+        """Store data (once) and return its hash."""
+        staged = StagedBlob(self)
+        try:
+            staged.write(data)
+            return staged.commit(content_type)
+        finally:
+            staged.discard()
+
+    def put_file(self, tmp_path: str, blob_hash: str, content_type: Optional[str] = None):
+        """Move a finished staging file into place as blob_hash (dropped if already stored)."""
+        path = self.path(blob_hash)
+        if path.is_file():
+            os.unlink(tmp_path)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, path)
+
+    def open(self, blob_hash: str) -> BinaryIO:
+        """Open a blob for reading; FileNotFoundError if it isn't stored."""
+        return open(self.path(blob_hash), "rb")
+
+
+class S3BlobStore:
+    """Blobs as objects in an S3-compatible bucket."""
+
+    def __init__(self, bucket: str, prefix: str = "", endpoint_url: Optional[str] = None):
+        import boto3  # optional dependency, only needed for BLOB_STORE=s3
+        from botocore.exceptions import ClientError
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.staging_dir = None  # system temp dir
+        self._client = boto3.client("s3", endpoint_url=endpoint_url)
+        self._client_error = ClientError
+
+    def key(self, blob_hash: str) -> str:
+        return f"{self.prefix}{blob_hash}"
+
+    def local_path(self, blob_hash: str) -> Optional[Path]:
+        """None: blobs aren't on local disk (use get())."""
+        return None
+
+    def _is_missing(self, error) -> bool:
+        return error.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound")
+
+    def exists(self, blob_hash: str) -> bool:
+        try:
+            self._client.head_object(Bucket=self.bucket, Key=self.key(blob_hash))
+            return True
+        except self._client_error as e:
+            if self._is_missing(e):
+                return False
+            raise
+
+    def _extra_args(self, content_type: Optional[str]) -> dict:
+        return {
+            "ContentType": content_type or "application/octet-stream",
+            "CacheControl": "public, max-age=31536000, immutable"
+        }
+
+    def put(self, data: bytes, content_type: Optional[str] = None) -> str:
+        """Store data (once) and return its hash."""
+        blob_hash = hashlib.sha256(data).hexdigest()
+        if not self.exists(blob_hash):
+            self._client.put_object(
+                Bucket=self.bucket,
+                Key=self.key(blob_hash),
+                Body=data,
+                **self._extra_args(content_type or sniff_image_type(data[:16]))
+            )
+        return blob_hash
+
+    def put_file(self, tmp_path: str, blob_hash: str, content_type: Optional[str] = None):
+        """Upload a finished staging file as blob_hash (skipped if already stored) and remove it."""
+        try:
+            if not self.exists(blob_hash):
+                self._client.upload_file(
+                    tmp_path, self.bucket, self.key(blob_hash), ExtraArgs=self._extra_args(content_type)
+                )
+        finally:
+            os.unlink(tmp_path)
+
+    def open(self, blob_hash: str) -> BinaryIO:
+        """Open a blob for reading; FileNotFoundError if it isn't stored."""
+        return self.get(blob_hash)["Body"]
+
+    def get(self, blob_hash: str, byte_range: Optional[str] = None) -> dict:
+        """
+        get_object response for a blob (Body, ContentLength, ContentType,
+        ContentRange for a range). byte_range is an HTTP Range header value,
+        passed through to S3.
+
+        Raises:
+            FileNotFoundError: the blob isn't stored
+            ValueError: byte_range can't be satisfied
+        """
+        kwargs = {"Range": byte_range} if byte_range else {}
+        try:
+            return self._client.get_object(Bucket=self.bucket, Key=self.key(blob_hash), **kwargs)
+        except self._client_error as e:
+            if self._is_missing(e):
+                raise FileNotFoundError(blob_hash)
+            if e.response.get("Error", {}).get("Code") == "InvalidRange":
+                raise ValueError(byte_range)
+            raise
+
+
+class StagedBlob:
+    """
+    A blob written chunk by chunk to a staging file and hashed on the way,
+    so an upload is never held in memory whole. commit() stores it under
+    its hash; discard() removes whatever is left.
+    """
+
+    def __init__(self, store):
+        if store.staging_dir is not None:
+            Path(store.staging_dir).mkdir(parents=True, exist_ok=True)
+        fd, self.path = tempfile.mkstemp(dir=store.staging_dir, prefix=".upload-")
+        self._store = store
+        self._file = os.fdopen(fd, "wb")
+        self._sha256 = hashlib.sha256()
+        self.size = 0
+        self.head = b""  # first 16 bytes, for sniff_image_type
+
+    def write(self, chunk: bytes):
+        if len(self.head) < 16:
+            self.head += chunk[:16 - len(self.head)]
+        self._sha256.update(chunk)
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def commit(self, content_type: Optional[str] = None) -> str:
+        """Store the staged bytes and return their hash."""
+        self._file.close()
+        blob_hash = self._sha256.hexdigest()
+        self._store.put_file(self.path, blob_hash, content_type)
+        return blob_hash
+
+    def discard(self):
+        self._file.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+def create_blob_store():
+    if BLOB_STORE == "s3":
+        if not BLOB_S3_BUCKET:
+            raise RuntimeError("BLOB_STORE=s3 needs BLOB_S3_BUCKET")
+        return S3BlobStore(BLOB_S3_BUCKET, BLOB_S3_PREFIX, BLOB_S3_ENDPOINT_URL)
+    if BLOB_STORE != "local":
+        raise RuntimeError(f"Unknown BLOB_STORE: {BLOB_STORE}")
+    return LocalBlobStore(BLOB_STORE_DIR)
+
+
+blob_store = create_blob_store()
+
+
+def store_image_data_url(url: str) -> str:
+    """
+    Move an image data URL into the blob store and return its /media URL.
+    Any other URL is returned unchanged.
+
+    Raises:
+        ValueError: the data URL isn't valid base64 or isn't a JPEG, PNG,
+            GIF or WebP image
+    """
+    decoded = decode_data_url(url)
+    if decoded is None:
+        return url
+    _, data = decoded
+    content_type = sniff_image_type(data[:16])
+    if content_type is None:
+        raise ValueError("Data URL is not a JPEG, PNG, GIF or WebP image")
+    return blob_url(blob_store.put(data, content_type))
@@ -0,0 +1,95 @@
+"""
+Comment Author Snapshots
+
+Comments store the author's name and photo as of posting (author_name,
+author_photo_url) so threads render without joining members. When a member
+changes their display name or photo (sync_firebase_user, update_member) the
+snapshots on their old comments go stale; refresh_comment_authors() brings
+them back in line with the members table.
+
+Stale rows are found with one join comparing each comment's snapshot with
+its author's current values, walked in comment-ID order. Each chunk of up
+to COMMENT_AUTHOR_BATCH_SIZE rows is written with one executemany UPDATE
+and committed on its own, so a member with thousands of comments never
+holds a long transaction or a large lock set. updated_at is left alone:
+a snapshot refresh isn't an edit.
+"""
+
+import time
+from typing import Iterable, Optional
+
+from sqlalchemy import bindparam, func, or_, update
+from sqlalchemy.orm import Session
+
+from database import Comment, Member
+
+COMMENT_AUTHOR_BATCH_SIZE = 500
+
+
+def comment_author_snapshot(member: Member) -> tuple:
+    """(author_name, author_photo_url) to store on a new comment by member."""
+    return member.display_name or member.username, member.profile_photo_url
+
+
+# SQL equivalent of comment_author_snapshot over the members table
+_current_name = func.coalesce(func.nullif(Member.display_name, ''), Member.username)
+
+_update_snapshot = update(Comment.__table__).where(
+    Comment.__table__.c.id == bindparam('comment_id')
+).values(
+    author_name=bindparam('name'),
+    author_photo_url=bindparam('photo_url'),
+    updated_at=Comment.__table__.c.updated_at  # keep the edit time; suppresses onupdate
+)
+
+
+def refresh_comment_authors(
+    db: Session,
+    member_ids: Optional[Iterable[int]] = None,
+    batch_size: int = COMMENT_AUTHOR_BATCH_SIZE
+) -> dict:
+    """
+    Rewrite stale author snapshots, committing after every batch.
+
+    Args:
+        member_ids: Only refresh these authors' comments (all authors if None)
+        batch_size: Maximum rows updated per transaction
+
+    Returns:
+        {"rows": n, "batches": n, "members": n, "seconds": s}
+    """
+    start = time.perf_counter()
+    query = db.query(
+        Comment.id, Comment.member_id, _current_name.label('name'), Member.profile_photo_url
+    ).join(
+        Member, Comment.member_id == Member.id
+    ).filter(or_(
+        Comment.author_name.is_distinct_from(_current_name),
+        Comment.author_photo_url.is_distinct_from(Member.profile_photo_url)
+    ))
+    if member_ids is not None:
+        member_ids = list(set(member_ids))
+        if not member_ids:
+            return {"rows": 0, "batches": 0, "members": 0, "seconds": 0.0}
+        query = query.filter(Comment.member_id.in_(member_ids))
+
+    stats = {"rows": 0, "batches": 0, "members": 0}
+    members = set()
+    last_id = 0
+    while True:
+        rows = query.filter(Comment.id > last_id).order_by(Comment.id).limit(batch_size).all()
+        if not rows:
+            break
+        db.execute(_update_snapshot, [
+            {"comment_id": row.id, "name": row.name, "photo_url": row.profile_photo_url}
+            for row in rows
+        ])
+        db.commit()
+        stats["rows"] += len(rows)
+        stats["batches"] += 1
+        members.update(row.member_id for row in rows)
+        last_id = rows[-1].id
+
+    stats["members"] = len(members)
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    return stats
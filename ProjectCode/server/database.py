@@ -1,10 +1,10 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Text, Index, Time, Date, Enum, ForeignKey, UniqueConstraint
+from sqlalchemy import create_engine, insert, Column, Integer, String, DateTime, Boolean, Text, Index, Time, Date, Enum, ForeignKey, UniqueConstraint
 from sqlalchemy.types import DECIMAL
 from sqlalchemy.dialects.mysql import LONGTEXT
 import enum
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
-from sqlalchemy.sql import func
+from sqlalchemy.orm import sessionmaker, relationship, deferred, column_property
+from sqlalchemy.sql import func, case, literal
 import os
 from dotenv import load_dotenv
 
@@ -100,9 +100,27 @@ class Results(Base):
     race = Column(String(255), nullable=False)  # Race name like "bronx 10 mile"
     race_time = Column(DateTime, nullable=False)  # Date and time of the race
     race_distance = Column(String(50), nullable=False)  # Race distance like "10 Mile"
+
+    # Derived columns, filled by race_times.apply_derived_columns
+    race_year = Column(Integer)  # Year of race_time (sargable year filter)
+    gender = Column(String(1))  # "M" or "W" from gender_age
+    age = Column(Integer)  # Age on race day from gender_age (e.g. 50 from "M50")
+
+    # Parsed numeric times (whole seconds)
+    finish_seconds = Column(Integer)  # From overall_time
+    gun_seconds = Column(Integer)  # From gun_time
+    age_graded_seconds = Column(Integer)  # From age_graded_time
+    pace_seconds = Column(Integer)  # Pace per mile, from pace
+
+    # Runner identity, resolved on import by runners.RunnerResolver
+    runner_id = Column(Integer, ForeignKey('runners.id', ondelete='SET NULL'), nullable=True)
+
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
 
+    # Relationships
+    runner = relationship("Runner", backref="results")
+
     # Indexes for better query performance
     __table_args__ = (
         Index('idx_race', 'race'),
@@ -110,9 +128,108 @@ class Results(Base):
         Index('idx_name', 'name'),
         Index('idx_overall_place', 'overall_place'),
         Index('idx_gender_age', 'gender_age'),
+        Index('idx_distance_finish_seconds', 'race_distance', 'finish_seconds'),
+        Index('idx_race_year', 'race_year'),
+        Index('idx_gender_year_distance', 'gender', 'race_year', 'race_distance', 'finish_seconds'),
+        Index('idx_gender_distance', 'gender', 'race_distance', 'finish_seconds'),
+        Index('idx_result_runner_id', 'runner_id', 'race_time'),
+        Index('idx_race_time_place', 'race', 'race_time', 'overall_place'),
+    )
+
+
+# Runner Model - one row per distinct person appearing in results
+class Runner(Base):
+    __tablename__ = "runners"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    name_key = Column(String(255), nullable=False)  # Normalized name, see runners.normalize_name
+    display_name = Column(String(255), nullable=False)  # Name as first seen in results
+    gender = Column(String(1))  # "M" or "W"
+    birth_year_min = Column(Integer)  # Birth year range implied by race_year - age
+    birth_year_max = Column(Integer)
+    nyrr_member_id = Column(String(50))  # Links to Member.nyrr_member_id
+    created_at = Column(DateTime, default=func.now())
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index('idx_runner_name_key', 'name_key', 'gender'),
+        Index('idx_runner_nyrr_member_id', 'nyrr_member_id'),
+    )
+
+
+# Materialized top-10 leaderboard per (gender, year, distance) for the records pages
+class ResultLeaderboard(Base):
+    __tablename__ = "result_leaderboard"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    gender = Column(String(1), nullable=False)  # "M" or "W" (from gender_age prefix)
+    year = Column(Integer, nullable=False)  # Race year, or 0 for all-time
+    race_distance = Column(String(50), nullable=False)
+    rank = Column(Integer, nullable=False)  # 1-10
+    result_id = Column(Integer, ForeignKey('results.id', ondelete='CASCADE'), nullable=False)
+
+    # Snapshot of the result row so reads never touch the results table
+    finish_seconds = Column(Integer)  # Ranking key
+    overall_time = Column(String(20))
+    pace = Column(String(20))
+    runner_name = Column(String(255), nullable=False)
+    race = Column(String(255), nullable=False)
+    race_time = Column(DateTime, nullable=False)
+    gender_age = Column(String(10))
+
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('gender', 'year', 'race_distance', 'rank', name='uq_leaderboard_slot'),
+        Index('idx_leaderboard_result_id', 'result_id'),
     )
 
 
+# Per-runner age-grade summary, recomputed by age_grades.rebuild_age_grades on import
+class AgeGradeSummary(Base):
+    __tablename__ = "age_grade_summary"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+    runner_id = Column(Integer, ForeignKey('runners.id', ondelete='CASCADE'), nullable=False)
+    race_distance = Column(String(50), nullable=False)  # Distance, or "ALL" across distances
+    runner_name = Column(String(255), nullable=False)
+    gender = Column(String(1))  # "M" or "W"
+    age_group = Column(String(10))  # e.g. "30-34", from age at the runner's latest result
+
+    # Age grading (NYRR age_graded_percent)
+    best_result_id = Column(Integer, ForeignKey('results.id', ondelete='SET NULL'))
+    best_age_graded_percent = Column(DECIMAL(5, 2))
+    avg_age_graded_percent = Column(DECIMAL(5, 2))
+    race_count = Column(Integer, nullable=False, default=0)
+    best_race = Column(String(255))
+    best_race_time = Column(DateTime)
+    best_overall_time = Column(String(20))
+
+    # Rankings within the club
+    club_rank = Column(Integer)  # By best_age_graded_percent, all genders/ages
+    age_group_rank = Column(Integer)  # Same, within gender + age_group
+    age_group_percentile = Column(DECIMAL(5, 2))  # % of the runner's gender/age group at or below them
+    distance_percentile = Column(DECIMAL(5, 2))  # % of same-gender runners at this distance whose best time is at or slower than this one (null for "ALL")
+
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('runner_id', 'race_distance', name='uq_age_grade_runner_distance'),
+        Index('idx_age_grade_club_rank', 'race_distance', 'club_rank'),
+        Index('idx_age_grade_group_rank', 'race_distance', 'gender', 'age_group', 'age_group_rank'),
+    )
+
+
+# Import generation counters, bumped by the importers (separate processes) so the
+# API process can tell its cached results-derived data is stale
+class ImportGeneration(Base):
+    __tablename__ = "import_generations"
+
+    name = Column(String(50), primary_key=True)  # e.g. "results"
+    generation = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
 # Member status enum
 class MemberStatus(enum.Enum):
     pending = "pending"       # New signups awaiting committee approval
@@ -346,6 +463,7 @@ class Comment(Base):
         Index('idx_comment_event_id', 'event_id'),
         Index('idx_comment_member_id', 'member_id'),
         Index('idx_comment_created_at', 'created_at'),
+        Index('idx_comment_event_visible_order', 'event_id', 'is_hidden', 'is_highlighted', 'created_at'),
     )
 
 
@@ -395,6 +513,18 @@ class Reaction(Base):
     )
 
 
+# Denormalized engagement counts per event, kept in step by the engagement endpoints
+class EventEngagementCounters(Base):
+    __tablename__ = "event_engagement_counters"
+
+    event_id = Column(Integer, ForeignKey('events.id', ondelete='CASCADE'), primary_key=True)
+    like_count = Column(Integer, nullable=False, default=0)
+    comment_count = Column(Integer, nullable=False, default=0)  # Visible (non-hidden) comments
+    reaction_counts = Column(Text)  # JSON object: emoji -> count
+
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
 # EventCommentSettings Model for per-event engagement settings
 class EventCommentSettings(Base):
     __tablename__ = "event_comment_settings"
@@ -441,12 +571,26 @@ class TempClubCredit(Base):
     )
 
 
+# Image columns that may hold a whole image inline (base64 data URL) are
+# deferred in the IMAGE_PAYLOAD group: queries only load them when asked
+# (see image_payloads.py). image_ref is the light stand-in lists select:
+# the stored URL, or just INLINE_IMAGE_REF when the image is inline.
+IMAGE_PAYLOAD = 'image_payload'
+INLINE_IMAGE_REF = 'data:'
+
+
+def image_ref_property(image_url):
+    column = image_url.columns[0]
+    return column_property(case((column.like(INLINE_IMAGE_REF + '%'), literal(INLINE_IMAGE_REF)), else_=column))
+
+
 # BannerImage Model for homepage carousel banners
 class BannerImage(Base):
     __tablename__ = "banner_images"
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    image_url = Column(String(500), nullable=False)
+    image_url = deferred(Column(String(500), nullable=False), group=IMAGE_PAYLOAD)
+    image_ref = image_ref_property(image_url)
     alt_text = Column(String(255))
     link_path = Column(String(255))  # Internal path like '/about'
     label_en = Column(String(100))  # English label
@@ -474,7 +618,8 @@ class HomepageSection(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     title_en = Column(String(100), nullable=False)
     title_cn = Column(String(100))
-    image_url = Column(Text)  # Use Text to support base64 data URLs
+    image_url = deferred(Column(Text), group=IMAGE_PAYLOAD)  # Use Text to support base64 data URLs
+    image_ref = image_ref_property(image_url)
     link_path = Column(String(255), nullable=False)
     display_order = Column(Integer, default=0)
     is_active = Column(Boolean, default=True)
@@ -543,7 +688,11 @@ class EventGalleryImage(Base):
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     event_id = Column(Integer, ForeignKey('events.id', ondelete='CASCADE'), nullable=False)
-    image_url = Column(Text().with_variant(LONGTEXT(), 'mysql'), nullable=False)  # Base64 data URL - LONGTEXT for MySQL (up to 4GB)
+    image_url = deferred(Column(Text().with_variant(LONGTEXT(), 'mysql'), nullable=False), group=IMAGE_PAYLOAD)  # /media/{hash} blob URL or external URL (LONGTEXT from when rows held base64 data URLs)
+    image_ref = image_ref_property(image_url)
+    thumbnail_url = Column(String(100))  # /media URLs of the resized variants (image_variants.py), NULL until generated
+    medium_url = Column(String(100))
+    full_url = Column(String(100))
     caption = Column(String(500))
     caption_cn = Column(String(500))
     display_order = Column(Integer, default=0)
@@ -631,6 +780,10 @@ def get_db():
     finally:
         db.close()
 
+# INSERT that skips rows violating a unique constraint (MySQL IGNORE, SQLite OR IGNORE)
+def insert_ignore(model):
+    return insert(model).prefix_with("IGNORE", dialect="mysql").prefix_with("OR IGNORE", dialect="sqlite")
+
 # Create all tables
 def create_tables():
     Base.metadata.create_all(bind=engine)
\ No newline at end of file
@@ -0,0 +1,329 @@
+"""
+Event Engagement
+
+Like counts, per-emoji reaction counts and visible-comment counts live in
+the event_engagement_counters table, one row per event. Every endpoint that
+adds or removes a like, reaction or visible comment calls
+adjust_engagement_counters() before committing, so the counters change in
+the same transaction as the rows they count; reads are a primary-key lookup
+instead of COUNT(*) queries. The scheduler's reconciliation job
+(reconcile_engagement_counters) repairs any drift against the real rows.
+
+load_engagements() builds the engagement summary shown on event cards for
+any number of events with a fixed set of queries, each filtering on
+event_id IN (...), so a 30-card list page costs the same round trips as
+one card. The viewer-independent counts go through engagement_cache, so
+for cached events only the viewer's own likes/reactions are queried.
+"""
+
+import json
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from database import Event, EventEngagementCounters, Like, Reaction, Comment, Member, insert_ignore
+from models import EventEngagementResponse, LikeCountResponse, ReactionCountResponse
+from event_settings import load_event_settings
+from engagement_cache import engagement_cache
+
+
+def _empty_counts() -> dict:
+    return {"likes": 0, "comments": 0, "reactions": {}}
+
+
+def counter_counts(counters: EventEngagementCounters) -> dict:
+    return {
+        "likes": counters.like_count,
+        "comments": counters.comment_count,
+        "reactions": json.loads(counters.reaction_counts) if counters.reaction_counts else {}
+    }
+
+
+def _set_counts(counters: EventEngagementCounters, counts: dict):
+    counters.like_count = counts["likes"]
+    counters.comment_count = counts["comments"]
+    counters.reaction_counts = json.dumps(counts["reactions"], sort_keys=True)
+
+
+def recount_engagement(db: Session, event_ids: Optional[Iterable[int]] = None) -> Dict[int, dict]:
+    """
+    Count likes, reactions per emoji and visible comments from the
+    engagement tables with three grouped queries.
+
+    Returns:
+        {event_id: {"likes": n, "comments": n, "reactions": {emoji: n}}}
+        for every ID in event_ids (all events if None)
+    """
+    if event_ids is None:
+        event_ids = [row.id for row in db.query(Event.id).all()]
+    event_ids = list(event_ids)
+    counts = {event_id: _empty_counts() for event_id in event_ids}
+    if not event_ids:
+        return counts
+
+    for event_id, count in db.query(Like.event_id, func.count(Like.id)).filter(
+        Like.event_id.in_(event_ids)
+    ).group_by(Like.event_id).all():
+        counts[event_id]["likes"] = count
+
+    for event_id, emoji, count in db.query(Reaction.event_id, Reaction.emoji, func.count(Reaction.id)).filter(
+        Reaction.event_id.in_(event_ids)
+    ).group_by(Reaction.event_id, Reaction.emoji).all():
+        counts[event_id]["reactions"][emoji] = count
+
+    for event_id, count in db.query(Comment.event_id, func.count(Comment.id)).filter(
+        Comment.event_id.in_(event_ids),
+        Comment.is_hidden == False
+    ).group_by(Comment.event_id).all():
+        counts[event_id]["comments"] = count
+
+    return counts
+
+
+def load_engagement_counts(db: Session, event_ids: Iterable[int]) -> Dict[int, dict]:
+    """
+    Engagement counts for event_ids from the counters table (one query).
+    Events without a counters row yet are counted from the engagement
+    tables instead, without writing.
+    """
+    event_ids = list(event_ids)
+    counts = {
+        counters.event_id: counter_counts(counters)
+        for counters in db.query(EventEngagementCounters).filter(
+            EventEngagementCounters.event_id.in_(event_ids)
+        ).all()
+    }
+    missing = [event_id for event_id in event_ids if event_id not in counts]
+    if missing:
+        counts.update(recount_engagement(db, missing))
+    return counts
+
+
+def _copy_counts(counts: dict) -> dict:
+    return {**counts, "reactions": dict(counts["reactions"])}
+
+
+def load_cached_engagement_counts(db: Session, event_ids: Iterable[int]) -> Dict[int, dict]:
+    """
+    Engagement counts of the existing events among event_ids, through
+    engagement_cache; misses cost an events query plus
+    load_engagement_counts(). Unknown IDs are left out. The returned dicts
+    are copies the caller may modify.
+    """
+    event_ids = list(dict.fromkeys(event_ids))
+    counts, missing, generation = engagement_cache.get_many(event_ids)
+    if missing:
+        found_ids = [row.id for row in db.query(Event.id).filter(Event.id.in_(missing)).all()]
+        loaded = load_engagement_counts(db, found_ids) if found_ids else {}
+        engagement_cache.set_many(loaded, generation)
+        counts.update(loaded)
+    return {event_id: _copy_counts(counts[event_id]) for event_id in event_ids if event_id in counts}
+
+
+def _lock_counters(db: Session, event_id: int) -> Optional[EventEngagementCounters]:
+    return db.query(EventEngagementCounters).filter(
+        EventEngagementCounters.event_id == event_id
+    ).with_for_update().populate_existing().first()
+
+
+def adjust_engagement_counters(
+    db: Session,
+    event_id: int,
+    likes: int = 0,
+    comments: int = 0,
+    reactions: Optional[Dict[str, int]] = None
+) -> EventEngagementCounters:
+    """
+    Apply count deltas for an engagement change in the caller's transaction.
+
+    Call after adding/deleting the Like/Reaction/Comment row and before
+    committing. The counters row is locked (SELECT ... FOR UPDATE) so
+    concurrent toggles on one event apply their deltas one at a time. If
+    the event has no counters row yet it is created from a full recount,
+    which already includes the pending change; if a concurrent transaction
+    creates it first, the deltas are applied to that row instead.
+    """
+    counters = _lock_counters(db, event_id)
+
+    if counters is None:
+        db.flush()
+        counts = recount_engagement(db, [event_id])[event_id]
+        created = db.execute(insert_ignore(EventEngagementCounters).values(
+            event_id=event_id,
+            like_count=counts["likes"],
+            comment_count=counts["comments"],
+            reaction_counts=json.dumps(counts["reactions"], sort_keys=True)
+        )).rowcount
+        counters = _lock_counters(db, event_id)
+        if created:
+            return counters
+
+    counts = counter_counts(counters)
+    counts["likes"] = max(0, counts["likes"] + likes)
+    counts["comments"] = max(0, counts["comments"] + comments)
+    for emoji, delta in (reactions or {}).items():
+        count = counts["reactions"].get(emoji, 0) + delta
+        if count > 0:
+            counts["reactions"][emoji] = count
+        else:
+            counts["reactions"].pop(emoji, None)
+    _set_counts(counters, counts)
+    return counters
+
+
+def refresh_engagement_counters(db: Session, event_ids: Iterable[int]):
+    """
+    Set the counters rows of event_ids from a recount in the caller's
+    transaction, creating missing rows. Used after bulk changes (e.g. a
+    write-behind flush) where per-row deltas aren't tracked. IDs of events
+    that no longer exist are skipped.
+    """
+    event_ids = sorted(set(event_ids))
+    if not event_ids:
+        return
+    existing = [row.id for row in db.query(Event.id).filter(Event.id.in_(event_ids)).all()]
+    rows = {
+        counters.event_id: counters
+        for counters in db.query(EventEngagementCounters).filter(
+            EventEngagementCounters.event_id.in_(existing)
+        ).with_for_update().all()
+    }
+    db.flush()
+    for event_id, counts in recount_engagement(db, existing).items():
+        counters = rows.get(event_id)
+        if counters is None:
+            counters = EventEngagementCounters(event_id=event_id)
+            db.add(counters)
+        _set_counts(counters, counts)
+
+
+def reconcile_engagement_counters(db: Session) -> dict:
+    """
+    Compare every event's counters row with a recount of the engagement
+    tables and repair rows that drifted or are missing. Each repaired row
+    is recounted again under its row lock so a toggle committed in between
+    isn't overwritten.
+
+    Returns:
+        {"checked": n, "repaired": n, "created": n}
+    """
+    expected = recount_engagement(db)
+    stored = {
+        counters.event_id: counter_counts(counters)
+        for counters in db.query(EventEngagementCounters).all()
+    }
+    db.rollback()  # end the read snapshot before locking rows
+
+    stats = {"checked": len(expected), "repaired": 0, "created": 0}
+    for event_id, counts in expected.items():
+        if stored.get(event_id) == counts:
+            continue
+
+        counters = db.query(EventEngagementCounters).filter(
+            EventEngagementCounters.event_id == event_id
+        ).with_for_update().first()
+        if counters is None:
+            counters = EventEngagementCounters(event_id=event_id)
+            db.add(counters)
+            stats["created"] += 1
+        else:
+            stats["repaired"] += 1
+        _set_counts(counters, recount_engagement(db, [event_id])[event_id])
+        try:
+            db.commit()
+        except IntegrityError:
+            # A toggle created the row first; it's counted from scratch already
+            db.rollback()
+        engagement_cache.invalidate(event_id)
+
+    return stats
+
+
+def _viewer_filter(model, member: Optional[Member], anonymous_id: Optional[str]):
+    """Filter matching the viewer's own rows, or None for an unidentified viewer."""
+    if member:
+        return model.member_id == member.id
+    if anonymous_id:
+        return model.anonymous_id == anonymous_id
+    return None
+
+
+def load_user_reactions(
+    db: Session,
+    event_ids: Iterable[int],
+    member: Optional[Member] = None,
+    anonymous_id: Optional[str] = None
+) -> Dict[int, set]:
+    """The viewer's reaction emojis per event (one query, none for unidentified viewers)."""
+    reaction_filter = _viewer_filter(Reaction, member, anonymous_id)
+    user_reactions = {}
+    if reaction_filter is None:
+        return user_reactions
+    for row in db.query(Reaction.event_id, Reaction.emoji).filter(
+        Reaction.event_id.in_(list(event_ids)),
+        reaction_filter
+    ).all():
+        user_reactions.setdefault(row.event_id, set()).add(row.emoji)
+    return user_reactions
+
+
+def load_user_likes(
+    db: Session,
+    event_ids: Iterable[int],
+    member: Optional[Member] = None,
+    anonymous_id: Optional[str] = None
+) -> set:
+    """IDs of the events the viewer has liked (one query, none for unidentified viewers)."""
+    like_filter = _viewer_filter(Like, member, anonymous_id)
+    if like_filter is None:
+        return set()
+    return {
+        row.event_id
+        for row in db.query(Like.event_id).filter(Like.event_id.in_(list(event_ids)), like_filter).all()
+    }
+
+
+def reaction_responses(counts: dict, user_reactions: set) -> list:
+    """ReactionCountResponse list (sorted by emoji) from a counts dict."""
+    return [
+        ReactionCountResponse(emoji=emoji, count=count, user_reacted=emoji in user_reactions)
+        for emoji, count in sorted(counts["reactions"].items())
+    ]
+
+
+def load_engagements(
+    db: Session,
+    event_ids: Iterable[int],
+    member: Optional[Member] = None,
+    anonymous_id: Optional[str] = None
+) -> Dict[int, EventEngagementResponse]:
+    """
+    Engagement for every existing event in event_ids, keyed by event ID.
+    Unknown IDs are left out. Counts and settings are the shared, cached
+    aggregate; the viewer's likes and reactions are the per-request overlay.
+    """
+    counts = load_cached_engagement_counts(db, event_ids)
+    if not counts:
+        return {}
+    found_ids = list(counts)
+
+    settings = load_event_settings(db, found_ids)
+    liked_ids = load_user_likes(db, found_ids, member, anonymous_id)
+    user_reactions = load_user_reactions(db, found_ids, member, anonymous_id)
+
+    engagements = {}
+    for event_id in found_ids:
+        event_settings = settings[event_id]
+        event_counts = counts[event_id]
+        engagements[event_id] = EventEngagementResponse(
+            event_id=event_id,
+            likes=LikeCountResponse(count=event_counts["likes"], user_liked=event_id in liked_ids),
+            reactions=reaction_responses(event_counts, user_reactions.get(event_id, set())),
+            comment_count=event_counts["comments"],
+            comments_enabled=event_settings.comments_enabled,
+            likes_enabled=event_settings.likes_enabled,
+            reactions_enabled=event_settings.reactions_enabled
+        )
+    return engagements
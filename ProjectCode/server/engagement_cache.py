@@ -0,0 +1,104 @@
+"""
+Engagement Aggregate Cache
+
+The part of an event's engagement that is the same for every viewer (like
+count, reaction histogram, visible-comment count) is cached per event ID in
+an LRU of up to ENGAGEMENT_CACHE_MAX_ENTRIES events, each entry living at
+most ENGAGEMENT_CACHE_TTL seconds. Only the viewer's own overlay (did I
+like / which emojis did I use) is read per request, and not at all for
+viewers without an identity. Settings come from the event_settings cache.
+
+Endpoints that change engagement invalidate the event after committing.
+A miss that read the database before such an invalidation doesn't
+repopulate the cache with its now-old counts: set_many() is skipped when
+any invalidation happened since the matching get_many(). Changes committed
+by other processes show up once the TTL expires.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Tuple
+
+ENGAGEMENT_CACHE_TTL = int(os.getenv("ENGAGEMENT_CACHE_TTL", "30"))  # seconds
+ENGAGEMENT_CACHE_MAX_ENTRIES = 2000
+
+
+class EngagementAggregateCache:
+    """Thread-safe LRU + TTL cache of per-event engagement counts."""
+
+    def __init__(self, ttl: int = ENGAGEMENT_CACHE_TTL, max_entries: int = ENGAGEMENT_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # event_id -> (expires_at, counts), least recently used first
+        self._lock = threading.Lock()
+        self._generation = 0  # bumped by every invalidation
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get_many(self, event_ids: Iterable[int]) -> Tuple[Dict[int, dict], list, int]:
+        """
+        Cached counts for event_ids.
+
+        Returns:
+            (found, missing, generation) - pass generation back to set_many
+            with the counts loaded for `missing`
+        """
+        now = time.monotonic()
+        found, missing = {}, []
+        with self._lock:
+            for event_id in event_ids:
+                entry = self._entries.get(event_id)
+                if entry is not None and entry[0] > now:
+                    self._entries.move_to_end(event_id)
+                    found[event_id] = entry[1]
+                    self.hits += 1
+                else:
+                    if entry is not None:
+                        del self._entries[event_id]
+                    missing.append(event_id)
+                    self.misses += 1
+            return found, missing, self._generation
+
+    def set_many(self, counts: Dict[int, dict], generation: int):
+        """Cache counts loaded after get_many returned `generation` (skipped if invalidated since)."""
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            if generation != self._generation:
+                return
+            for event_id, event_counts in counts.items():
+                self._entries[event_id] = (expires_at, event_counts)
+                self._entries.move_to_end(event_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *event_ids: int):
+        """Drop events' cached counts; call after committing a change."""
+        with self._lock:
+            self._generation += 1
+            for event_id in event_ids:
+                if self._entries.pop(event_id, None) is not None:
+                    self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "invalidations": self.invalidations
+            }
+
+
+engagement_cache = EngagementAggregateCache()
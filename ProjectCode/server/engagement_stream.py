@@ -0,0 +1,91 @@
+"""
+Live Engagement Updates
+
+An in-process publish/subscribe hub behind the
+/api/events/{event_id}/engagement/stream server-sent events endpoint.
+Viewers with an event open subscribe once instead of polling
+/api/events/{event_id}/engagement; the like, reaction and comment endpoints
+publish the counts they just committed, so a watching viewer costs no
+database queries at all.
+
+Messages are partial engagement updates holding only what changed, with
+absolute values so a dropped or repeated message can't make a client's
+numbers drift:
+    {"event_id": 1, "likes": 12}
+    {"event_id": 1, "reactions": {"🔥": 4}}
+    {"event_id": 1, "comment_count": 7}
+They carry no per-viewer state; a viewer's own liked/reacted flags come
+from the responses to their own toggles.
+
+Publishers are the sync endpoints running in the threadpool, subscribers
+are async generators on the event loop; publish() hands each message to
+the subscriber's loop with call_soon_threadsafe. Each subscriber queue is
+bounded: when a slow client falls behind, its oldest updates are dropped
+(the newer ones supersede them). The hub is per process, so viewers only
+see updates made through the same worker.
+"""
+
+import asyncio
+import json
+import threading
+from typing import Optional
+
+STREAM_QUEUE_SIZE = 100
+STREAM_KEEPALIVE_SECONDS = 15
+
+
+class EngagementStream:
+    """Subscribers per event ID and the publish side."""
+
+    def __init__(self, queue_size: int = STREAM_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers = {}  # event_id -> {queue: loop}
+
+    def subscribe(self, event_id: int) -> asyncio.Queue:
+        """Register a queue for event_id on the running event loop."""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(event_id, {})[queue] = asyncio.get_running_loop()
+        return queue
+
+    def unsubscribe(self, event_id: int, queue: asyncio.Queue):
+        with self._lock:
+            subscribers = self._subscribers.get(event_id)
+            if subscribers is not None:
+                subscribers.pop(queue, None)
+                if not subscribers:
+                    del self._subscribers[event_id]
+
+    def subscriber_count(self, event_id: Optional[int] = None) -> int:
+        with self._lock:
+            if event_id is not None:
+                return len(self._subscribers.get(event_id, {}))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def publish(self, event_id: int, **changes):
+        """Send a partial update to every subscriber of event_id (safe from any thread)."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(event_id, {}).items())
+        if not subscribers:
+            return
+        message = {"event_id": event_id, **changes}
+        for queue, loop in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, message)
+            except RuntimeError:
+                pass  # the subscriber's loop has closed; its generator unsubscribes
+
+
+def _offer(queue: asyncio.Queue, message: dict):
+    """put_nowait, dropping the oldest update if the queue is full."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
+
+
+def format_sse(message: dict, event: str = "engagement") -> str:
+    return f"event: {event}\ndata: {json.dumps(message, ensure_ascii=False)}\n\n"
+
+
+engagement_stream = EngagementStream()
@@ -0,0 +1,84 @@
+"""
+Event Engagement Settings (read path)
+
+Read endpoints look up per-event engagement settings (comments / likes /
+reactions enabled) through load_event_settings(), which never writes:
+events without an event_comment_settings row get the defaults. Results are
+kept in a process-local LRU of up to EVENT_SETTINGS_CACHE_MAX_ENTRIES events
+for EVENT_SETTINGS_CACHE_TTL seconds; update_event_settings calls
+invalidate_event_settings() after committing, so this process sees admin
+changes immediately and any other process within the TTL. As in
+engagement_cache, a load that read the database before an invalidation
+doesn't write its now-old settings back.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable
+
+from sqlalchemy.orm import Session
+
+from database import EventCommentSettings
+from models import EventCommentSettingsResponse
+
+EVENT_SETTINGS_CACHE_TTL = int(os.getenv("EVENT_SETTINGS_CACHE_TTL", "300"))  # seconds
+EVENT_SETTINGS_CACHE_MAX_ENTRIES = 2000
+
+_cache = OrderedDict()  # event_id -> (expires_at, EventCommentSettingsResponse), least recently used first
+_lock = threading.Lock()
+_generation = 0  # bumped by every invalidation
+
+
+def default_event_settings(event_id: int) -> EventCommentSettingsResponse:
+    """Settings for an event that has no settings row (everything enabled)."""
+    return EventCommentSettingsResponse(id=None, event_id=event_id)
+
+
+def load_event_settings(db: Session, event_ids: Iterable[int]) -> Dict[int, EventCommentSettingsResponse]:
+    """Settings for each event ID: cached, else one IN (...) query for the misses."""
+    event_ids = list(event_ids)
+    now = time.monotonic()
+    settings = {}
+    with _lock:
+        for event_id in event_ids:
+            entry = _cache.get(event_id)
+            if entry is not None and entry[0] > now:
+                _cache.move_to_end(event_id)
+                settings[event_id] = entry[1]
+            elif entry is not None:
+                del _cache[event_id]
+        generation = _generation
+
+    missing = [event_id for event_id in event_ids if event_id not in settings]
+    if missing:
+        loaded = {
+            row.event_id: EventCommentSettingsResponse.model_validate(row)
+            for row in db.query(EventCommentSettings).filter(EventCommentSettings.event_id.in_(missing)).all()
+        }
+        expires_at = time.monotonic() + EVENT_SETTINGS_CACHE_TTL
+        for event_id in missing:
+            settings[event_id] = loaded.get(event_id) or default_event_settings(event_id)
+        with _lock:
+            if generation == _generation:
+                for event_id in missing:
+                    _cache[event_id] = (expires_at, settings[event_id])
+                    _cache.move_to_end(event_id)
+                while len(_cache) > EVENT_SETTINGS_CACHE_MAX_ENTRIES:
+                    _cache.popitem(last=False)
+
+    return settings
+
+
+def read_event_settings(db: Session, event_id: int) -> EventCommentSettingsResponse:
+    """Settings for one event, without creating a settings row."""
+    return load_event_settings(db, [event_id])[event_id]
+
+
+def invalidate_event_settings(event_id: int):
+    """Drop an event's cached settings; call after committing a change."""
+    global _generation
+    with _lock:
+        _generation += 1
+        _cache.pop(event_id, None)
@@ -14,6 +14,11 @@ import pandas as pd
 from datetime import datetime
 from sqlalchemy.orm import sessionmaker
 from database import engine, Results
+from leaderboard import apply_results
+from age_grades import rebuild_age_grades
+from race_times import apply_derived_columns
+from runners import RunnerResolver
+from member_stats_cache import bump_import_generation
 import io
 import time
 
@@ -256,8 +261,11 @@ def import_race_data(event_code, config, df):
     """Import race data to database"""
     session = Session()
     imported_count = 0
+    written_results = []
 
     try:
+        runner_resolver = RunnerResolver(session)
+
         for index, row in df.iterrows():
             if pd.isna(row.iloc[0]) or not str(row.iloc[0]).strip():
                 continue
@@ -288,6 +296,9 @@ def import_race_data(event_code, config, df):
                     existing_result.age_graded_percent = clean_percentage(str(row.iloc[14])) if pd.notna(row.iloc[14]) else None
                     existing_result.race_time = config["date"]
                     existing_result.race_distance = config["distance"]
+                    apply_derived_columns(existing_result)
+                    runner_resolver.resolve(existing_result)
+                    written_results.append(existing_result)
                 else:
                     # Create new record
                     result = Results(
@@ -308,7 +319,10 @@ def import_race_data(event_code, config, df):
                         race_time=config["date"],
                         race_distance=config["distance"]
                     )
+                    apply_derived_columns(result)
+                    runner_resolver.resolve(result)
                     session.add(result)
+                    written_results.append(result)
 
                 imported_count += 1
 
@@ -316,6 +330,12 @@ def import_race_data(event_code, config, df):
                 print(f"Error processing row {index}: {e}")
                 continue
 
+        # Update the records leaderboard in the same transaction
+        session.flush()
+        apply_results(session, written_results)
+
+        if written_results:
+            bump_import_generation(session)  # API caches of member stats are now stale
         session.commit()
         print(f"✅ Imported {imported_count} records for {config['name']}")
         return imported_count
@@ -368,6 +388,22 @@ def fetch_all_available_data(start_year=2015, end_year=2025):
 
     print(f"\n🎉 Total records imported: {total_imported}")
 
+    if total_imported:
+        refresh_age_grades()
+
+def refresh_age_grades():
+    """Recompute the age-grade summary table after a batch of imports"""
+    session = Session()
+    try:
+        summary_rows = rebuild_age_grades(session)
+        session.commit()
+        print(f"✅ Rebuilt {summary_rows} age-grade summary rows")
+    except Exception as e:
+        session.rollback()
+        print(f"❌ Error rebuilding age-grade summaries: {e}")
+    finally:
+        session.close()
+
 if __name__ == "__main__":
     import sys
 
@@ -0,0 +1,97 @@
+"""
+Image Payload Loading
+
+Gallery images, homepage sections and banners keep their picture in
+image_url. Usually that's a short URL (a /media/{hash} blob or an external
+link), but rows from before the blob store hold the whole image inline as
+a base64 data URL, megabytes each. Loading that column for every row of a
+list, count or reorder used to drag those megabytes through the database
+driver, SQLAlchemy, Pydantic and JSON.
+
+The loading policy:
+- image_url is deferred (database.IMAGE_PAYLOAD group) on all three
+  models, so counts, ordering lookups, likes, deletes and reorders never
+  load it.
+- List endpoints answer from image_ref, a SQL expression that returns the
+  stored URL, or only the marker INLINE_IMAGE_REF for an inline image. Such
+  rows get the URL of their own image endpoint instead
+  (/api/gallery/{id}/image, ...), which loads that one row's image.
+- include_payload=true on a list endpoint loads image_url as before, data
+  URLs included.
+- Single-row endpoints load it with payload_options(True), since they
+  return it anyway.
+
+benchmarks/check_list_payloads.py checks that no list endpoint selects an
+image_url column unless asked.
+"""
+
+from typing import Optional, Type
+
+from fastapi import HTTPException, Response, status
+from fastapi.responses import RedirectResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import undefer_group
+
+from database import IMAGE_PAYLOAD, INLINE_IMAGE_REF, BannerImage, EventGalleryImage, HomepageSection
+from blob_store import decode_data_url, sniff_image_type
+
+# Endpoint serving each model's image by row ID
+IMAGE_PATHS = {
+    EventGalleryImage: "/api/gallery/{}/image",
+    HomepageSection: "/api/homepage-sections/{}/image",
+    BannerImage: "/api/banners/{}/image",
+}
+
+# Rows can be edited, so the image endpoint is only cached briefly
+IMAGE_ENDPOINT_CACHE_CONTROL = "public, max-age=300"
+
+
+def payload_options(include_payload: bool) -> list:
+    """Query options loading the deferred image columns when include_payload is set."""
+    return [undefer_group(IMAGE_PAYLOAD)] if include_payload else []
+
+
+def image_path(row) -> str:
+    return IMAGE_PATHS[type(row)].format(row.id)
+
+
+def listed_image_url(row, include_payload: bool = False) -> Optional[str]:
+    """image_url to put in a list response for row."""
+    if include_payload:
+        return row.image_url
+    if row.image_ref == INLINE_IMAGE_REF:
+        return image_path(row)
+    return row.image_ref
+
+
+def is_own_image_path(row, url: Optional[str]) -> bool:
+    """
+    True if url is row's image endpoint, as listed for an inline image.
+    Saving it back (an edit form round-tripping the listed value) must
+    leave the stored image alone rather than point the row at itself.
+    """
+    return url is not None and url == image_path(row)
+
+
+def listed_response(schema: Type[BaseModel], row, include_payload: bool = False) -> BaseModel:
+    """schema built from row's attributes without touching the deferred image_url."""
+    fields = {name: getattr(row, name) for name in schema.model_fields if name != "image_url"}
+    return schema(image_url=listed_image_url(row, include_payload), **fields)
+
+
+def image_payload_response(image_url: Optional[str]) -> Response:
+    """Serve a row's stored image: inline data URLs decoded, anything else redirected to."""
+    if not image_url:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+    headers = {"Cache-Control": IMAGE_ENDPOINT_CACHE_CONTROL}
+    try:
+        decoded = decode_data_url(image_url)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+    if decoded is None:
+        return RedirectResponse(image_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT, headers=headers)
+    # Only serve what sniffs as a raster image, never e.g. SVG/HTML from the API origin
+    media_type = sniff_image_type(decoded[1][:16])
+    if media_type is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+    return Response(content=decoded[1], media_type=media_type, headers=headers)
@@ -0,0 +1,206 @@
+"""
+Gallery Image Variants
+
+Every gallery image in the blob store gets three re-encoded variants:
+
+    thumbnail   longest edge 400px   gallery cards / previews
+    medium      longest edge 1200px  gallery grid
+    full        longest edge 2048px  lightbox
+
+encoded as WebP (or JPEG with IMAGE_VARIANT_FORMAT=jpeg), never upscaled,
+with EXIF orientation applied. Variants are ordinary blobs, stored by their
+own content hash, and their /media URLs are written to the row's
+thumbnail_url / medium_url / full_url columns. Until then those are NULL
+and clients fall back to image_url, the untouched original.
+
+Decoding and resizing a multi-megapixel photo takes far longer than a
+request should, and holds the GIL, so it runs in a process pool
+(IMAGE_VARIANT_WORKERS processes, 0 to disable). The app enables the
+pipeline at startup if Pillow is installed; the pool itself is only
+spawned by the first upload. upload_gallery_image hands the new image to
+variant_pipeline.submit() after committing and returns at once; the pool's
+callback writes the variant URLs when they're ready. Rows uploaded while
+the pipeline was off, or whose processing failed, are picked up by
+backfill_image_variants.py.
+"""
+
+import importlib.util
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from blob_store import blob_store, blob_hash_from_url, blob_url
+from database import SessionLocal, EventGalleryImage
+
+logger = logging.getLogger(__name__)
+
+IMAGE_VARIANT_SIZES = {"full": 2048, "medium": 1200, "thumbnail": 400}  # longest edge (px), largest first
+IMAGE_VARIANT_FORMAT = os.getenv("IMAGE_VARIANT_FORMAT", "webp").lower()  # webp | jpeg
+IMAGE_VARIANT_QUALITY = int(os.getenv("IMAGE_VARIANT_QUALITY", "80"))
+IMAGE_VARIANT_WORKERS = int(os.getenv("IMAGE_VARIANT_WORKERS", "2"))
+
+VARIANT_COLUMNS = {"thumbnail": "thumbnail_url", "medium": "medium_url", "full": "full_url"}
+
+
+def pillow_available() -> bool:
+    """Whether Pillow can be imported (it's only imported inside the workers)."""
+    return importlib.util.find_spec("PIL") is not None
+
+
+def _encode(image, image_format: str, quality: int) -> bytes:
+    out = io.BytesIO()
+    if image_format == "jpeg":
+        image.convert("RGB").save(out, "JPEG", quality=quality, optimize=True, progressive=True)
+    else:
+        has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        image.convert("RGBA" if has_alpha else "RGB").save(out, "WEBP", quality=quality, method=4)
+    return out.getvalue()
+
+
+def generate_variants(
+    source_hash: str,
+    image_format: str = IMAGE_VARIANT_FORMAT,
+    quality: int = IMAGE_VARIANT_QUALITY
+) -> Dict[str, str]:
+    """
+    Render and store the variants of one blob. Runs in a worker process.
+
+    Returns:
+        {"thumbnail": url, "medium": url, "full": url}
+    """
+    from PIL import Image, ImageOps
+
+    content_type = "image/jpeg" if image_format == "jpeg" else "image/webp"
+    with blob_store.open(source_hash) as blob:
+        data = blob.read()
+
+    urls = {}
+    with Image.open(io.BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original)  # first frame of animated GIFs
+        # Each variant is resized from the previous (larger) one
+        for name, max_edge in IMAGE_VARIANT_SIZES.items():
+            image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+            urls[name] = blob_url(blob_store.put(_encode(image, image_format, quality), content_type))
+    return urls
+
+
+def apply_variants(db: Session, image_ids: Iterable[int], urls: Dict[str, str]) -> int:
+    """Set the variant URLs of gallery rows in the caller's transaction; returns rows updated."""
+    return db.execute(
+        update(EventGalleryImage).where(EventGalleryImage.id.in_(list(image_ids))).values(
+            updated_at=EventGalleryImage.updated_at,  # not an edit; suppresses onupdate
+            **{VARIANT_COLUMNS[name]: url for name, url in urls.items()}
+        ).execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def create_variant_pool(workers: int) -> ProcessPoolExecutor:
+    # spawn, not fork: the server process has threads (scheduler, threadpool)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+class VariantPipeline:
+    """Process pool plus the bookkeeping to write results back to the rows."""
+
+    def __init__(self, workers: int = IMAGE_VARIANT_WORKERS):
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None  # spawned by the first submit
+        self._enabled = False
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, List[int]] = {}  # source hash -> gallery image IDs waiting for it
+
+    def start(self):
+        """Accept submissions from now on (no-op without workers or Pillow)."""
+        if self.workers <= 0 or self._enabled:
+            return
+        if not pillow_available():
+            logger.warning("Pillow is not installed; image variant pipeline disabled")
+            return
+        self._enabled = True
+        logger.info(f"Image variant pipeline enabled ({self.workers} workers, started on first upload)")
+
+    def stop(self):
+        with self._lock:
+            self._enabled = False
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, image_id: int, image_url: str) -> bool:
+        """
+        Queue variant generation for a committed gallery row. Returns False
+        if it wasn't queued (pipeline off, or not a blob store image).
+        """
+        source_hash = blob_hash_from_url(image_url)
+        if not self._enabled or source_hash is None:
+            return False
+        with self._lock:
+            waiting = self._inflight.get(source_hash)
+            if waiting is not None:
+                waiting.append(image_id)  # same bytes already being processed
+                return True
+            self._inflight[source_hash] = [image_id]
+        try:
+            future = self._submit(source_hash)
+        except RuntimeError:  # pipeline stopped
+            with self._lock:
+                self._inflight.pop(source_hash, None)
+            return False
+        future.add_done_callback(partial(self._finished, source_hash))
+        return True
+
+    def _submit(self, source_hash: str) -> Future:
+        with self._lock:
+            if not self._enabled:
+                raise RuntimeError("Image variant pipeline is stopped")
+            if self._pool is None:
+                self._pool = create_variant_pool(self.workers)
+                logger.info(f"Image variant pool started ({self.workers} workers)")
+            pool = self._pool
+        try:
+            return pool.submit(generate_variants, source_hash)
+        except BrokenExecutor:
+            # A worker died (e.g. killed for memory), which breaks the whole pool
+            logger.warning("Image variant pool broken, starting a new one")
+            with self._lock:
+                if not self._enabled:
+                    raise RuntimeError("Image variant pipeline is stopped")
+                if self._pool is pool:
+                    self._pool = create_variant_pool(self.workers)
+                pool = self._pool
+            return pool.submit(generate_variants, source_hash)
+
+    def _finished(self, source_hash: str, future: Future):
+        with self._lock:
+            image_ids = self._inflight.pop(source_hash, [])
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Image variants failed for {source_hash} (images {image_ids}): {error}")
+            return
+
+        db = SessionLocal()
+        try:
+            apply_variants(db, image_ids, future.result())
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Storing image variants for images {image_ids} failed: {e}")
+        finally:
+            db.close()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._inflight)
+
+
+variant_pipeline = VariantPipeline()
@@ -0,0 +1,254 @@
+"""
+Race Records Leaderboard
+
+Maintains the result_leaderboard table: the top 10 finishers for every
+(gender, year, race distance) slice, plus an all-time slice stored under
+year 0. The records endpoints read straight from this table, so a page view
+costs at most 10 rows per distance no matter how large the results history
+grows.
+
+The importers (fetch_historical_data.py and sync_member_results.py) call
+apply_results() with the rows they just wrote, before committing, so the
+affected slices are updated in the same transaction.
+"""
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from database import Results, ResultLeaderboard
+
+LEADERBOARD_SIZE = 10
+ALL_TIME = 0  # year value used for the all-time slice
+GENDERS = ('M', 'W')  # Results.gender values
+
+
+def _sort_key(row: dict):
+    # Fastest finish first, missing times last
+    seconds = row["finish_seconds"]
+    return (seconds is None, seconds or 0, row["result_id"])
+
+
+def _snapshot(result: Results) -> dict:
+    """Copy the fields the records pages display out of a Results row."""
+    return {
+        "result_id": result.id,
+        "finish_seconds": result.finish_seconds,
+        "overall_time": result.overall_time,
+        "pace": result.pace,
+        "runner_name": result.name,
+        "race": result.race,
+        "race_time": result.race_time,
+        "gender_age": result.gender_age,
+    }
+
+
+def _entry_snapshot(entry: ResultLeaderboard) -> dict:
+    return {
+        "result_id": entry.result_id,
+        "finish_seconds": entry.finish_seconds,
+        "overall_time": entry.overall_time,
+        "pace": entry.pace,
+        "runner_name": entry.runner_name,
+        "race": entry.race,
+        "race_time": entry.race_time,
+        "gender_age": entry.gender_age,
+    }
+
+
+def _slice_filter(query, gender: str, year: int, distance: str):
+    return query.filter(
+        ResultLeaderboard.gender == gender,
+        ResultLeaderboard.year == year,
+        ResultLeaderboard.race_distance == distance
+    )
+
+
+def _write_slice(db: Session, gender: str, year: int, distance: str, rows: list):
+    """Replace the stored entries of one slice with the given snapshots."""
+    _slice_filter(db.query(ResultLeaderboard), gender, year, distance).delete(synchronize_session=False)
+    for rank, row in enumerate(rows, 1):
+        db.add(ResultLeaderboard(gender=gender, year=year, race_distance=distance, rank=rank, **row))
+    # Sessions here don't autoflush; write now so later slice reads see it
+    db.flush()
+
+
+def top_results_by_distance(db: Session, gender: str, year: int = None, distance: str = None) -> list:
+    """
+    Rank results inside the database and return only the top 10 per distance.
+
+    Uses ROW_NUMBER() OVER (PARTITION BY race_distance ORDER BY finish_seconds),
+    which both MySQL 8 and SQLite (3.25+) support, so only the winning rows
+    cross the wire.
+
+    Returns:
+        Rows with result_id, finish_seconds, overall_time, pace, runner_name,
+        race, race_time, gender_age, race_distance and row_num (1-10)
+    """
+    row_num = func.row_number().over(
+        partition_by=Results.race_distance,
+        order_by=(
+            Results.finish_seconds.is_(None),  # Missing times last
+            Results.finish_seconds,
+            Results.id
+        )
+    ).label('row_num')
+
+    query = db.query(
+        Results.id.label('result_id'),
+        Results.finish_seconds,
+        Results.overall_time,
+        Results.pace,
+        Results.name.label('runner_name'),
+        Results.race,
+        Results.race_time,
+        Results.gender_age,
+        Results.race_distance,
+        row_num
+    ).filter(
+        Results.gender == gender
+    )
+    if year:
+        query = query.filter(Results.race_year == year)
+    if distance is not None:
+        query = query.filter(Results.race_distance == distance)
+
+    ranked = query.subquery()
+    return db.query(ranked).filter(
+        ranked.c.row_num <= LEADERBOARD_SIZE
+    ).order_by(ranked.c.race_distance, ranked.c.row_num).all()
+
+
+def _ranked_snapshot(row) -> dict:
+    return {
+        "result_id": row.result_id,
+        "finish_seconds": row.finish_seconds,
+        "overall_time": row.overall_time,
+        "pace": row.pace,
+        "runner_name": row.runner_name,
+        "race": row.race,
+        "race_time": row.race_time,
+        "gender_age": row.gender_age,
+    }
+
+
+def rebuild_slice(db: Session, gender: str, year: int, distance: str):
+    """Recompute one slice from the results table (reads at most 10 rows)."""
+    top = top_results_by_distance(db, gender, year or None, distance)
+    _write_slice(db, gender, year, distance, [_ranked_snapshot(row) for row in top])
+
+
+def apply_results(db: Session, results: list) -> int:
+    """
+    Fold newly written or updated results into the leaderboard.
+
+    The results must already be flushed so they have ids, and have their
+    derived columns filled (race_times.apply_derived_columns). Slices that
+    currently hold one of these results are rebuilt (an updated time may be
+    slower, or the row may have moved to another slice); every other affected
+    slice is merged with its current top 10 without reading the results table.
+
+    Returns:
+        Number of slices rewritten
+    """
+    touched = {}
+    for result in results:
+        if result.gender not in GENDERS or not result.race_distance or not result.race_year:
+            continue
+        for year in (result.race_year, ALL_TIME):
+            touched.setdefault((result.gender, year, result.race_distance), []).append(result)
+
+    result_ids = [r.id for r in results if r.id is not None]
+    stale = set()
+    if result_ids:
+        stale = set(
+            db.query(
+                ResultLeaderboard.gender, ResultLeaderboard.year, ResultLeaderboard.race_distance
+            ).filter(ResultLeaderboard.result_id.in_(result_ids)).distinct().all()
+        )
+
+    for gender, year, distance in stale:
+        rebuild_slice(db, gender, year, distance)
+
+    rewritten = len(stale)
+    for key, candidates in touched.items():
+        if key in stale:
+            continue
+        gender, year, distance = key
+
+        board = [
+            _entry_snapshot(entry) for entry in
+            _slice_filter(db.query(ResultLeaderboard), gender, year, distance)
+            .order_by(ResultLeaderboard.rank).all()
+        ]
+        new_rows = [_snapshot(r) for r in candidates]
+
+        # Nothing to do if the board is full and no candidate beats the last place
+        if len(board) == LEADERBOARD_SIZE and all(_sort_key(row) >= _sort_key(board[-1]) for row in new_rows):
+            continue
+
+        merged = sorted(board + new_rows, key=_sort_key)[:LEADERBOARD_SIZE]
+        _write_slice(db, gender, year, distance, merged)
+        rewritten += 1
+
+    return rewritten
+
+
+def rebuild_leaderboard(db: Session) -> int:
+    """
+    Rebuild every slice from scratch, one windowed query per (gender, year).
+    Used by the backfill migrations and after bulk edits to the results
+    table. Does not commit.
+
+    Returns:
+        Number of slices written
+    """
+    db.query(ResultLeaderboard).delete(synchronize_session=False)
+
+    years = [
+        row.race_year for row in
+        db.query(Results.race_year).filter(Results.race_year.isnot(None)).distinct().all()
+    ]
+
+    slice_count = 0
+    for gender in GENDERS:
+        for year in years + [ALL_TIME]:
+            by_distance = {}
+            for row in top_results_by_distance(db, gender, year or None):
+                by_distance.setdefault(row.race_distance, []).append(_ranked_snapshot(row))
+            for distance, rows in by_distance.items():
+                _write_slice(db, gender, year, distance, rows)
+            slice_count += len(by_distance)
+
+    return slice_count
+
+
+def _format_record(row, rank: int) -> dict:
+    return {
+        "distance": row.race_distance,
+        "rank": rank,
+        "time": row.overall_time,
+        "runner_name": row.runner_name,
+        "race_name": row.race,
+        "race_date": row.race_time.strftime('%Y-%m-%d'),
+        "age_group": row.gender_age,
+        "pace": row.pace
+    }
+
+
+def get_leaderboard_records(db: Session, gender: str, year: int = None) -> list:
+    """
+    Read the stored top 10 per distance for one gender, formatted for the
+    records pages. Pass year=None for the all-time leaderboard.
+
+    Falls back to ranking in the database when nothing has been materialized
+    for this gender/year yet (e.g. before the backfill migration has run).
+    """
+    entries = db.query(ResultLeaderboard).filter(
+        ResultLeaderboard.gender == gender,
+        ResultLeaderboard.year == (year or ALL_TIME)
+    ).order_by(ResultLeaderboard.race_distance, ResultLeaderboard.rank).all()
+
+    if entries:
+        return [_format_record(entry, entry.rank) for entry in entries]
+
+    return [_format_record(row, row.row_num) for row in top_results_by_distance(db, gender, year)]
@@ -1,16 +1,19 @@
-from fastapi import FastAPI, Depends, HTTPException, status, Header, File, UploadFile
+from fastapi import FastAPI, Depends, HTTPException, status, Header, File, UploadFile, Response, Request
+from fastapi.responses import JSONResponse, StreamingResponse, FileResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, and_, or_, case
 from typing import List, Optional
 from pydantic import BaseModel
 import os
 import uuid
-import base64
+import hashlib
+import asyncio
 from pathlib import Path
 
-from database import get_db, create_tables, Donor, Results, Member, Event, MeetingMinutes, Comment, Like, Reaction, EventCommentSettings, TempClubCredit, BannerImage, TrainingTip, TrainingTipUpvote, HomepageSection, MemberActivity, EventGalleryImage, EventGalleryImageLike, EventRecurrenceRule
+from database import get_db, create_tables, Donor, Results, Runner, AgeGradeSummary, Member, Event, MeetingMinutes, Comment, Like, Reaction, EventCommentSettings, TempClubCredit, BannerImage, TrainingTip, TrainingTipUpvote, HomepageSection, MemberActivity, EventGalleryImage, EventGalleryImageLike, EventRecurrenceRule
 from models import (
     DonorCreate, DonorUpdate, DonorResponse, DonorsListResponse, DonationSummary,
     DonorPublicResponse, DonorLinkMemberRequest,
@@ -20,10 +23,11 @@ from models import (
     EventCreate, EventUpdate, EventResponse, EventStatus, EventType,
     MeetingMinutesCreate, MeetingMinutesUpdate, MeetingMinutesResponse,
     CommentCreate, CommentResponse, CommentWithModeration, CommentHideRequest,
+    CommentPageResponse, CommentModerationPageResponse,
     LikeCreate, LikeResponse, LikeCountResponse,
     ReactionCreate, ReactionCountResponse, EventReactionsResponse, ALLOWED_EMOJIS,
     EventCommentSettingsUpdate, EventCommentSettingsResponse,
-    EventEngagementResponse, BatchEngagementRequest, BatchEngagementResponse,
+    EventEngagementResponse, BatchEngagementRequest, BatchEngagementResponse, BatchReactionsResponse,
     TempClubCreditCreate, TempClubCreditUpdate, TempClubCreditResponse, CreditType,
     BannerImageCreate, BannerImageUpdate, BannerImageResponse, CarouselBannerResponse,
     TrainingTipCreate, TrainingTipUpdate, TrainingTipResponse, TrainingTipPublicResponse, TrainingTipUpvoteResponse, TipStatus, TipCategory,
@@ -32,6 +36,24 @@ from models import (
     EventRecurrenceRuleCreate, EventRecurrenceRuleUpdate, EventRecurrenceRuleResponse, RecurrenceType, EventWithRecurrence, EventCreateWithRecurrence
 )
 from email_service import EmailService
+from leaderboard import get_leaderboard_records
+from runners import normalize_name, member_result_gender
+from member_stats_cache import member_stats_cache, cache_key, read_import_generation
+from pagination import paginate, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from age_grades import ALL_DISTANCES
+from event_settings import read_event_settings, invalidate_event_settings
+from engagement import (
+    load_engagements, load_cached_engagement_counts, load_user_likes, load_user_reactions,
+    reaction_responses, adjust_engagement_counters, counter_counts
+)
+from engagement_stream import engagement_stream, format_sse, STREAM_KEEPALIVE_SECONDS
+from engagement_cache import engagement_cache
+from comment_authors import comment_author_snapshot
+from toggles import actor_row, toggle_row, delete_row, retry_on_deadlock
+from write_behind import ENGAGEMENT_WRITE_BEHIND, write_behind
+from image_variants import variant_pipeline
+from image_payloads import payload_options, listed_image_url, listed_response, is_own_image_path, image_payload_response
+from blob_store import blob_store, blob_url, sniff_image_type, store_image_data_url, StagedBlob, BLOB_HASH_PATTERN
 import bcrypt
 
 app = FastAPI(
@@ -56,7 +78,7 @@ app.add_middleware(
 )
 
 # Import scheduler for recurring events
-from scheduler import start_scheduler, shutdown_scheduler
+from scheduler import start_scheduler, shutdown_scheduler, schedule_comment_author_refresh
 
 # Create database tables on startup and start scheduler
 @app.on_event("startup")
@@ -64,12 +86,20 @@ def startup_event():
     create_tables()
     # Start the background scheduler for recurring events
     start_scheduler()
+    if ENGAGEMENT_WRITE_BEHIND:
+        write_behind.start()
+    # Gallery image variants (worker processes are spawned by the first upload)
+    variant_pipeline.start()
 
 
 @app.on_event("shutdown")
 def shutdown_event():
     # Gracefully shutdown the scheduler
     shutdown_scheduler()
+    if ENGAGEMENT_WRITE_BEHIND:
+        # Write buffered engagement toggles before exiting
+        write_behind.stop()
+    variant_pipeline.stop()
 
 
 # Authorization dependency for admin-only endpoints
@@ -142,112 +172,47 @@ def read_root():
 
 @app.get("/api/results/available-years")
 def get_available_years(db: Session = Depends(get_db)):
-    """Get list of years that have race data"""
-    years = db.query(
-        func.extract('year', Results.race_time).label('year')
-    ).distinct().order_by(
-        func.extract('year', Results.race_time).desc()
-    ).all()
+    """Get list of years that have race data (index-only read of idx_race_year)"""
+    years = db.query(Results.race_year).filter(
+        Results.race_year.isnot(None)
+    ).distinct().order_by(Results.race_year.desc()).all()
 
-    return {"years": [int(year.year) for year in years]}
+    return {"years": [year.race_year for year in years]}
 
 @app.get("/api/results/men-records")
 def get_men_records(year: int = None, db: Session = Depends(get_db)):
-    """Get men's top 10 times for each race distance"""
-    # Base query for male runners
-    query = db.query(Results).filter(
-        Results.gender_age.like('M%')  # Filter for male runners
-    )
-
-    # Add year filter if specified
-    if year:
-        query = query.filter(func.extract('year', Results.race_time) == year)
-
-    # Get all results and group by distance
-    all_results = query.all()
-
-    # Group by distance and get top 10 for each
-    distance_records = {}
-    for result in all_results:
-        if result.race_distance not in distance_records:
-            distance_records[result.race_distance] = []
-        distance_records[result.race_distance].append(result)
-
-    # Sort each distance group by time and take top 10
-    records = []
-    for distance, results in distance_records.items():
-        # Sort by overall_time (assuming format allows string comparison)
-        sorted_results = sorted(results, key=lambda x: x.overall_time or 'ZZ:ZZ:ZZ')[:10]
-
-        for rank, result in enumerate(sorted_results, 1):
-            records.append({
-                "distance": distance,
-                "rank": rank,
-                "time": result.overall_time,
-                "runner_name": result.name,
-                "race_name": result.race,
-                "race_date": result.race_time.strftime('%Y-%m-%d'),
-                "age_group": result.gender_age,
-                "pace": result.pace
-            })
-
-    return {"men_records": records}
+    """Get men's top 10 times for each race distance (from the materialized leaderboard)"""
+    return {"men_records": get_leaderboard_records(db, 'M', year)}
 
 @app.get("/api/results/women-records")
 def get_women_records(year: int = None, db: Session = Depends(get_db)):
-    """Get women's top 10 times for each race distance"""
-    # Base query for female runners
-    query = db.query(Results).filter(
-        Results.gender_age.like('W%')  # Filter for female runners
-    )
-
-    # Add year filter if specified
-    if year:
-        query = query.filter(func.extract('year', Results.race_time) == year)
-
-    # Get all results and group by distance
-    all_results = query.all()
-
-    # Group by distance and get top 10 for each
-    distance_records = {}
-    for result in all_results:
-        if result.race_distance not in distance_records:
-            distance_records[result.race_distance] = []
-        distance_records[result.race_distance].append(result)
-
-    # Sort each distance group by time and take top 10
-    records = []
-    for distance, results in distance_records.items():
-        # Sort by overall_time (assuming format allows string comparison)
-        sorted_results = sorted(results, key=lambda x: x.overall_time or 'ZZ:ZZ:ZZ')[:10]
-
-        for rank, result in enumerate(sorted_results, 1):
-            records.append({
-                "distance": distance,
-                "rank": rank,
-                "time": result.overall_time,
-                "runner_name": result.name,
-                "race_name": result.race,
-                "race_date": result.race_time.strftime('%Y-%m-%d'),
-                "age_group": result.gender_age,
-                "pace": result.pace
-            })
-
-    return {"women_records": records}
+    """Get women's top 10 times for each race distance (from the materialized leaderboard)"""
+    return {"women_records": get_leaderboard_records(db, 'W', year)}
 
 @app.get("/api/results/all-races")
-def get_all_races(db: Session = Depends(get_db)):
-    """Get list of all races and distances"""
-    races = db.query(
+def get_all_races(cursor: str = None, limit: int = DEFAULT_PAGE_SIZE, db: Session = Depends(get_db)):
+    """
+    Get list of races and distances, newest first.
+
+    Keyset-paginated on (race_time, race, race_distance): pass the returned
+    next_cursor as ?cursor= to get the next page.
+    """
+    query = db.query(
+        Results.race_time,
         Results.race,
         Results.race_distance,
-        Results.race_time,
         func.count(Results.id).label('runner_count')
     ).group_by(
-        Results.race, Results.race_distance, Results.race_time
-    ).order_by(
-        Results.race_time.desc()
-    ).all()
+        Results.race_time, Results.race, Results.race_distance
+    )
+
+    try:
+        races, next_cursor = paginate(
+            query, (Results.race_time, Results.race, Results.race_distance),
+            cursor=cursor, limit=limit, descending=True
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
     return {
         "races": [
@@ -257,101 +222,304 @@ def get_all_races(db: Session = Depends(get_db)):
                 "date": race.race_time.strftime('%Y-%m-%d'),
                 "runner_count": race.runner_count
             } for race in races
-        ]
+        ],
+        "next_cursor": next_cursor
+    }
+
+
+def format_race_result(r: Results) -> dict:
+    """Serialize a Results row for the results listing endpoints"""
+    return {
+        "id": r.id,
+        "name": r.name,
+        "race": r.race,
+        "race_date": r.race_time.strftime('%Y-%m-%d') if r.race_time else None,
+        "distance": r.race_distance,
+        "overall_time": r.overall_time,
+        "pace": r.pace,
+        "overall_place": r.overall_place,
+        "gender_place": r.gender_place,
+        "age_group_place": r.age_group_place,
+        "gender_age": r.gender_age,
+        "age_graded_time": r.age_graded_time,
+        "age_graded_percent": float(r.age_graded_percent) if r.age_graded_percent else None
     }
 
 
+RACE_RESULT_SORTS = {
+    "overall": Results.overall_place,
+    "gender": Results.gender_place,
+    "age_group": Results.age_group_place,
+}
+
+
+def parse_age_group(age_group: str) -> tuple:
+    """
+    Parse an age group filter: "30-34" -> (30, 34), "70+" -> (70, None).
+
+    Raises:
+        ValueError: If the age group is malformed
+    """
+    if age_group.endswith('+'):
+        return int(age_group[:-1]), None
+    low, high = age_group.split('-')
+    return int(low), int(high)
+
+
+@app.get("/api/results/race/{race}")
+def get_race_results(
+    race: str,
+    sort: str = "overall",
+    gender: str = None,
+    age_group: str = None,
+    cursor: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the finisher list of a single race.
+
+    - sort: "overall" (default), "gender" or "age_group" place
+    - gender: "M" or "W" ("F" is accepted for "W")
+    - age_group: "30-34" style range of ages on race day, or "70+"
+
+    Keyset-paginated on (race_time, place, id): pass the returned
+    next_cursor as ?cursor= to get the next page. Sorting by overall place
+    is a range scan of idx_race_time_place.
+
+    Responses carry an ETag derived from the race's row count, max id and
+    last update, so an unchanged race answers If-None-Match with 304
+    without loading or serializing the page.
+    """
+    if sort not in RACE_RESULT_SORTS:
+        raise HTTPException(status_code=400, detail=f"Invalid sort. Must be one of: {', '.join(RACE_RESULT_SORTS)}")
+
+    query = db.query(Results).filter(Results.race == race)
+    if gender:
+        query = query.filter(Results.gender == member_result_gender(gender.upper()))
+    if age_group:
+        try:
+            min_age, max_age = parse_age_group(age_group)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid age_group. Use e.g. 30-34 or 70+")
+        query = query.filter(Results.age >= min_age)
+        if max_age is not None:
+            query = query.filter(Results.age <= max_age)
+
+    # Version of the race's rows; any import that adds or updates a row changes it
+    version = db.query(
+        func.count(Results.id), func.max(Results.id), func.max(Results.updated_at)
+    ).filter(Results.race == race).one()
+    etag = '"' + hashlib.sha1(
+        repr((race, tuple(version), sort, gender, age_group, cursor, limit)).encode()
+    ).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(',')]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    try:
+        results, next_cursor = paginate(
+            query, (Results.race_time, RACE_RESULT_SORTS[sort], Results.id), cursor=cursor, limit=limit
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return JSONResponse(
+        content={
+            "race": race,
+            "results": [format_race_result(r) for r in results],
+            "next_cursor": next_cursor
+        },
+        headers=headers
+    )
+
+
 @app.get("/api/results/member/{search_key}")
 def get_member_race_results(
+    search_key: str,
+    gender: str = None,
+    birth_year: int = None,
+    cursor: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    db: Session = Depends(get_db)
+):
+    """
+    Get race results for a specific member by NYRR ID or name.
+    Returns one page of matching results (newest first) along with
+    statistics over the member's whole history.
+
+    Looks the key up in the runners table (linked NYRR ID, or normalized
+    name + gender + birth-year range) and joins to that runner's results.
+    Results are keyset-paginated on (race_time, id); pass the returned
+    next_cursor as ?cursor= to get the next page. Stats are served from
+    member_stats_cache until its TTL expires or an importer bumps the
+    results import generation.
+    """
+    query = member_results_query(db, search_key, gender, birth_year)
+
+    try:
+        results, next_cursor = paginate(
+            query, (Results.race_time, Results.id), cursor=cursor, limit=limit, descending=True
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    key = cache_key(search_key, gender, birth_year)
+    generation = read_import_generation(db)
+    stats = member_stats_cache.get(key, generation)
+    if stats is None:
+        stats = build_member_stats(db, query)
+        member_stats_cache.set(key, stats, generation)
+
+    return {
+        "results": [format_race_result(r) for r in results],
+        "next_cursor": next_cursor,
+        "stats": stats
+    }
+
+
+@app.get("/api/results/member/{search_key}/age-grades")
+def get_member_age_grades(
     search_key: str,
     gender: str = None,
     birth_year: int = None,
     db: Session = Depends(get_db)
 ):
     """
-    Get race results for a specific member by name.
-    Returns all results matching the search key along with statistics.
+    Get a member's age-grade summary: best/average age grade, club rank,
+    percentile within their gender/age group and distance percentile, per
+    distance plus an "ALL" row across distances (from age_grade_summary).
+    """
+    rows = db.query(AgeGradeSummary).join(
+        Runner, AgeGradeSummary.runner_id == Runner.id
+    ).filter(
+        member_runner_filter(search_key, gender, birth_year)
+    ).order_by(AgeGradeSummary.race_distance).all()
+
+    return {"age_grades": [format_age_grade(row) for row in rows]}
 
-    Uses exact matching on name + gender_age (calculated from birth_year)
-    to accurately identify the runner's records.
+
+@app.get("/api/results/age-grade-leaderboard")
+def get_age_grade_leaderboard(
+    distance: str = ALL_DISTANCES,
+    gender: str = None,
+    age_group: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    db: Session = Depends(get_db)
+):
+    """
+    Get the club age-grade leaderboard: runners ranked by their best
+    age-graded percent at a distance ("ALL" = across distances), optionally
+    within a gender and/or age group (e.g. "30-34").
     """
-    # Search by exact name match (case-insensitive)
-    results = db.query(Results).filter(
-        Results.name.ilike(search_key)
-    ).order_by(Results.race_time.desc()).all()
+    rank = AgeGradeSummary.age_group_rank if gender and age_group else AgeGradeSummary.club_rank
+    query = db.query(AgeGradeSummary).filter(
+        AgeGradeSummary.race_distance == distance,
+        rank.isnot(None)
+    )
+    if gender:
+        query = query.filter(AgeGradeSummary.gender == member_result_gender(gender.upper()))
+    if age_group:
+        query = query.filter(AgeGradeSummary.age_group == age_group)
+
+    rows = query.order_by(rank, AgeGradeSummary.runner_id).limit(max(1, min(limit, MAX_PAGE_SIZE))).all()
+
+    return {"leaderboard": [format_age_grade(row) for row in rows]}
+
+
+def format_age_grade(row: AgeGradeSummary) -> dict:
+    """Serialize an AgeGradeSummary row"""
+    return {
+        "runner_name": row.runner_name,
+        "distance": row.race_distance,
+        "gender": row.gender,
+        "age_group": row.age_group,
+        "best_age_graded_percent": float(row.best_age_graded_percent) if row.best_age_graded_percent is not None else None,
+        "avg_age_graded_percent": float(row.avg_age_graded_percent) if row.avg_age_graded_percent is not None else None,
+        "race_count": row.race_count,
+        "best_race": row.best_race,
+        "best_race_date": row.best_race_time.strftime('%Y-%m-%d') if row.best_race_time else None,
+        "best_overall_time": row.best_overall_time,
+        "club_rank": row.club_rank,
+        "age_group_rank": row.age_group_rank,
+        "age_group_percentile": float(row.age_group_percentile) if row.age_group_percentile is not None else None,
+        "distance_percentile": float(row.distance_percentile) if row.distance_percentile is not None else None
+    }
+
+
+@app.get("/api/results/member-stats-cache")
+def get_member_stats_cache_stats(
+    current_user: Member = Depends(get_current_committee_or_admin)
+):
+    """Hit/miss counters for the member race stats cache - Committee or Admin"""
+    return member_stats_cache.stats()
 
-    # If gender and birth_year provided, filter by matching gender and calculated birth year
+
+def member_runner_filter(search_key: str, gender: str = None, birth_year: int = None):
+    """Runners matching a member search key"""
+    # Match runners by NYRR ID link or normalized name (both indexed on runners)
+    name_match = Runner.name_key == normalize_name(search_key)
+
+    # If gender and birth_year provided, the runner's gender and birth-year range must match too
     if gender and birth_year:
-        filtered_results = []
-        for result in results:
-            if result.race_time and result.gender_age:
-                # Extract gender and age from result's gender_age (e.g., "M30" -> "M", 30)
-                result_gender = result.gender_age[0] if result.gender_age else None
-                try:
-                    result_age = int(result.gender_age[1:]) if result.gender_age and len(result.gender_age) > 1 else None
-                except ValueError:
-                    result_age = None
-
-                if result_gender and result_age:
-                    # Calculate birth year from race year and age
-                    race_year = result.race_time.year
-                    calculated_birth_year = race_year - result_age
-
-                    # Match if gender matches AND calculated birth year is exact or +1 year
-                    # (+1 tolerance because if birthday hasn't passed yet, age is 1 less → calc birth year is 1 more)
-                    if result_gender == gender and calculated_birth_year in (birth_year, birth_year + 1):
-                        filtered_results.append(result)
-        results = filtered_results
-
-    if not results:
+        name_match = and_(
+            name_match,
+            Runner.gender == member_result_gender(gender),
+            Runner.birth_year_min <= birth_year,
+            Runner.birth_year_max >= birth_year
+        )
+
+    return or_(Runner.nyrr_member_id == search_key, name_match)
+
+
+def member_results_query(db: Session, search_key: str, gender: str = None, birth_year: int = None):
+    """Results of the runners matching a member search key"""
+    return db.query(Results).join(
+        Runner, Results.runner_id == Runner.id
+    ).filter(
+        member_runner_filter(search_key, gender, birth_year)
+    )
+
+
+def build_member_stats(db: Session, query) -> dict:
+    """Total races, PRs by distance and the 5 most recent results for a member results query"""
+    total_races = query.count()
+    if not total_races:
         return {
-            "results": [],
-            "stats": {
-                "total_races": 0,
-                "prs": {},
-                "recent_results": []
-            }
+            "total_races": 0,
+            "prs": {},
+            "recent_results": []
         }
 
-    # Calculate PRs by distance
-    prs = {}
-    for result in results:
-        distance = result.race_distance
-        if distance and result.overall_time:
-            if distance not in prs or result.overall_time < prs[distance]["time"]:
-                prs[distance] = {
-                    "time": result.overall_time,
-                    "race": result.race,
-                    "date": result.race_time.strftime('%Y-%m-%d') if result.race_time else None,
-                    "pace": result.pace
-                }
-
-    # Format results
-    formatted_results = [
-        {
-            "id": r.id,
-            "race": r.race,
-            "race_date": r.race_time.strftime('%Y-%m-%d') if r.race_time else None,
-            "distance": r.race_distance,
-            "overall_time": r.overall_time,
-            "pace": r.pace,
-            "overall_place": r.overall_place,
-            "gender_place": r.gender_place,
-            "age_group_place": r.age_group_place,
-            "gender_age": r.gender_age,
-            "age_graded_time": r.age_graded_time,
-            "age_graded_percent": float(r.age_graded_percent) if r.age_graded_percent else None
+    # Calculate PRs by distance in the database (fastest finish_seconds per distance)
+    pr_rank = func.row_number().over(
+        partition_by=Results.race_distance,
+        order_by=(Results.finish_seconds, Results.id)
+    ).label('pr_rank')
+    ranked = query.filter(
+        Results.finish_seconds.isnot(None)
+    ).with_entities(
+        Results.race_distance, Results.overall_time, Results.race, Results.race_time, Results.pace, pr_rank
+    ).subquery()
+
+    prs = {
+        pr.race_distance: {
+            "time": pr.overall_time,
+            "race": pr.race,
+            "date": pr.race_time.strftime('%Y-%m-%d') if pr.race_time else None,
+            "pace": pr.pace
         }
-        for r in results
-    ]
+        for pr in db.query(ranked).filter(ranked.c.pr_rank == 1).all()
+    }
+
+    recent = query.order_by(Results.race_time.desc(), Results.id.desc()).limit(5).all()
 
     return {
-        "results": formatted_results,
-        "stats": {
-            "total_races": len(results),
-            "prs": prs,
-            "recent_results": formatted_results[:5]
-        }
+        "total_races": total_races,
+        "prs": prs,
+        "recent_results": [format_race_result(r) for r in recent]
     }
 
 
@@ -647,11 +815,15 @@ def update_member(member_id: int, member_update: MemberUpdate, db: Session = Dep
     if 'status' in update_data and update_data['status']:
         update_data['status'] = update_data['status'].value
 
+    previous_snapshot = comment_author_snapshot(member)
     for field, value in update_data.items():
         setattr(member, field, value)
+    profile_changed = comment_author_snapshot(member) != previous_snapshot
 
     db.commit()
     db.refresh(member)
+    if profile_changed:
+        schedule_comment_author_refresh(member.id)
     return member
 
 
@@ -730,12 +902,18 @@ def sync_firebase_user(user_data: FirebaseUserSync, db: Session = Depends(get_db
                 detail=status_messages.get(existing_member.status, 'Account access denied')
             )
         # Update display name and photo if changed
+        profile_changed = False
         if user_data.display_name and user_data.display_name != existing_member.display_name:
             existing_member.display_name = user_data.display_name
+            profile_changed = True
         if user_data.photo_url and user_data.photo_url != existing_member.profile_photo_url:
             existing_member.profile_photo_url = user_data.photo_url
+            profile_changed = True
         db.commit()
         db.refresh(existing_member)
+        if profile_changed:
+            # Old comments carry the previous name/photo
+            schedule_comment_author_refresh(existing_member.id)
         return existing_member
 
     # Check if member exists with this email (might have been created before Firebase link)
@@ -754,12 +932,16 @@ def sync_firebase_user(user_data: FirebaseUserSync, db: Session = Depends(get_db
             )
         # Link existing member to Firebase account
         existing_email.firebase_uid = user_data.firebase_uid
+        previous_snapshot = comment_author_snapshot(existing_email)
         if user_data.display_name:
             existing_email.display_name = user_data.display_name
         if user_data.photo_url:
             existing_email.profile_photo_url = user_data.photo_url
+        profile_changed = comment_author_snapshot(existing_email) != previous_snapshot
         db.commit()
         db.refresh(existing_email)
+        if profile_changed:
+            schedule_comment_author_refresh(existing_email.id)
         return existing_email
 
     # Create new member
@@ -1312,6 +1494,7 @@ def delete_event(
 
     db.delete(event)
     db.commit()
+    engagement_cache.invalidate(event_id)
     return {"message": f"Event {event_id} deleted successfully"}
 
 
@@ -1436,7 +1619,10 @@ def get_current_member_required(
 
 
 def get_or_create_event_settings(event_id: int, db: Session) -> EventCommentSettings:
-    """Get or create event comment settings"""
+    """
+    Get or create event comment settings (write path, for updates).
+    Read paths use event_settings.read_event_settings, which never writes.
+    """
     settings = db.query(EventCommentSettings).filter(EventCommentSettings.event_id == event_id).first()
     if not settings:
         settings = EventCommentSettings(event_id=event_id)
@@ -1448,42 +1634,79 @@ def get_or_create_event_settings(event_id: int, db: Session) -> EventCommentSett
 
 # COMMENT ENDPOINTS
 
-@app.get("/api/events/{event_id}/comments", response_model=List[CommentResponse])
-def get_event_comments(event_id: int, db: Session = Depends(get_db)):
-    """Get visible (non-hidden) comments for an event"""
+COMMENT_PAGE_ORDER = (Comment.is_highlighted, Comment.created_at, Comment.id)  # all descending
+
+
+@app.get("/api/events/{event_id}/comments", response_model=CommentPageResponse)
+def get_event_comments(
+    event_id: int,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    db: Session = Depends(get_db)
+):
+    """
+    Get visible (non-hidden) comments for an event, highlighted first, then
+    newest first.
+
+    Keyset-paginated on (is_highlighted, created_at, id) over
+    idx_comment_event_visible_order: pass the returned next_cursor as
+    ?cursor= to get the next page. The first page also carries the visible
+    comment count (from event_engagement_counters), so a comment thread
+    opens with a single request.
+    """
     # Verify event exists
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
-    comments = db.query(Comment).filter(
+    query = db.query(Comment).filter(
         Comment.event_id == event_id,
         Comment.is_hidden == False
-    ).order_by(
-        Comment.is_highlighted.desc(),  # Highlighted comments first
-        Comment.created_at.desc()
-    ).all()
-    return comments
+    )
+    try:
+        comments, next_cursor = paginate(query, COMMENT_PAGE_ORDER, cursor=cursor, limit=limit, descending=True)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    total = None
+    if not cursor:
+        total = load_cached_engagement_counts(db, [event_id])[event_id]["comments"]
+    return CommentPageResponse(comments=comments, next_cursor=next_cursor, total=total)
 
 
-@app.get("/api/events/{event_id}/comments/all", response_model=List[CommentWithModeration])
+@app.get("/api/events/{event_id}/comments/all", response_model=CommentModerationPageResponse)
 def get_all_event_comments(
     event_id: int,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
     db: Session = Depends(get_db),
     current_admin: Member = Depends(get_current_admin)
 ):
-    """Get all comments including hidden ones (admin only)"""
+    """
+    Get all comments including hidden ones (admin only), paginated like
+    get_event_comments. The first page also carries the total and hidden
+    comment counts.
+    """
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
-    comments = db.query(Comment).filter(
-        Comment.event_id == event_id
-    ).order_by(
-        Comment.is_highlighted.desc(),
-        Comment.created_at.desc()
-    ).all()
-    return comments
+    query = db.query(Comment).filter(Comment.event_id == event_id)
+    try:
+        comments, next_cursor = paginate(query, COMMENT_PAGE_ORDER, cursor=cursor, limit=limit, descending=True)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    total = hidden_count = None
+    if not cursor:
+        counts = dict(db.query(Comment.is_hidden, func.count(Comment.id)).filter(
+            Comment.event_id == event_id
+        ).group_by(Comment.is_hidden).all())
+        total = sum(counts.values())
+        hidden_count = counts.get(True, 0)
+    return CommentModerationPageResponse(
+        comments=comments, next_cursor=next_cursor, total=total, hidden_count=hidden_count
+    )
 
 
 @app.post("/api/events/{event_id}/comments", response_model=CommentResponse)
@@ -1500,23 +1723,26 @@ def create_comment(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
     # Check if comments are enabled
-    settings = get_or_create_event_settings(event_id, db)
+    settings = read_event_settings(db, event_id)
     if not settings.comments_enabled:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Comments are disabled for this event"
         )
 
+    author_name, author_photo_url = comment_author_snapshot(current_member)
     comment = Comment(
         event_id=event_id,
         member_id=current_member.id,
         firebase_uid=current_member.firebase_uid,
         content=comment_data.content,
-        author_name=current_member.display_name or current_member.username,
-        author_photo_url=current_member.profile_photo_url
+        author_name=author_name,
+        author_photo_url=author_photo_url
     )
     db.add(comment)
+    comment_count = adjust_engagement_counters(db, event_id, comments=1).comment_count
     db.commit()
+    engagement_changed(event_id, comment_count=comment_count)
     db.refresh(comment)
     return comment
 
@@ -1539,8 +1765,14 @@ def delete_comment(
             detail="You can only delete your own comments"
         )
 
+    event_id = comment.event_id
     db.delete(comment)
-    db.commit()
+    if not comment.is_hidden:
+        comment_count = adjust_engagement_counters(db, event_id, comments=-1).comment_count
+        db.commit()
+        engagement_changed(event_id, comment_count=comment_count)
+    else:
+        db.commit()
     return {"message": "Comment deleted successfully"}
 
 
@@ -1572,11 +1804,18 @@ def hide_comment(
     if not comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
 
+    was_visible = not comment.is_hidden
     comment.is_hidden = True
     comment.hidden_by = current_admin.id
     comment.hidden_at = func.now()
     comment.hidden_reason = hide_request.reason
+    comment_count = None
+    if was_visible:
+        comment_count = adjust_engagement_counters(db, comment.event_id, comments=-1).comment_count
+    event_id = comment.event_id
     db.commit()
+    if comment_count is not None:
+        engagement_changed(event_id, comment_count=comment_count)
     return {"message": "Comment hidden successfully"}
 
 
@@ -1591,14 +1830,30 @@ def unhide_comment(
     if not comment:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
 
+    was_hidden = comment.is_hidden
     comment.is_hidden = False
     comment.hidden_by = None
     comment.hidden_at = None
     comment.hidden_reason = None
+    comment_count = None
+    if was_hidden:
+        comment_count = adjust_engagement_counters(db, comment.event_id, comments=1).comment_count
+    event_id = comment.event_id
     db.commit()
+    if comment_count is not None:
+        engagement_changed(event_id, comment_count=comment_count)
     return {"message": "Comment unhidden successfully"}
 
 
+def engagement_changed(event_id: int, **changes):
+    """
+    After committing a like/reaction/comment change: drop the event's cached
+    engagement aggregate and push the changed counts to live viewers.
+    """
+    engagement_cache.invalidate(event_id)
+    engagement_stream.publish(event_id, **changes)
+
+
 # LIKE ENDPOINTS
 
 @app.get("/api/events/{event_id}/likes", response_model=LikeCountResponse)
@@ -1609,24 +1864,12 @@ def get_event_likes(
     current_member: Optional[Member] = Depends(get_current_member_optional)
 ):
     """Get like count and whether current user has liked"""
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
+    counts = load_cached_engagement_counts(db, [event_id]).get(event_id)
+    if counts is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
-    count = db.query(Like).filter(Like.event_id == event_id).count()
-
-    # Check if user has liked
-    user_liked = False
-    if current_member:
-        user_liked = db.query(Like).filter(
-            Like.event_id == event_id,
-            Like.member_id == current_member.id
-        ).first() is not None
-    elif anonymous_id:
-        user_liked = db.query(Like).filter(
-            Like.event_id == event_id,
-            Like.anonymous_id == anonymous_id
-        ).first() is not None
+    count = counts["likes"]
+    user_liked = event_id in load_user_likes(db, [event_id], current_member, anonymous_id)
 
     return LikeCountResponse(count=count, user_liked=user_liked)
 
@@ -1644,48 +1887,36 @@ def toggle_like(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
     # Check if likes are enabled
-    settings = get_or_create_event_settings(event_id, db)
+    settings = read_event_settings(db, event_id)
     if not settings.likes_enabled:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Likes are disabled for this event"
         )
 
-    existing_like = None
-    if current_member:
-        existing_like = db.query(Like).filter(
-            Like.event_id == event_id,
-            Like.member_id == current_member.id
-        ).first()
-    elif like_data.anonymous_id:
-        existing_like = db.query(Like).filter(
-            Like.event_id == event_id,
-            Like.anonymous_id == like_data.anonymous_id
-        ).first()
-    else:
+    if not current_member and not like_data.anonymous_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Anonymous ID required for non-logged-in users"
         )
 
-    if existing_like:
-        # Unlike
-        db.delete(existing_like)
-        db.commit()
-        user_liked = False
-    else:
-        # Like
-        new_like = Like(
-            event_id=event_id,
-            member_id=current_member.id if current_member else None,
-            firebase_uid=current_member.firebase_uid if current_member else None,
-            anonymous_id=like_data.anonymous_id if not current_member else None
-        )
-        db.add(new_like)
+    if ENGAGEMENT_WRITE_BEHIND:
+        # Answer from the in-process buffer; the flush thread writes it
+        user_liked, count = write_behind.toggle(db, "like", (event_id,), current_member, like_data.anonymous_id)
+        engagement_changed(event_id, likes=count)
+        return LikeCountResponse(count=count, user_liked=user_liked)
+
+    # Lock the event, then DELETE, else INSERT IGNORE, against uq_like_event_member / uq_like_event_anonymous
+    like_row = actor_row(Like, current_member, like_data.anonymous_id, event_id=event_id)
+
+    def toggle():
+        user_liked, delta = toggle_row(db, Like, like_row, (Event, event_id))
+        count = adjust_engagement_counters(db, event_id, likes=delta).like_count
         db.commit()
-        user_liked = True
+        return user_liked, count
 
-    count = db.query(Like).filter(Like.event_id == event_id).count()
+    user_liked, count = retry_on_deadlock(db, toggle)
+    engagement_changed(event_id, likes=count)
     return LikeCountResponse(count=count, user_liked=user_liked)
 
 
@@ -1697,21 +1928,21 @@ def remove_like(
     current_member: Optional[Member] = Depends(get_current_member_optional)
 ):
     """Remove like from an event"""
-    existing_like = None
-    if current_member:
-        existing_like = db.query(Like).filter(
-            Like.event_id == event_id,
-            Like.member_id == current_member.id
-        ).first()
-    elif anonymous_id:
-        existing_like = db.query(Like).filter(
-            Like.event_id == event_id,
-            Like.anonymous_id == anonymous_id
-        ).first()
+    if not current_member and not anonymous_id:
+        return {"message": "Like not found"}
+
+    like_row = actor_row(Like, current_member, anonymous_id, event_id=event_id)
 
-    if existing_like:
-        db.delete(existing_like)
+    def remove():
+        if not delete_row(db, Like, like_row, (Event, event_id)):
+            return None
+        count = adjust_engagement_counters(db, event_id, likes=-1).like_count
         db.commit()
+        return count
+
+    count = retry_on_deadlock(db, remove)
+    if count is not None:
+        engagement_changed(event_id, likes=count)
         return {"message": "Like removed"}
     return {"message": "Like not found"}
 
@@ -1726,41 +1957,48 @@ def get_event_reactions(
     current_member: Optional[Member] = Depends(get_current_member_optional)
 ):
     """Get reaction counts for an event"""
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
+    # Counts per emoji from the cached aggregate, plus the user's own reactions
+    counts = load_cached_engagement_counts(db, [event_id]).get(event_id)
+    if counts is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
-    # Get counts per emoji
-    reaction_counts = db.query(
-        Reaction.emoji,
-        func.count(Reaction.id).label('count')
-    ).filter(Reaction.event_id == event_id).group_by(Reaction.emoji).all()
+    user_reactions = load_user_reactions(db, [event_id], current_member, anonymous_id).get(event_id, set())
+    if ENGAGEMENT_WRITE_BEHIND:
+        write_behind.overlay_reactions(event_id, counts, user_reactions, current_member, anonymous_id)
 
-    # Get user's reactions
-    user_reactions = set()
-    if current_member:
-        user_reaction_list = db.query(Reaction.emoji).filter(
-            Reaction.event_id == event_id,
-            Reaction.member_id == current_member.id
-        ).all()
-        user_reactions = {r.emoji for r in user_reaction_list}
-    elif anonymous_id:
-        user_reaction_list = db.query(Reaction.emoji).filter(
-            Reaction.event_id == event_id,
-            Reaction.anonymous_id == anonymous_id
-        ).all()
-        user_reactions = {r.emoji for r in user_reaction_list}
+    return EventReactionsResponse(reactions=reaction_responses(counts, user_reactions))
 
-    reactions = [
-        ReactionCountResponse(
-            emoji=emoji,
-            count=count,
-            user_reacted=emoji in user_reactions
-        )
-        for emoji, count in reaction_counts
-    ]
 
-    return EventReactionsResponse(reactions=reactions)
+@app.post("/api/events/reactions/batch", response_model=BatchReactionsResponse)
+def get_batch_reactions(
+    request: BatchEngagementRequest,
+    db: Session = Depends(get_db),
+    current_member: Optional[Member] = Depends(get_current_member_optional)
+):
+    """
+    Get reaction counts for multiple events (for list views) as parallel
+    arrays, in request order and by emoji within an event. Unknown events
+    are left out. Same counts as get_event_reactions for every event, from
+    the shared aggregate plus one query for the viewer's own reactions.
+    """
+    counts = load_cached_engagement_counts(db, request.event_ids)
+    identified = current_member is not None or bool(request.anonymous_id)
+    user_reactions = load_user_reactions(db, list(counts), current_member, request.anonymous_id) if counts else {}
+
+    columns = BatchReactionsResponse(event_ids=[], emojis=[], counts=[], user_reacted=[] if identified else None)
+    for event_id, event_counts in counts.items():
+        event_user_reactions = user_reactions.get(event_id, set())
+        if ENGAGEMENT_WRITE_BEHIND:
+            write_behind.overlay_reactions(
+                event_id, event_counts, event_user_reactions, current_member, request.anonymous_id
+            )
+        for emoji, count in sorted(event_counts["reactions"].items()):
+            columns.event_ids.append(event_id)
+            columns.emojis.append(emoji)
+            columns.counts.append(count)
+            if identified:
+                columns.user_reacted.append(emoji in event_user_reactions)
+    return columns
 
 
 @app.post("/api/events/{event_id}/reactions", response_model=EventReactionsResponse)
@@ -1783,47 +2021,36 @@ def toggle_reaction(
         )
 
     # Check if reactions are enabled
-    settings = get_or_create_event_settings(event_id, db)
+    settings = read_event_settings(db, event_id)
     if not settings.reactions_enabled:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Reactions are disabled for this event"
         )
 
-    existing_reaction = None
-    if current_member:
-        existing_reaction = db.query(Reaction).filter(
-            Reaction.event_id == event_id,
-            Reaction.member_id == current_member.id,
-            Reaction.emoji == reaction_data.emoji
-        ).first()
-    elif reaction_data.anonymous_id:
-        existing_reaction = db.query(Reaction).filter(
-            Reaction.event_id == event_id,
-            Reaction.anonymous_id == reaction_data.anonymous_id,
-            Reaction.emoji == reaction_data.emoji
-        ).first()
-    else:
+    if not current_member and not reaction_data.anonymous_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Anonymous ID required for non-logged-in users"
         )
 
-    if existing_reaction:
-        # Remove reaction
-        db.delete(existing_reaction)
-        db.commit()
-    else:
-        # Add reaction
-        new_reaction = Reaction(
-            event_id=event_id,
-            member_id=current_member.id if current_member else None,
-            firebase_uid=current_member.firebase_uid if current_member else None,
-            anonymous_id=reaction_data.anonymous_id if not current_member else None,
-            emoji=reaction_data.emoji
-        )
-        db.add(new_reaction)
+    if ENGAGEMENT_WRITE_BEHIND:
+        _, count = write_behind.toggle(db, "reaction", (event_id, reaction_data.emoji), current_member, reaction_data.anonymous_id)
+        engagement_changed(event_id, reactions={reaction_data.emoji: count})
+        return get_event_reactions(event_id, reaction_data.anonymous_id, db, current_member)
+
+    # Lock the event, then DELETE, else INSERT IGNORE, against the (event, actor, emoji) unique constraints
+    reaction_row = actor_row(Reaction, current_member, reaction_data.anonymous_id, event_id=event_id, emoji=reaction_data.emoji)
+
+    def toggle():
+        _, delta = toggle_row(db, Reaction, reaction_row, (Event, event_id))
+        counters = adjust_engagement_counters(db, event_id, reactions={reaction_data.emoji: delta})
+        count = counter_counts(counters)["reactions"].get(reaction_data.emoji, 0)
         db.commit()
+        return count
+
+    count = retry_on_deadlock(db, toggle)
+    engagement_changed(event_id, reactions={reaction_data.emoji: count})
 
     # Return updated reactions
     return get_event_reactions(event_id, reaction_data.anonymous_id, db, current_member)
@@ -1838,23 +2065,22 @@ def remove_reaction(
     current_member: Optional[Member] = Depends(get_current_member_optional)
 ):
     """Remove a specific reaction"""
-    existing_reaction = None
-    if current_member:
-        existing_reaction = db.query(Reaction).filter(
-            Reaction.event_id == event_id,
-            Reaction.member_id == current_member.id,
-            Reaction.emoji == emoji
-        ).first()
-    elif anonymous_id:
-        existing_reaction = db.query(Reaction).filter(
-            Reaction.event_id == event_id,
-            Reaction.anonymous_id == anonymous_id,
-            Reaction.emoji == emoji
-        ).first()
-
-    if existing_reaction:
-        db.delete(existing_reaction)
+    if not current_member and not anonymous_id:
+        return {"message": "Reaction not found"}
+
+    reaction_row = actor_row(Reaction, current_member, anonymous_id, event_id=event_id, emoji=emoji)
+
+    def remove():
+        if not delete_row(db, Reaction, reaction_row, (Event, event_id)):
+            return None
+        counters = adjust_engagement_counters(db, event_id, reactions={emoji: -1})
+        count = counter_counts(counters)["reactions"].get(emoji, 0)
         db.commit()
+        return count
+
+    count = retry_on_deadlock(db, remove)
+    if count is not None:
+        engagement_changed(event_id, reactions={emoji: count})
         return {"message": "Reaction removed"}
     return {"message": "Reaction not found"}
 
@@ -1868,140 +2094,72 @@ def get_event_engagement(
     db: Session = Depends(get_db),
     current_member: Optional[Member] = Depends(get_current_member_optional)
 ):
-    """Get all engagement data for an event"""
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
+    """Get all engagement data for an event (counts from event_engagement_counters)"""
+    engagement = load_engagements(db, [event_id], current_member, anonymous_id).get(event_id)
+    if not engagement:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
+    return engagement
 
-    # Get settings
-    settings = get_or_create_event_settings(event_id, db)
 
-    # Get likes
-    like_count = db.query(Like).filter(Like.event_id == event_id).count()
-    user_liked = False
-    if current_member:
-        user_liked = db.query(Like).filter(
-            Like.event_id == event_id,
-            Like.member_id == current_member.id
-        ).first() is not None
-    elif anonymous_id:
-        user_liked = db.query(Like).filter(
-            Like.event_id == event_id,
-            Like.anonymous_id == anonymous_id
-        ).first() is not None
-
-    # Get reactions
-    reaction_counts = db.query(
-        Reaction.emoji,
-        func.count(Reaction.id).label('count')
-    ).filter(Reaction.event_id == event_id).group_by(Reaction.emoji).all()
-
-    user_reactions = set()
-    if current_member:
-        user_reaction_list = db.query(Reaction.emoji).filter(
-            Reaction.event_id == event_id,
-            Reaction.member_id == current_member.id
-        ).all()
-        user_reactions = {r.emoji for r in user_reaction_list}
-    elif anonymous_id:
-        user_reaction_list = db.query(Reaction.emoji).filter(
-            Reaction.event_id == event_id,
-            Reaction.anonymous_id == anonymous_id
-        ).all()
-        user_reactions = {r.emoji for r in user_reaction_list}
+@app.get("/api/events/{event_id}/engagement/stream")
+async def stream_event_engagement(event_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Server-sent events with live engagement updates for an event.
 
-    reactions = [
-        ReactionCountResponse(emoji=emoji, count=count, user_reacted=emoji in user_reactions)
-        for emoji, count in reaction_counts
-    ]
+    Load the event's engagement once, then apply each `engagement` event's
+    data (partial counts: likes, reactions per emoji, comment_count) on top.
+    After checking the event exists the stream runs without touching the
+    database; comment lines are sent every STREAM_KEEPALIVE_SECONDS to keep
+    proxies from closing the connection.
+    """
+    try:
+        event = await run_in_threadpool(lambda: db.query(Event.id).filter(Event.id == event_id).first())
+    finally:
+        db.close()  # don't hold a connection for the life of the stream
+    if not event:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
-    # Get comment count
-    comment_count = db.query(Comment).filter(
-        Comment.event_id == event_id,
-        Comment.is_hidden == False
-    ).count()
+    queue = engagement_stream.subscribe(event_id)
 
-    return EventEngagementResponse(
-        event_id=event_id,
-        likes=LikeCountResponse(count=like_count, user_liked=user_liked),
-        reactions=reactions,
-        comment_count=comment_count,
-        comments_enabled=settings.comments_enabled,
-        likes_enabled=settings.likes_enabled,
-        reactions_enabled=settings.reactions_enabled
+    async def events():
+        try:
+            yield "retry: 5000\n\n"
+            while not await request.is_disconnected():
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(message)
+        finally:
+            engagement_stream.unsubscribe(event_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 
+@app.get("/api/events/engagement/cache")
+def get_engagement_cache_stats(
+    current_user: Member = Depends(get_current_committee_or_admin)
+):
+    """Hit/miss counters for the engagement aggregate cache - Committee or Admin"""
+    return engagement_cache.stats()
+
+
 @app.post("/api/events/engagement/batch", response_model=BatchEngagementResponse)
 def get_batch_engagement(
     request: BatchEngagementRequest,
     db: Session = Depends(get_db),
     current_member: Optional[Member] = Depends(get_current_member_optional)
 ):
-    """Get engagement data for multiple events (for list views)"""
-    engagements = {}
-    for event_id in request.event_ids:
-        event = db.query(Event).filter(Event.id == event_id).first()
-        if not event:
-            continue
-
-        settings = get_or_create_event_settings(event_id, db)
-
-        # Get likes
-        like_count = db.query(Like).filter(Like.event_id == event_id).count()
-        user_liked = False
-        if current_member:
-            user_liked = db.query(Like).filter(
-                Like.event_id == event_id,
-                Like.member_id == current_member.id
-            ).first() is not None
-        elif request.anonymous_id:
-            user_liked = db.query(Like).filter(
-                Like.event_id == event_id,
-                Like.anonymous_id == request.anonymous_id
-            ).first() is not None
-
-        # Get reactions
-        reaction_counts = db.query(
-            Reaction.emoji,
-            func.count(Reaction.id).label('count')
-        ).filter(Reaction.event_id == event_id).group_by(Reaction.emoji).all()
-
-        user_reactions = set()
-        if current_member:
-            user_reaction_list = db.query(Reaction.emoji).filter(
-                Reaction.event_id == event_id,
-                Reaction.member_id == current_member.id
-            ).all()
-            user_reactions = {r.emoji for r in user_reaction_list}
-        elif request.anonymous_id:
-            user_reaction_list = db.query(Reaction.emoji).filter(
-                Reaction.event_id == event_id,
-                Reaction.anonymous_id == request.anonymous_id
-            ).all()
-            user_reactions = {r.emoji for r in user_reaction_list}
-
-        reactions = [
-            ReactionCountResponse(emoji=emoji, count=count, user_reacted=emoji in user_reactions)
-            for emoji, count in reaction_counts
-        ]
-
-        # Get comment count
-        comment_count = db.query(Comment).filter(
-            Comment.event_id == event_id,
-            Comment.is_hidden == False
-        ).count()
-
-        engagements[event_id] = EventEngagementResponse(
-            event_id=event_id,
-            likes=LikeCountResponse(count=like_count, user_liked=user_liked),
-            reactions=reactions,
-            comment_count=comment_count,
-            comments_enabled=settings.comments_enabled,
-            likes_enabled=settings.likes_enabled,
-            reactions_enabled=settings.reactions_enabled
-        )
-
+    """
+    Get engagement data for multiple events (for list views).
+    Uses a fixed number of set-based queries however many IDs are sent.
+    """
+    engagements = load_engagements(db, request.event_ids, current_member, request.anonymous_id)
     return BatchEngagementResponse(engagements=engagements)
 
 
@@ -2009,12 +2167,12 @@ def get_batch_engagement(
 
 @app.get("/api/events/{event_id}/settings", response_model=EventCommentSettingsResponse)
 def get_event_settings(event_id: int, db: Session = Depends(get_db)):
-    """Get event engagement settings"""
+    """Get event engagement settings (defaults if none were saved; never writes)"""
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
-    settings = get_or_create_event_settings(event_id, db)
+    settings = read_event_settings(db, event_id)
     return settings
 
 
@@ -2048,6 +2206,7 @@ def update_event_settings(
 
     db.commit()
     db.refresh(settings)
+    invalidate_event_settings(event_id)
     return settings
 
 
@@ -2161,26 +2320,27 @@ def delete_credit(
 # BANNER IMAGE ENDPOINTS
 
 @app.get("/api/banners", response_model=List[BannerImageResponse])
-def get_active_banners(db: Session = Depends(get_db)):
+def get_active_banners(include_payload: bool = False, db: Session = Depends(get_db)):
     """Get all active banner images, sorted by display order"""
-    banners = db.query(BannerImage).filter(
+    banners = db.query(BannerImage).options(*payload_options(include_payload)).filter(
         BannerImage.is_active == True
     ).order_by(BannerImage.display_order).all()
-    return banners
+    return [listed_response(BannerImageResponse, banner, include_payload) for banner in banners]
 
 
 @app.get("/api/banners/all", response_model=List[BannerImageResponse])
 def get_all_banners(
+    include_payload: bool = False,
     db: Session = Depends(get_db),
     current_admin: Member = Depends(get_current_admin)
 ):
     """Get all banners including inactive ones (admin only)"""
-    banners = db.query(BannerImage).order_by(BannerImage.display_order).all()
-    return banners
+    banners = db.query(BannerImage).options(*payload_options(include_payload)).order_by(BannerImage.display_order).all()
+    return [listed_response(BannerImageResponse, banner, include_payload) for banner in banners]
 
 
 @app.get("/api/banners/carousel", response_model=List[CarouselBannerResponse])
-def get_carousel_banners(db: Session = Depends(get_db)):
+def get_carousel_banners(include_payload: bool = False, db: Session = Depends(get_db)):
     """
     Get carousel banners for homepage.
     Returns merged list of:
@@ -2191,14 +2351,14 @@ def get_carousel_banners(db: Session = Depends(get_db)):
     carousel_items = []
 
     # Get active manual banners
-    manual_banners = db.query(BannerImage).filter(
+    manual_banners = db.query(BannerImage).options(*payload_options(include_payload)).filter(
         BannerImage.is_active == True
     ).order_by(BannerImage.display_order).all()
 
     for banner in manual_banners:
         item = CarouselBannerResponse(
             id=banner.id,
-            image_url=banner.image_url,
+            image_url=listed_image_url(banner, include_payload),
             alt_text=banner.alt_text,
             link_path=banner.link_path,
             label_en=banner.label_en,
@@ -2259,12 +2419,21 @@ def get_carousel_banners(db: Session = Depends(get_db)):
 @app.get("/api/banners/{banner_id}", response_model=BannerImageResponse)
 def get_banner(banner_id: int, db: Session = Depends(get_db)):
     """Get a specific banner by ID"""
-    banner = db.query(BannerImage).filter(BannerImage.id == banner_id).first()
+    banner = db.query(BannerImage).options(*payload_options(True)).filter(BannerImage.id == banner_id).first()
     if not banner:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Banner not found")
     return banner
 
 
+@app.get("/api/banners/{banner_id}/image")
+def get_banner_image(banner_id: int, db: Session = Depends(get_db)):
+    """Get a banner's image (where lists point banners whose image is stored inline)"""
+    banner = db.query(BannerImage.image_url).filter(BannerImage.id == banner_id).first()
+    if not banner:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Banner not found")
+    return image_payload_response(banner.image_url)
+
+
 @app.post("/api/banners", response_model=BannerImageResponse)
 def create_banner(
     banner: BannerImageCreate,
@@ -2292,6 +2461,8 @@ def update_banner(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Banner not found")
 
     update_data = banner_update.model_dump(exclude_unset=True)
+    if is_own_image_path(banner, update_data.get("image_url")):
+        del update_data["image_url"]  # the listed stand-in for an inline image; keep the image
     for field, value in update_data.items():
         setattr(banner, field, value)
 
@@ -2319,33 +2490,47 @@ def delete_banner(
 # HOMEPAGE SECTION ENDPOINTS
 
 @app.get("/api/homepage-sections", response_model=List[HomepageSectionResponse])
-def get_active_sections(db: Session = Depends(get_db)):
+def get_active_sections(include_payload: bool = False, db: Session = Depends(get_db)):
     """Get all active homepage sections, sorted by display order"""
-    sections = db.query(HomepageSection).filter(
+    sections = db.query(HomepageSection).options(*payload_options(include_payload)).filter(
         HomepageSection.is_active == True
     ).order_by(HomepageSection.display_order).all()
-    return sections
+    return [listed_response(HomepageSectionResponse, section, include_payload) for section in sections]
 
 
 @app.get("/api/homepage-sections/all", response_model=List[HomepageSectionResponse])
 def get_all_sections(
+    include_payload: bool = False,
     db: Session = Depends(get_db),
     current_admin: Member = Depends(get_current_admin)
 ):
     """Get all homepage sections including inactive ones (admin only)"""
-    sections = db.query(HomepageSection).order_by(HomepageSection.display_order).all()
-    return sections
+    sections = db.query(HomepageSection).options(*payload_options(include_payload)).order_by(
+        HomepageSection.display_order
+    ).all()
+    return [listed_response(HomepageSectionResponse, section, include_payload) for section in sections]
 
 
 @app.get("/api/homepage-sections/{section_id}", response_model=HomepageSectionResponse)
 def get_section(section_id: int, db: Session = Depends(get_db)):
     """Get a specific homepage section by ID"""
-    section = db.query(HomepageSection).filter(HomepageSection.id == section_id).first()
+    section = db.query(HomepageSection).options(*payload_options(True)).filter(
+        HomepageSection.id == section_id
+    ).first()
     if not section:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Section not found")
     return section
 
 
+@app.get("/api/homepage-sections/{section_id}/image")
+def get_section_image(section_id: int, db: Session = Depends(get_db)):
+    """Get a section's image (where lists point sections whose image is stored inline)"""
+    section = db.query(HomepageSection.image_url).filter(HomepageSection.id == section_id).first()
+    if not section:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Section not found")
+    return image_payload_response(section.image_url)
+
+
 @app.post("/api/homepage-sections", response_model=HomepageSectionResponse)
 def create_section(
     section: HomepageSectionCreate,
@@ -2373,6 +2558,8 @@ def update_section(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Section not found")
 
     update_data = section_update.model_dump(exclude_unset=True)
+    if is_own_image_path(section, update_data.get("image_url")):
+        del update_data["image_url"]  # the listed stand-in for an inline image; keep the image
     for field, value in update_data.items():
         setattr(section, field, value)
 
@@ -2415,6 +2602,9 @@ def reorder_sections(
 
 # IMAGE UPLOAD ENDPOINT
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+MEDIA_CHUNK_SIZE = 64 * 1024
+
 # Mapping of file extensions to MIME types
 ALLOWED_IMAGE_EXTENSIONS = {
     '.jpg': 'image/jpeg',
@@ -2429,7 +2619,7 @@ async def upload_image(
     file: UploadFile = File(...),
     current_admin: Member = Depends(get_current_admin)
 ):
-    """Upload an image file (admin only). Returns base64 data URL for database storage."""
+    """Upload an image file (admin only). Returns its /media URL for database storage."""
     # Get file extension
     file_ext = Path(file.filename).suffix.lower() if file.filename else ''
 
@@ -2446,30 +2636,113 @@ async def upload_image(
             detail=f"File type not allowed. Allowed types: JPEG, PNG, GIF, WebP"
         )
 
-    # Validate file size (max 5MB)
+    # Stream the upload to a staging file in chunks, hashing as we go and
+    # stopping as soon as it passes the size limit (max 5MB)
     max_size = 5 * 1024 * 1024  # 5MB
-    contents = await file.read()
-    if len(contents) > max_size:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="File too large. Maximum size is 5MB."
-        )
-
+    staged = StagedBlob(blob_store)
     try:
-        # Convert to base64 data URL
-        base64_data = base64.b64encode(contents).decode('utf-8')
-        data_url = f"data:{mime_type};base64,{base64_data}"
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            if staged.size + len(chunk) > max_size:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="File too large. Maximum size is 5MB."
+                )
+            await asyncio.to_thread(staged.write, chunk)
+
+        if sniff_image_type(staged.head) is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File is not a valid JPEG, PNG, GIF or WebP image"
+            )
 
-        return {"url": data_url}
+        # Store once by content hash; the row keeps only the short URL
+        blob_hash = await asyncio.to_thread(staged.commit, mime_type)
+        return {"url": blob_url(blob_hash)}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process image: {str(e)}"
         )
     finally:
+        await asyncio.to_thread(staged.discard)
         await file.close()
 
 
+# Blobs never change, so clients and CDNs may cache them forever
+MEDIA_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match check (weak comparison, as RFC 9110 specifies for it)."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+@app.api_route("/media/{blob_hash}", methods=["GET", "HEAD"])
+def get_media(blob_hash: str, request: Request):
+    """
+    Serve a stored image by its content hash. The hash is a strong ETag;
+    a matching If-None-Match gets 304, and Range requests get 206 / 416.
+    Local blobs are streamed from disk by FileResponse (zero-copy where
+    the server supports the ASGI pathsend extension).
+    """
+    if not BLOB_HASH_PATTERN.match(blob_hash):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media not found")
+
+    etag = f'"{blob_hash}"'
+    cache_headers = {"ETag": etag, "Cache-Control": MEDIA_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        if not blob_store.exists(blob_hash):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media not found")
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    try:
+        path = blob_store.local_path(blob_hash)
+    except FileNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media not found")
+    if path is not None:
+        with open(path, "rb") as blob:
+            media_type = sniff_image_type(blob.read(16)) or "application/octet-stream"
+        return FileResponse(path, media_type=media_type, headers=cache_headers, stat_result=path.stat())
+
+    # Remote store: S3 applies the Range header itself
+    byte_range = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range and if_range.strip() != etag:
+        byte_range = None
+    try:
+        blob = blob_store.get(blob_hash, byte_range)
+    except FileNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Media not found")
+    except ValueError:
+        return Response(status_code=status.HTTP_416_RANGE_NOT_SATISFIABLE, headers=cache_headers)
+
+    headers = {**cache_headers, "Accept-Ranges": "bytes", "Content-Length": str(blob["ContentLength"])}
+    if blob.get("ContentRange"):
+        headers["Content-Range"] = blob["ContentRange"]
+    body = blob["Body"]
+    if request.method == "HEAD":
+        body.close()
+
+    def chunks():
+        try:
+            if request.method == "GET":
+                yield from body.iter_chunks(MEDIA_CHUNK_SIZE)
+        finally:
+            body.close()
+
+    return StreamingResponse(
+        chunks(),
+        status_code=status.HTTP_206_PARTIAL_CONTENT if blob.get("ContentRange") else status.HTTP_200_OK,
+        media_type=blob.get("ContentType") or "application/octet-stream",
+        headers=headers
+    )
+
+
 # TRAINING TIP ENDPOINTS
 
 @app.get("/api/training-tips", response_model=List[TrainingTipPublicResponse])
@@ -2651,41 +2924,29 @@ def toggle_tip_upvote(
     if tip.status != 'approved':
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Can only upvote approved tips")
 
-    # Check for existing upvote
-    existing_upvote = None
-    if current_member:
-        existing_upvote = db.query(TrainingTipUpvote).filter(
-            TrainingTipUpvote.tip_id == tip_id,
-            TrainingTipUpvote.member_id == current_member.id
-        ).first()
-    elif anonymous_id:
-        existing_upvote = db.query(TrainingTipUpvote).filter(
-            TrainingTipUpvote.tip_id == tip_id,
-            TrainingTipUpvote.anonymous_id == anonymous_id
-        ).first()
-    else:
+    if not current_member and not anonymous_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Anonymous ID required for non-logged-in users"
         )
 
-    if existing_upvote:
-        # Remove upvote
-        db.delete(existing_upvote)
-        tip.upvotes = max(0, tip.upvotes - 1)
-        user_upvoted = False
-    else:
-        # Add upvote
-        new_upvote = TrainingTipUpvote(
-            tip_id=tip_id,
-            member_id=current_member.id if current_member else None,
-            anonymous_id=anonymous_id if not current_member else None
-        )
-        db.add(new_upvote)
-        tip.upvotes += 1
-        user_upvoted = True
+    if ENGAGEMENT_WRITE_BEHIND:
+        user_upvoted, upvotes = write_behind.toggle(db, "tip_upvote", (tip_id,), current_member, anonymous_id)
+        return TrainingTipUpvoteResponse(tip_id=tip_id, upvotes=upvotes, user_upvoted=user_upvoted)
 
-    db.commit()
+    # Lock the tip, then DELETE, else INSERT IGNORE, against uq_upvote_tip_member / uq_upvote_tip_anonymous
+    upvote_row = actor_row(TrainingTipUpvote, current_member, anonymous_id, tip_id=tip_id)
+
+    def toggle():
+        user_upvoted, delta = toggle_row(db, TrainingTipUpvote, upvote_row, (TrainingTip, tip_id))
+        if delta:
+            db.query(TrainingTip).filter(TrainingTip.id == tip_id).update(
+                {TrainingTip.upvotes: case((TrainingTip.upvotes + delta < 0, 0), else_=TrainingTip.upvotes + delta)}, synchronize_session=False
+            )
+        db.commit()
+        return user_upvoted
+
+    user_upvoted = retry_on_deadlock(db, toggle)
     db.refresh(tip)
 
     return TrainingTipUpvoteResponse(
@@ -2697,10 +2958,37 @@ def toggle_tip_upvote(
 
 # EVENT GALLERY ENDPOINTS
 
+def gallery_image_response(
+    img: EventGalleryImage,
+    user_liked: bool = False,
+    include_payload: bool = True
+) -> EventGalleryImageResponse:
+    """List endpoints pass include_payload through; single images always carry image_url."""
+    return EventGalleryImageResponse(
+        id=img.id,
+        event_id=img.event_id,
+        image_url=listed_image_url(img, include_payload),
+        thumbnail_url=img.thumbnail_url,
+        medium_url=img.medium_url,
+        full_url=img.full_url,
+        caption=img.caption,
+        caption_cn=img.caption_cn,
+        display_order=img.display_order,
+        is_active=img.is_active,
+        uploaded_by_id=img.uploaded_by_id,
+        uploaded_by_name=img.uploaded_by_name,
+        like_count=img.like_count,
+        user_liked=user_liked,
+        created_at=img.created_at,
+        updated_at=img.updated_at
+    )
+
+
 @app.get("/api/events/{event_id}/gallery", response_model=List[EventGalleryImageResponse])
 def get_event_gallery(
     event_id: int,
     anonymous_id: Optional[str] = None,
+    include_payload: bool = False,
     db: Session = Depends(get_db),
     current_member: Optional[Member] = Depends(get_current_member_optional)
 ):
@@ -2709,7 +2997,7 @@ def get_event_gallery(
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
-    images = db.query(EventGalleryImage).filter(
+    images = db.query(EventGalleryImage).options(*payload_options(include_payload)).filter(
         EventGalleryImage.event_id == event_id,
         EventGalleryImage.is_active == True
     ).order_by(EventGalleryImage.display_order, EventGalleryImage.created_at.desc()).all()
@@ -2732,21 +3020,7 @@ def get_event_gallery(
     # Build response with user_liked info
     result = []
     for img in images:
-        img_response = EventGalleryImageResponse(
-            id=img.id,
-            event_id=img.event_id,
-            image_url=img.image_url,
-            caption=img.caption,
-            caption_cn=img.caption_cn,
-            display_order=img.display_order,
-            is_active=img.is_active,
-            uploaded_by_id=img.uploaded_by_id,
-            uploaded_by_name=img.uploaded_by_name,
-            like_count=img.like_count,
-            user_liked=img.id in user_liked_ids,
-            created_at=img.created_at,
-            updated_at=img.updated_at
-        )
+        img_response = gallery_image_response(img, img.id in user_liked_ids, include_payload)
         result.append(img_response)
 
     return result
@@ -2757,22 +3031,23 @@ def get_event_gallery_preview(
     event_id: int,
     limit: int = 5,
     anonymous_id: Optional[str] = None,
+    include_payload: bool = False,
     db: Session = Depends(get_db),
     current_member: Optional[Member] = Depends(get_current_member_optional)
 ):
-    """Get first N gallery images for card preview with total count"""
+    """Get first N gallery images for card preview with total count (cards use thumbnail_url)"""
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
     # Get total count
-    total_count = db.query(EventGalleryImage).filter(
+    total_count = db.query(func.count(EventGalleryImage.id)).filter(
         EventGalleryImage.event_id == event_id,
         EventGalleryImage.is_active == True
-    ).count()
+    ).scalar()
 
     # Get preview images
-    images = db.query(EventGalleryImage).filter(
+    images = db.query(EventGalleryImage).options(*payload_options(include_payload)).filter(
         EventGalleryImage.event_id == event_id,
         EventGalleryImage.is_active == True
     ).order_by(EventGalleryImage.display_order, EventGalleryImage.created_at.desc()).limit(limit).all()
@@ -2795,21 +3070,7 @@ def get_event_gallery_preview(
 
     # Build response
     image_responses = [
-        EventGalleryImageResponse(
-            id=img.id,
-            event_id=img.event_id,
-            image_url=img.image_url,
-            caption=img.caption,
-            caption_cn=img.caption_cn,
-            display_order=img.display_order,
-            is_active=img.is_active,
-            uploaded_by_id=img.uploaded_by_id,
-            uploaded_by_name=img.uploaded_by_name,
-            like_count=img.like_count,
-            user_liked=img.id in user_liked_ids,
-            created_at=img.created_at,
-            updated_at=img.updated_at
-        )
+        gallery_image_response(img, img.id in user_liked_ids, include_payload)
         for img in images
     ]
 
@@ -2823,70 +3084,89 @@ def get_event_gallery_preview(
 @app.post("/api/events/gallery/batch-preview", response_model=BatchGalleryPreviewResponse)
 def get_batch_gallery_preview(
     request: BatchGalleryPreviewRequest,
+    include_payload: bool = False,
     db: Session = Depends(get_db),
     current_member: Optional[Member] = Depends(get_current_member_optional)
 ):
-    """Get gallery previews for multiple events in a single request"""
-    previews = {}
+    """
+    Get gallery previews for multiple events in a single request.
 
-    for event_id in request.event_ids:
-        # Get total count
-        total_count = db.query(EventGalleryImage).filter(
-            EventGalleryImage.event_id == event_id,
+    Runs the same three queries however many events are asked for: one
+    grouped count, one ROW_NUMBER() OVER (PARTITION BY event_id ...) query
+    for the first `limit` images of every event, and one likes query over
+    all returned images.
+    """
+    event_ids = list(dict.fromkeys(request.event_ids))
+    if not event_ids:
+        return BatchGalleryPreviewResponse(previews={})
+
+    # Total counts per event
+    total_counts = dict(db.query(
+        EventGalleryImage.event_id, func.count(EventGalleryImage.id)
+    ).filter(
+        EventGalleryImage.event_id.in_(event_ids),
+        EventGalleryImage.is_active == True
+    ).group_by(EventGalleryImage.event_id).all())
+
+    # First `limit` images per event, in single-event preview order
+    images = []
+    if total_counts:
+        row_num = func.row_number().over(
+            partition_by=EventGalleryImage.event_id,
+            order_by=(EventGalleryImage.display_order, EventGalleryImage.created_at.desc())
+        ).label('row_num')
+        ranked = db.query(EventGalleryImage.id, row_num).filter(
+            EventGalleryImage.event_id.in_(list(total_counts)),
             EventGalleryImage.is_active == True
-        ).count()
+        ).subquery()
+        images = db.query(EventGalleryImage).options(*payload_options(include_payload)).join(
+            ranked, ranked.c.id == EventGalleryImage.id
+        ).filter(
+            ranked.c.row_num <= request.limit
+        ).order_by(EventGalleryImage.event_id, ranked.c.row_num).all()
 
-        # Get preview images (limit 5)
-        images = db.query(EventGalleryImage).filter(
-            EventGalleryImage.event_id == event_id,
-            EventGalleryImage.is_active == True
-        ).order_by(EventGalleryImage.display_order, EventGalleryImage.created_at.desc()).limit(5).all()
-
-        # Check which images the user has liked
-        user_liked_ids = set()
-        if images:
-            if current_member:
-                user_likes = db.query(EventGalleryImageLike.image_id).filter(
-                    EventGalleryImageLike.member_id == current_member.id,
-                    EventGalleryImageLike.image_id.in_([img.id for img in images])
-                ).all()
-                user_liked_ids = {like.image_id for like in user_likes}
-            elif request.anonymous_id:
-                user_likes = db.query(EventGalleryImageLike.image_id).filter(
-                    EventGalleryImageLike.anonymous_id == request.anonymous_id,
-                    EventGalleryImageLike.image_id.in_([img.id for img in images])
-                ).all()
-                user_liked_ids = {like.image_id for like in user_likes}
-
-        # Build response for this event
-        image_responses = [
-            EventGalleryImageResponse(
-                id=img.id,
-                event_id=img.event_id,
-                image_url=img.image_url,
-                caption=img.caption,
-                caption_cn=img.caption_cn,
-                display_order=img.display_order,
-                is_active=img.is_active,
-                uploaded_by_id=img.uploaded_by_id,
-                uploaded_by_name=img.uploaded_by_name,
-                like_count=img.like_count,
-                user_liked=img.id in user_liked_ids,
-                created_at=img.created_at,
-                updated_at=img.updated_at
-            )
-            for img in images
-        ]
+    # Check which images the user has liked
+    user_liked_ids = set()
+    if images:
+        if current_member:
+            user_likes = db.query(EventGalleryImageLike.image_id).filter(
+                EventGalleryImageLike.member_id == current_member.id,
+                EventGalleryImageLike.image_id.in_([img.id for img in images])
+            ).all()
+            user_liked_ids = {like.image_id for like in user_likes}
+        elif request.anonymous_id:
+            user_likes = db.query(EventGalleryImageLike.image_id).filter(
+                EventGalleryImageLike.anonymous_id == request.anonymous_id,
+                EventGalleryImageLike.image_id.in_([img.id for img in images])
+            ).all()
+            user_liked_ids = {like.image_id for like in user_likes}
 
+    # Build response for each event
+    image_responses = {event_id: [] for event_id in event_ids}
+    for img in images:
+        image_responses[img.event_id].append(gallery_image_response(img, img.id in user_liked_ids, include_payload))
+
+    previews = {}
+    for event_id in event_ids:
+        total_count = total_counts.get(event_id, 0)
         previews[event_id] = EventGalleryPreviewResponse(
-            images=image_responses,
+            images=image_responses[event_id],
             total_count=total_count,
-            has_more=total_count > 5
+            has_more=total_count > request.limit
         )
 
     return BatchGalleryPreviewResponse(previews=previews)
 
 
+@app.get("/api/gallery/{image_id}/image")
+def get_gallery_image_payload(image_id: int, db: Session = Depends(get_db)):
+    """Get a gallery image's original (where lists point images stored inline)"""
+    image = db.query(EventGalleryImage.image_url).filter(EventGalleryImage.id == image_id).first()
+    if not image:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+    return image_payload_response(image.image_url)
+
+
 @app.post("/api/events/{event_id}/gallery", response_model=EventGalleryImageResponse)
 def upload_gallery_image(
     event_id: int,
@@ -2899,6 +3179,12 @@ def upload_gallery_image(
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
 
+    # Data URLs go to the blob store; the row keeps the short /media URL
+    try:
+        image_url = store_image_data_url(image_data.image_url)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     # Get next display order
     max_order = db.query(func.max(EventGalleryImage.display_order)).filter(
         EventGalleryImage.event_id == event_id
@@ -2906,7 +3192,7 @@ def upload_gallery_image(
 
     new_image = EventGalleryImage(
         event_id=event_id,
-        image_url=image_data.image_url,
+        image_url=image_url,
         caption=image_data.caption,
         caption_cn=image_data.caption_cn,
         display_order=image_data.display_order if image_data.display_order else max_order + 1,
@@ -2918,21 +3204,10 @@ def upload_gallery_image(
     db.commit()
     db.refresh(new_image)
 
-    return EventGalleryImageResponse(
-        id=new_image.id,
-        event_id=new_image.event_id,
-        image_url=new_image.image_url,
-        caption=new_image.caption,
-        caption_cn=new_image.caption_cn,
-        display_order=new_image.display_order,
-        is_active=new_image.is_active,
-        uploaded_by_id=new_image.uploaded_by_id,
-        uploaded_by_name=new_image.uploaded_by_name,
-        like_count=new_image.like_count,
-        user_liked=False,
-        created_at=new_image.created_at,
-        updated_at=new_image.updated_at
-    )
+    # Thumbnail/medium/full variants are rendered in the background
+    variant_pipeline.submit(new_image.id, new_image.image_url)
+
+    return gallery_image_response(new_image)
 
 
 @app.put("/api/gallery/{image_id}", response_model=EventGalleryImageResponse)
@@ -2954,21 +3229,7 @@ def update_gallery_image(
     db.commit()
     db.refresh(image)
 
-    return EventGalleryImageResponse(
-        id=image.id,
-        event_id=image.event_id,
-        image_url=image.image_url,
-        caption=image.caption,
-        caption_cn=image.caption_cn,
-        display_order=image.display_order,
-        is_active=image.is_active,
-        uploaded_by_id=image.uploaded_by_id,
-        uploaded_by_name=image.uploaded_by_name,
-        like_count=image.like_count,
-        user_liked=False,
-        created_at=image.created_at,
-        updated_at=image.updated_at
-    )
+    return gallery_image_response(image)
 
 
 @app.delete("/api/gallery/{image_id}")
@@ -3024,42 +3285,30 @@ def toggle_gallery_image_like(
     if not image:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
 
-    # Check for existing like
-    existing_like = None
-    if current_member:
-        existing_like = db.query(EventGalleryImageLike).filter(
-            EventGalleryImageLike.image_id == image_id,
-            EventGalleryImageLike.member_id == current_member.id
-        ).first()
-    elif anonymous_id:
-        existing_like = db.query(EventGalleryImageLike).filter(
-            EventGalleryImageLike.image_id == image_id,
-            EventGalleryImageLike.anonymous_id == anonymous_id
-        ).first()
-    else:
+    if not current_member and not anonymous_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Anonymous ID required for non-logged-in users"
         )
 
-    if existing_like:
-        # Unlike
-        db.delete(existing_like)
-        image.like_count = max(0, image.like_count - 1)
-        user_liked = False
-    else:
-        # Like
-        new_like = EventGalleryImageLike(
-            image_id=image_id,
-            member_id=current_member.id if current_member else None,
-            firebase_uid=current_member.firebase_uid if current_member else None,
-            anonymous_id=anonymous_id if not current_member else None
-        )
-        db.add(new_like)
-        image.like_count += 1
-        user_liked = True
+    if ENGAGEMENT_WRITE_BEHIND:
+        user_liked, like_count = write_behind.toggle(db, "gallery_like", (image_id,), current_member, anonymous_id)
+        return EventGalleryImageLikeResponse(image_id=image_id, like_count=like_count, user_liked=user_liked)
 
-    db.commit()
+    # Lock the image, then DELETE, else INSERT IGNORE, against uq_gallery_like_image_member / uq_gallery_like_image_anonymous
+    like_row = actor_row(EventGalleryImageLike, current_member, anonymous_id, image_id=image_id)
+
+    def toggle():
+        user_liked, delta = toggle_row(db, EventGalleryImageLike, like_row, (EventGalleryImage, image_id))
+        if delta:
+            db.query(EventGalleryImage).filter(EventGalleryImage.id == image_id).update(
+                {EventGalleryImage.like_count: case((EventGalleryImage.like_count + delta < 0, 0), else_=EventGalleryImage.like_count + delta)},
+                synchronize_session=False
+            )
+        db.commit()
+        return user_liked
+
+    user_liked = retry_on_deadlock(db, toggle)
     db.refresh(image)
 
     return EventGalleryImageLikeResponse(
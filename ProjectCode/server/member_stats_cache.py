@@ -0,0 +1,114 @@
+"""
+Member Race Stats Cache
+
+Profile pages call /api/results/member/{search_key}, which computes a
+member's total races, PRs and recent results. Those stats are cached per
+(normalized search key, gender, birth_year) for MEMBER_STATS_CACHE_TTL
+seconds; the paginated results list itself is read fresh each request.
+
+The importers (fetch_historical_data.py and sync_member_results.py) run
+as separate processes, so they can't reach this cache. Instead they call
+bump_import_generation() in the transaction that writes their results,
+which increments the "results" row of import_generations. Every entry
+records the generation read before its stats were computed, and get()
+treats an entry from an older generation as a miss. An import therefore
+shows up on the next profile view instead of after the TTL, at the cost
+of one primary-key read per request.
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from database import ImportGeneration, insert_ignore
+from runners import normalize_name, member_result_gender
+
+MEMBER_STATS_CACHE_TTL = int(os.getenv("MEMBER_STATS_CACHE_TTL", "300"))  # seconds
+MEMBER_STATS_CACHE_MAX_ENTRIES = 5000
+RESULTS_GENERATION = "results"
+
+
+def cache_key(search_key: str, gender: Optional[str] = None, birth_year: Optional[int] = None) -> tuple:
+    """Key for a member lookup: (normalized search key, "M"/"W", birth_year)."""
+    return normalize_name(search_key), member_result_gender(gender), birth_year
+
+
+def read_import_generation(db: Session, name: str = RESULTS_GENERATION) -> int:
+    """Current generation of name (0 before the first import)."""
+    return db.query(ImportGeneration.generation).filter(ImportGeneration.name == name).scalar() or 0
+
+
+def bump_import_generation(db: Session, name: str = RESULTS_GENERATION):
+    """Increment name's generation in the caller's transaction (commit it with the imported rows)."""
+    bumped = db.execute(update(ImportGeneration).where(ImportGeneration.name == name).values(
+        generation=ImportGeneration.generation + 1
+    )).rowcount
+    if not bumped and not db.execute(insert_ignore(ImportGeneration).values(name=name, generation=1)).rowcount:
+        # Another importer created the row first
+        db.execute(update(ImportGeneration).where(ImportGeneration.name == name).values(
+            generation=ImportGeneration.generation + 1
+        ))
+
+
+class MemberStatsCache:
+    """Thread-safe TTL cache with hit/miss counters."""
+
+    def __init__(self, ttl: int = MEMBER_STATS_CACHE_TTL):
+        self.ttl = ttl
+        self._entries = {}  # cache_key -> (expires_at, generation, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: tuple, generation: int):
+        """Return the cached value for key, or None on a miss (expired, or from an older generation)."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now and entry[1] == generation:
+                self.hits += 1
+                return entry[2]
+            if entry is not None:
+                del self._entries[key]
+                if entry[1] != generation:
+                    self.invalidations += 1
+            self.misses += 1
+            return None
+
+    def set(self, key: tuple, value, generation: int):
+        """Cache value computed after reading generation (read it before computing)."""
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= MEMBER_STATS_CACHE_MAX_ENTRIES:
+                # Drop expired and older-generation entries first, then the oldest ones
+                for stale in [k for k, (expires_at, entry_generation, _) in self._entries.items()
+                              if expires_at <= now or entry_generation != generation]:
+                    del self._entries[stale]
+                while len(self._entries) >= MEMBER_STATS_CACHE_MAX_ENTRIES:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (now + self.ttl, generation, value)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "invalidations": self.invalidations
+            }
+
+
+# Process-wide cache
+member_stats_cache = MemberStatsCache()
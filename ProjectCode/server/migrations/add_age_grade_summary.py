@@ -0,0 +1,57 @@
+"""
+Database Migration: Add Age-Grade Summary Table
+
+This script adds the age_grade_summary table behind the club age-grade
+leaderboard and member age-grade percentiles, and fills it from the
+existing results (see age_grades.py). The importers keep it up to date
+afterwards.
+
+Run this script once to update the database schema.
+Usage: python migrations/add_age_grade_summary.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database import engine, SessionLocal, AgeGradeSummary
+from age_grades import rebuild_age_grades
+
+
+def run_migration():
+    """Run the database migration to add the age_grade_summary table."""
+
+    print("Starting migration: Add Age-Grade Summary Table")
+    print("=" * 60)
+
+    with engine.connect() as conn:
+        # Check if we're using SQLite or MySQL
+        dialect = engine.dialect.name
+        print(f"Database dialect: {dialect}")
+
+        print("\n1. Creating age_grade_summary table...")
+        AgeGradeSummary.__table__.create(bind=conn, checkfirst=True)
+        conn.commit()
+        print("   ✓ age_grade_summary table created/verified")
+
+    print("\n2. Computing age-grade summaries (requires migrations/add_runners.py)...")
+    db = SessionLocal()
+    try:
+        row_count = rebuild_age_grades(db)
+        db.commit()
+        print(f"   ✓ {row_count} summary rows written")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print("\n" + "=" * 60)
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration()
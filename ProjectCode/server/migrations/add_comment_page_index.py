@@ -0,0 +1,58 @@
+"""
+Database Migration: Add (event_id, is_hidden, is_highlighted, created_at) Index to Comments
+
+/api/events/{event_id}/comments pages an event's visible comments
+highlighted first, then newest first. This script adds
+idx_comment_event_visible_order on
+(event_id, is_hidden, is_highlighted, created_at) so each page is an index
+range scan instead of a filesort over all of the event's comments.
+
+Run this script once to update the database schema.
+Usage: python migrations/add_comment_page_index.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from database import engine
+
+
+def run_migration():
+    """Run the database migration to add idx_comment_event_visible_order."""
+
+    print("Starting migration: Add idx_comment_event_visible_order to Comments")
+    print("=" * 60)
+
+    with engine.connect() as conn:
+        # Check if we're using SQLite or MySQL
+        dialect = engine.dialect.name
+        print(f"Database dialect: {dialect}")
+
+        print("\n1. Adding idx_comment_event_visible_order...")
+        if dialect == 'sqlite':
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_comment_event_visible_order ON comments(event_id, is_hidden, is_highlighted, created_at)"
+            ))
+        else:
+            result = conn.execute(text("""
+                SELECT COUNT(*) FROM INFORMATION_SCHEMA.STATISTICS
+                WHERE TABLE_NAME = 'comments' AND INDEX_NAME = 'idx_comment_event_visible_order' AND TABLE_SCHEMA = DATABASE()
+            """))
+            if result.fetchone()[0] == 0:
+                conn.execute(text(
+                    "CREATE INDEX idx_comment_event_visible_order ON comments(event_id, is_hidden, is_highlighted, created_at)"
+                ))
+        conn.commit()
+        print("   ✓ idx_comment_event_visible_order added/verified")
+
+    print("\n" + "=" * 60)
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,57 @@
+"""
+Database Migration: Add Event Engagement Counters
+
+This script adds the event_engagement_counters table (like count,
+per-emoji reaction counts and visible comment count per event) and fills
+it from the existing likes, reactions and comments. The engagement
+endpoints keep it up to date afterwards and the scheduler reconciles it
+hourly.
+
+Run this script once to update the database schema.
+Usage: python migrations/add_event_engagement_counters.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database import engine, SessionLocal, EventEngagementCounters
+from engagement import reconcile_engagement_counters
+
+
+def run_migration():
+    """Run the database migration to add the event_engagement_counters table."""
+
+    print("Starting migration: Add Event Engagement Counters")
+    print("=" * 60)
+
+    with engine.connect() as conn:
+        # Check if we're using SQLite or MySQL
+        dialect = engine.dialect.name
+        print(f"Database dialect: {dialect}")
+
+        print("\n1. Creating event_engagement_counters table...")
+        EventEngagementCounters.__table__.create(bind=conn, checkfirst=True)
+        conn.commit()
+        print("   ✓ event_engagement_counters table created/verified")
+
+    print("\n2. Counting existing likes, reactions and comments...")
+    db = SessionLocal()
+    try:
+        stats = reconcile_engagement_counters(db)
+        print(f"   ✓ {stats['checked']} events checked, {stats['created']} counter rows created")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print("\n" + "=" * 60)
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,68 @@
+"""
+Database Migration: Add Gallery Image Variant Columns
+
+This script adds thumbnail_url, medium_url and full_url columns to the
+event_gallery_images table. They hold the /media URLs of the resized
+variants generated by image_variants.py and stay NULL until an image has
+been processed; clients fall back to image_url meanwhile.
+
+Run this script once to update the database schema, then fill the columns
+for existing images with backfill_image_variants.py.
+Usage: python migrations/add_gallery_image_variants.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from database import engine
+
+VARIANT_COLUMNS = ["thumbnail_url", "medium_url", "full_url"]
+
+
+def run_migration():
+    """Run the database migration to add the gallery image variant columns."""
+
+    print("Starting migration: Add Gallery Image Variant Columns")
+    print("=" * 60)
+
+    with engine.connect() as conn:
+        # Check if we're using SQLite or MySQL
+        dialect = engine.dialect.name
+        print(f"Database dialect: {dialect}")
+
+        # Check existing columns
+        print("\n1. Checking existing columns in event_gallery_images table...")
+
+        if dialect == 'sqlite':
+            result = conn.execute(text("PRAGMA table_info(event_gallery_images)"))
+            existing_columns = [row[1] for row in result.fetchall()]
+        else:  # MySQL
+            result = conn.execute(text("""
+                SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_NAME = 'event_gallery_images' AND TABLE_SCHEMA = DATABASE()
+            """))
+            existing_columns = [row[0] for row in result.fetchall()]
+
+        print(f"   Existing columns count: {len(existing_columns)}")
+
+        for step, column in enumerate(VARIANT_COLUMNS, start=2):
+            if column not in existing_columns:
+                print(f"\n{step}. Adding {column} column...")
+                conn.execute(text(f"ALTER TABLE event_gallery_images ADD COLUMN {column} VARCHAR(100)"))
+                conn.commit()
+                print(f"   ✓ {column} column added")
+            else:
+                print(f"\n{step}. ✓ {column} column already exists")
+
+    print("\n" + "=" * 60)
+    print("Migration completed successfully!")
+    print("\nNext: python backfill_image_variants.py")
+
+
+if __name__ == "__main__":
+    run_migration()
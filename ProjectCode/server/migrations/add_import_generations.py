@@ -0,0 +1,40 @@
+"""
+Database Migration: Add Import Generations
+
+This script creates the import_generations table. The importers
+(fetch_historical_data.py, sync_member_results.py) bump its "results" row
+with every batch of results they commit, and the API compares it against
+its cached member stats, so imported results show up on profile pages
+without waiting for the cache TTL.
+
+Run this script once to update the database schema (before deploying the
+API, which reads the table on every member results request).
+Usage: python migrations/add_import_generations.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database import engine, ImportGeneration
+
+
+def run_migration():
+    """Create the import_generations table."""
+
+    print("Starting migration: Add Import Generations")
+    print("=" * 60)
+    print(f"Database dialect: {engine.dialect.name}")
+
+    print("\n1. Creating import_generations table...")
+    ImportGeneration.__table__.create(bind=engine, checkfirst=True)
+    print("   ✓ import_generations table created/verified")
+
+    print("\n" + "=" * 60)
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,119 @@
+"""
+Database Migration: Add age Column to Results
+
+Member history lookups used to re-parse gender_age ("M50") for every name
+match in Python. This script adds a parsed results.age column (gender was
+added by add_result_race_year_gender.py), backfills gender and age with the
+importers' parser, and adds idx_gender_distance on
+(gender, race_distance, finish_seconds) for the all-time records ranking.
+
+Run this script once to update the database schema.
+Usage: python migrations/add_result_age.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text, update
+from database import engine, SessionLocal, Results
+from race_times import parse_gender_age
+
+BATCH_SIZE = 1000
+
+
+def backfill_age():
+    """Parse gender_age into gender/age, BATCH_SIZE rows at a time."""
+    db = SessionLocal()
+    updated = 0
+    last_id = 0
+    try:
+        while True:
+            batch = db.query(Results.id, Results.gender_age).filter(
+                Results.id > last_id
+            ).order_by(Results.id).limit(BATCH_SIZE).all()
+            if not batch:
+                break
+
+            mappings = []
+            for row in batch:
+                gender, age = parse_gender_age(row.gender_age)
+                mappings.append({"id": row.id, "gender": gender, "age": age})
+            db.execute(update(Results), mappings)
+            db.commit()
+
+            updated += len(batch)
+            last_id = batch[-1].id
+            print(f"   ... {updated} rows parsed")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    return updated
+
+
+def run_migration():
+    """Run the database migration to add the age column."""
+
+    print("Starting migration: Add age to Results")
+    print("=" * 60)
+
+    with engine.connect() as conn:
+        # Check if we're using SQLite or MySQL
+        dialect = engine.dialect.name
+        print(f"Database dialect: {dialect}")
+
+        print("\n1. Checking existing columns in results table...")
+        if dialect == 'sqlite':
+            result = conn.execute(text("PRAGMA table_info(results)"))
+            existing_columns = [row[1] for row in result.fetchall()]
+        else:  # MySQL
+            result = conn.execute(text("""
+                SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_NAME = 'results' AND TABLE_SCHEMA = DATABASE()
+            """))
+            existing_columns = [row[0] for row in result.fetchall()]
+
+        if 'gender' not in existing_columns:
+            print("   ❌ gender missing - run migrations/add_result_race_year_gender.py first")
+            return
+
+        if 'age' not in existing_columns:
+            conn.execute(text("ALTER TABLE results ADD COLUMN age INTEGER"))
+            conn.commit()
+            print("   ✓ age column added")
+        else:
+            print("   ✓ age column already exists")
+
+        print("\n2. Adding idx_gender_distance...")
+        if dialect == 'sqlite':
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_gender_distance ON results(gender, race_distance, finish_seconds)"
+            ))
+        else:
+            result = conn.execute(text("""
+                SELECT COUNT(*) FROM INFORMATION_SCHEMA.STATISTICS
+                WHERE TABLE_NAME = 'results' AND INDEX_NAME = 'idx_gender_distance' AND TABLE_SCHEMA = DATABASE()
+            """))
+            if result.fetchone()[0] == 0:
+                conn.execute(text(
+                    "CREATE INDEX idx_gender_distance ON results(gender, race_distance, finish_seconds)"
+                ))
+        conn.commit()
+        print("   ✓ idx_gender_distance added/verified")
+
+    print("\n3. Backfilling gender and age...")
+    updated = backfill_age()
+    print(f"   ✓ {updated} results backfilled")
+
+    print("\n" + "=" * 60)
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration()
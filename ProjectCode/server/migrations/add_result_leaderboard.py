@@ -0,0 +1,87 @@
+"""
+Database Migration: Add Result Leaderboard
+
+This script creates the result_leaderboard table, which stores the top 10
+finishers per (gender, year, race distance) plus an all-time slice, and
+fills it from the existing results table.
+
+The records endpoints read only from this table, so run this once after
+deploying (and again after any bulk edit made directly in the database).
+
+The rebuild ranks on results columns added by earlier migrations, so run
+those first, in this order:
+    1. migrations/add_result_time_seconds.py      (finish_seconds)
+    2. migrations/add_result_race_year_gender.py  (race_year, gender)
+The script stops before changing anything if one of them is missing.
+(add_result_age.py is not needed here.)
+Usage: python migrations/add_result_leaderboard.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from database import engine, SessionLocal, ResultLeaderboard
+from leaderboard import rebuild_leaderboard
+
+# Results columns the rebuild reads -> migration that adds them, in run order
+PREREQUISITES = {
+    'finish_seconds': 'add_result_time_seconds.py',
+    'race_year': 'add_result_race_year_gender.py',
+    'gender': 'add_result_race_year_gender.py',
+}
+
+
+def get_existing_columns(conn, dialect, table):
+    if dialect == 'sqlite':
+        result = conn.execute(text(f"PRAGMA table_info({table})"))
+        return [row[1] for row in result.fetchall()]
+    result = conn.execute(text("""
+        SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_NAME = :table AND TABLE_SCHEMA = DATABASE()
+    """), {"table": table})
+    return [row[0] for row in result.fetchall()]
+
+
+def run_migration():
+    """Create the result_leaderboard table and backfill it."""
+
+    print("Starting migration: Add Result Leaderboard")
+    print("=" * 60)
+    print(f"Database dialect: {engine.dialect.name}")
+
+    print("\n1. Checking prerequisite results columns...")
+    with engine.connect() as conn:
+        existing = set(get_existing_columns(conn, engine.dialect.name, 'results'))
+    for column, script in PREREQUISITES.items():
+        if column not in existing:
+            print(f"   ❌ {column} missing - run migrations/{script} first")
+            return
+    print("   ✓ finish_seconds, race_year and gender present")
+
+    print("\n2. Creating result_leaderboard table...")
+    ResultLeaderboard.__table__.create(bind=engine, checkfirst=True)
+    print("   ✓ result_leaderboard table created/verified")
+
+    print("\n3. Rebuilding leaderboard from results...")
+    db = SessionLocal()
+    try:
+        slice_count = rebuild_leaderboard(db)
+        db.commit()
+        print(f"   ✓ {slice_count} leaderboard slices written")
+    except Exception as e:
+        db.rollback()
+        print(f"   ❌ Rebuild failed: {e}")
+        raise
+    finally:
+        db.close()
+
+    print("\n" + "=" * 60)
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,56 @@
+"""
+Database Migration: Add (race, race_time, overall_place) Index to Results
+
+/api/results/race/{race} pages a race's finishers in overall-place order.
+This script adds idx_race_time_place on (race, race_time, overall_place)
+so each page is an index range scan instead of a filesort over the race.
+
+Run this script once to update the database schema.
+Usage: python migrations/add_result_race_place_index.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from database import engine
+
+
+def run_migration():
+    """Run the database migration to add idx_race_time_place."""
+
+    print("Starting migration: Add idx_race_time_place to Results")
+    print("=" * 60)
+
+    with engine.connect() as conn:
+        # Check if we're using SQLite or MySQL
+        dialect = engine.dialect.name
+        print(f"Database dialect: {dialect}")
+
+        print("\n1. Adding idx_race_time_place...")
+        if dialect == 'sqlite':
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS idx_race_time_place ON results(race, race_time, overall_place)"
+            ))
+        else:
+            result = conn.execute(text("""
+                SELECT COUNT(*) FROM INFORMATION_SCHEMA.STATISTICS
+                WHERE TABLE_NAME = 'results' AND INDEX_NAME = 'idx_race_time_place' AND TABLE_SCHEMA = DATABASE()
+            """))
+            if result.fetchone()[0] == 0:
+                conn.execute(text(
+                    "CREATE INDEX idx_race_time_place ON results(race, race_time, overall_place)"
+                ))
+        conn.commit()
+        print("   ✓ idx_race_time_place added/verified")
+
+    print("\n" + "=" * 60)
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,120 @@
+"""
+Database Migration: Add race_year and gender Columns to Results
+
+Year filters used EXTRACT(year FROM race_time) and gender filters used
+gender_age LIKE 'M%', neither of which can use an index. This script adds
+stored race_year and gender columns, backfills them with one set-based
+UPDATE, and adds:
+- idx_race_year (index-only read for the available-years list)
+- idx_gender_year_distance on (gender, race_year, race_distance, finish_seconds)
+
+The records leaderboard is rebuilt afterwards because it now ranks through
+these columns.
+
+Run this script once to update the database schema.
+Usage: python migrations/add_result_race_year_gender.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from database import engine, SessionLocal
+from leaderboard import rebuild_leaderboard
+
+INDEXES = {
+    'idx_race_year': 'race_year',
+    'idx_gender_year_distance': 'gender, race_year, race_distance, finish_seconds',
+}
+
+
+def run_migration():
+    """Run the database migration to add race_year and gender columns."""
+
+    print("Starting migration: Add race_year and gender to Results")
+    print("=" * 60)
+
+    with engine.connect() as conn:
+        # Check if we're using SQLite or MySQL
+        dialect = engine.dialect.name
+        print(f"Database dialect: {dialect}")
+
+        print("\n1. Checking existing columns in results table...")
+        if dialect == 'sqlite':
+            result = conn.execute(text("PRAGMA table_info(results)"))
+            existing_columns = [row[1] for row in result.fetchall()]
+        else:  # MySQL
+            result = conn.execute(text("""
+                SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_NAME = 'results' AND TABLE_SCHEMA = DATABASE()
+            """))
+            existing_columns = [row[0] for row in result.fetchall()]
+
+        if 'finish_seconds' not in existing_columns:
+            print("   ❌ finish_seconds missing - run migrations/add_result_time_seconds.py first")
+            return
+
+        if 'race_year' not in existing_columns:
+            conn.execute(text("ALTER TABLE results ADD COLUMN race_year INTEGER"))
+            conn.commit()
+            print("   ✓ race_year column added")
+        else:
+            print("   ✓ race_year column already exists")
+
+        if 'gender' not in existing_columns:
+            conn.execute(text("ALTER TABLE results ADD COLUMN gender VARCHAR(1)"))
+            conn.commit()
+            print("   ✓ gender column added")
+        else:
+            print("   ✓ gender column already exists")
+
+        print("\n2. Backfilling race_year and gender...")
+        if dialect == 'sqlite':
+            year_expr = "CAST(strftime('%Y', race_time) AS INTEGER)"
+        else:
+            year_expr = "YEAR(race_time)"
+        result = conn.execute(text(f"""
+            UPDATE results SET
+                race_year = {year_expr},
+                gender = CASE WHEN SUBSTR(gender_age, 1, 1) IN ('M', 'W')
+                              THEN SUBSTR(gender_age, 1, 1) END
+        """))
+        conn.commit()
+        print(f"   ✓ {result.rowcount} rows updated")
+
+        print("\n3. Adding indexes...")
+        for index_name, columns in INDEXES.items():
+            if dialect == 'sqlite':
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON results({columns})"))
+            else:
+                result = conn.execute(text("""
+                    SELECT COUNT(*) FROM INFORMATION_SCHEMA.STATISTICS
+                    WHERE TABLE_NAME = 'results' AND INDEX_NAME = :index_name AND TABLE_SCHEMA = DATABASE()
+                """), {"index_name": index_name})
+                if result.fetchone()[0] == 0:
+                    conn.execute(text(f"CREATE INDEX {index_name} ON results({columns})"))
+            conn.commit()
+            print(f"   ✓ {index_name} added/verified")
+
+    print("\n4. Rebuilding records leaderboard...")
+    db = SessionLocal()
+    try:
+        slice_count = rebuild_leaderboard(db)
+        db.commit()
+        print(f"   ✓ {slice_count} leaderboard slices rebuilt")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print("\n" + "=" * 60)
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration()
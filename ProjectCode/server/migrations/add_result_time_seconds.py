@@ -0,0 +1,144 @@
+"""
+Database Migration: Add Numeric Time Columns to Results
+
+This script adds integer-seconds columns parsed from the race time strings:
+- results.finish_seconds (overall_time)
+- results.gun_seconds (gun_time)
+- results.age_graded_seconds (age_graded_time)
+- results.pace_seconds (pace per mile)
+- result_leaderboard.finish_seconds (ranking key)
+
+It then backfills them with the same parser the importers use and rebuilds
+the records leaderboard so it is ranked by the numeric times.
+
+Run this script once to update the database schema.
+Usage: python migrations/add_result_time_seconds.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from database import engine, SessionLocal, Results
+from leaderboard import rebuild_leaderboard
+from race_times import apply_time_seconds
+
+BATCH_SIZE = 1000
+
+RESULTS_COLUMNS = ['finish_seconds', 'gun_seconds', 'age_graded_seconds', 'pace_seconds']
+
+
+def get_existing_columns(conn, dialect, table):
+    if dialect == 'sqlite':
+        result = conn.execute(text(f"PRAGMA table_info({table})"))
+        return [row[1] for row in result.fetchall()]
+    result = conn.execute(text("""
+        SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_NAME = :table AND TABLE_SCHEMA = DATABASE()
+    """), {"table": table})
+    return [row[0] for row in result.fetchall()]
+
+
+def index_exists(conn, dialect, table, index_name):
+    if dialect == 'sqlite':
+        result = conn.execute(text(f"PRAGMA index_list({table})"))
+        return index_name in [row[1] for row in result.fetchall()]
+    result = conn.execute(text("""
+        SELECT COUNT(*) FROM INFORMATION_SCHEMA.STATISTICS
+        WHERE TABLE_NAME = :table AND INDEX_NAME = :index_name AND TABLE_SCHEMA = DATABASE()
+    """), {"table": table, "index_name": index_name})
+    return result.fetchone()[0] > 0
+
+
+def backfill_results(rebuild: bool = True):
+    """
+    Parse time strings into the seconds columns, BATCH_SIZE rows at a time,
+    then rebuild the records leaderboard unless rebuild is False.
+    """
+    db = SessionLocal()
+    updated = 0
+    last_id = 0
+    try:
+        while True:
+            batch = db.query(Results).filter(
+                Results.id > last_id
+            ).order_by(Results.id).limit(BATCH_SIZE).all()
+            if not batch:
+                break
+
+            for result in batch:
+                apply_time_seconds(result)
+            db.commit()
+
+            updated += len(batch)
+            last_id = batch[-1].id
+            print(f"   ... {updated} rows parsed")
+
+        if rebuild:
+            print("   Rebuilding records leaderboard...")
+            slice_count = rebuild_leaderboard(db)
+            db.commit()
+            print(f"   ✓ {slice_count} leaderboard slices rebuilt")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    return updated
+
+
+def run_migration():
+    """Run the database migration to add and backfill numeric time columns."""
+
+    print("Starting migration: Add Numeric Time Columns to Results")
+    print("=" * 60)
+
+    with engine.connect() as conn:
+        dialect = engine.dialect.name
+        print(f"Database dialect: {dialect}")
+
+        print("\n1. Adding seconds columns to results table...")
+        existing_columns = get_existing_columns(conn, dialect, 'results')
+        for column in RESULTS_COLUMNS:
+            if column not in existing_columns:
+                conn.execute(text(f"ALTER TABLE results ADD COLUMN {column} INTEGER"))
+                conn.commit()
+                print(f"   ✓ {column} added")
+            else:
+                print(f"   ✓ {column} already exists")
+
+        print("\n2. Adding finish_seconds to result_leaderboard table...")
+        existing_columns = get_existing_columns(conn, dialect, 'result_leaderboard')
+        has_leaderboard = bool(existing_columns)
+        if not has_leaderboard:
+            print("   Note: result_leaderboard missing - skipping; run migrations/add_result_leaderboard.py,")
+            print("   which builds it from the backfilled seconds columns")
+        elif 'finish_seconds' not in existing_columns:
+            conn.execute(text("ALTER TABLE result_leaderboard ADD COLUMN finish_seconds INTEGER"))
+            conn.commit()
+            print("   ✓ finish_seconds added")
+        else:
+            print("   ✓ finish_seconds already exists")
+
+        print("\n3. Adding index on (race_distance, finish_seconds)...")
+        if not index_exists(conn, dialect, 'results', 'idx_distance_finish_seconds'):
+            conn.execute(text("CREATE INDEX idx_distance_finish_seconds ON results(race_distance, finish_seconds)"))
+            conn.commit()
+            print("   ✓ idx_distance_finish_seconds created")
+        else:
+            print("   ✓ idx_distance_finish_seconds already exists")
+
+    print("\n4. Backfilling seconds columns...")
+    updated = backfill_results(rebuild=has_leaderboard)
+    print(f"   ✓ {updated} results backfilled")
+
+    print("\n" + "=" * 60)
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration()
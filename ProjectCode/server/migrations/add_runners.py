@@ -0,0 +1,125 @@
+"""
+Database Migration: Add Runners Table
+
+This script adds the normalized runner identity used for member history
+lookups:
+1. Creates the runners table (name key, gender, birth-year range, NYRR ID)
+2. Adds results.runner_id with an index on (runner_id, race_time)
+3. Resolves every existing result to a runner
+4. Links members to runners through their nyrr_member_id
+
+Run this script once to update the database schema.
+Usage: python migrations/add_runners.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+from database import engine, SessionLocal, Runner, Results, Member
+from runners import RunnerResolver
+
+BATCH_SIZE = 1000
+
+
+def backfill_runners():
+    """Resolve all results to runners, then link members by NYRR ID."""
+    db = SessionLocal()
+    resolved = 0
+    linked = 0
+    last_id = 0
+    try:
+        resolver = RunnerResolver(db)
+        while True:
+            batch = db.query(Results).filter(
+                Results.id > last_id
+            ).order_by(Results.id).limit(BATCH_SIZE).all()
+            if not batch:
+                break
+
+            for result in batch:
+                resolver.resolve(result)
+            db.commit()
+
+            resolved += len(batch)
+            last_id = batch[-1].id
+            print(f"   ... {resolved} results resolved")
+
+        members = db.query(Member).filter(Member.nyrr_member_id.isnot(None)).all()
+        for member in members:
+            if resolver.link_member(member):
+                linked += 1
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    return resolved, linked
+
+
+def run_migration():
+    """Run the database migration to add the runners table."""
+
+    print("Starting migration: Add Runners Table")
+    print("=" * 60)
+
+    with engine.connect() as conn:
+        # Check if we're using SQLite or MySQL
+        dialect = engine.dialect.name
+        print(f"Database dialect: {dialect}")
+
+        print("\n1. Creating runners table...")
+        Runner.__table__.create(bind=conn, checkfirst=True)
+        conn.commit()
+        print("   ✓ runners table created/verified")
+
+        print("\n2. Adding runner_id to results table...")
+        if dialect == 'sqlite':
+            result = conn.execute(text("PRAGMA table_info(results)"))
+            existing_columns = [row[1] for row in result.fetchall()]
+        else:  # MySQL
+            result = conn.execute(text("""
+                SELECT COLUMN_NAME FROM INFORMATION_SCHEMA.COLUMNS
+                WHERE TABLE_NAME = 'results' AND TABLE_SCHEMA = DATABASE()
+            """))
+            existing_columns = [row[0] for row in result.fetchall()]
+
+        if 'age' not in existing_columns:
+            print("   ❌ age missing - run migrations/add_result_age.py first")
+            return
+
+        if 'runner_id' not in existing_columns:
+            if dialect == 'sqlite':
+                conn.execute(text("ALTER TABLE results ADD COLUMN runner_id INTEGER REFERENCES runners(id) ON DELETE SET NULL"))
+                conn.execute(text("CREATE INDEX IF NOT EXISTS idx_result_runner_id ON results(runner_id, race_time)"))
+            else:
+                conn.execute(text("ALTER TABLE results ADD COLUMN runner_id INT"))
+                conn.execute(text("CREATE INDEX idx_result_runner_id ON results(runner_id, race_time)"))
+                try:
+                    conn.execute(text("""
+                        ALTER TABLE results ADD CONSTRAINT fk_results_runner
+                        FOREIGN KEY (runner_id) REFERENCES runners(id) ON DELETE SET NULL
+                    """))
+                except Exception as e:
+                    print(f"   Note: Foreign key may already exist: {e}")
+            conn.commit()
+            print("   ✓ runner_id added")
+        else:
+            print("   ✓ runner_id already exists")
+
+    print("\n3. Resolving results to runners...")
+    resolved, linked = backfill_runners()
+    print(f"   ✓ {resolved} results resolved, {linked} members linked by NYRR ID")
+
+    print("\n" + "=" * 60)
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration()
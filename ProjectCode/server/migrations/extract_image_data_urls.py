@@ -0,0 +1,86 @@
+"""
+Database Migration: Extract Image Data URLs into the Blob Store
+
+Gallery images (event_gallery_images.image_url) and homepage section
+images (homepage_sections.image_url) used to be stored as base64 data URLs
+in the row. This script decodes each one, stores the bytes in the blob
+store (BLOB_STORE / BLOB_STORE_DIR, see blob_store.py) and replaces the
+column with the image's short /media/{hash} URL. Identical images end up
+as one blob.
+
+Rows are read a few at a time in ID order and committed per batch, so the
+script never holds more than one batch of images in memory and can be
+re-run safely: rows already converted are skipped. Rows whose data URL
+can't be decoded are left alone and reported.
+
+Run this script once after deploying the blob store.
+Usage: python migrations/extract_image_data_urls.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select, update
+
+from database import engine, EventGalleryImage, HomepageSection
+from blob_store import store_image_data_url, BLOB_STORE
+
+BATCH_SIZE = 20  # rows per transaction; each row may hold several MB of base64
+
+
+def extract_table(table) -> dict:
+    """Extract the data URLs of one table's image_url column."""
+    stats = {"converted": 0, "failed": 0, "bytes_before": 0, "bytes_after": 0}
+    last_id = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(table.c.id, table.c.image_url).where(
+                    table.c.id > last_id,
+                    table.c.image_url.like('data:%')
+                ).order_by(table.c.id).limit(BATCH_SIZE)
+            ).all()
+            if not rows:
+                return stats
+
+            for row in rows:
+                try:
+                    url = store_image_data_url(row.image_url)
+                except ValueError as e:
+                    print(f"   ✗ {table.name} row {row.id}: {e}")
+                    stats["failed"] += 1
+                    continue
+                conn.execute(update(table).where(table.c.id == row.id).values(image_url=url))
+                stats["converted"] += 1
+                stats["bytes_before"] += len(row.image_url)
+                stats["bytes_after"] += len(url)
+            last_id = rows[-1].id
+
+
+def run_migration():
+    """Run the migration moving image data URLs into the blob store."""
+
+    print("Starting migration: Extract Image Data URLs into the Blob Store")
+    print("=" * 60)
+    print(f"Database dialect: {engine.dialect.name}")
+    print(f"Blob store: {BLOB_STORE}")
+
+    for step, model in enumerate((EventGalleryImage, HomepageSection), start=1):
+        table = model.__table__
+        print(f"\n{step}. Extracting {table.name}.image_url data URLs...")
+        stats = extract_table(table)
+        print(f"   ✓ {stats['converted']} images moved to the blob store "
+              f"({stats['bytes_before'] / 1024 / 1024:.1f} MB of data URLs -> "
+              f"{stats['bytes_after'] / 1024:.1f} KB of URLs)")
+        if stats["failed"]:
+            print(f"   ✗ {stats['failed']} rows left unchanged (invalid data URL)")
+
+    print("\n" + "=" * 60)
+    print("Migration completed successfully!")
+
+
+if __name__ == "__main__":
+    run_migration()
@@ -402,6 +402,21 @@ class CommentWithModeration(CommentResponse):
     hidden_reason: Optional[str] = None
 
 
+class CommentPageResponse(BaseModel):
+    """One page of an event's visible comments (highlighted first, then newest)"""
+    comments: List[CommentResponse]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None  # Visible comment count, first page only
+
+
+class CommentModerationPageResponse(BaseModel):
+    """One page of all of an event's comments (admin view)"""
+    comments: List[CommentWithModeration]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None  # All comments, first page only
+    hidden_count: Optional[int] = None  # Hidden comments, first page only
+
+
 class CommentHideRequest(BaseModel):
     reason: str = Field(..., min_length=1, max_length=255)
 
@@ -454,7 +469,7 @@ class EventCommentSettingsUpdate(BaseModel):
 
 
 class EventCommentSettingsResponse(BaseModel):
-    id: int
+    id: Optional[int] = None  # None until an admin saves settings for the event
     event_id: int
     comments_enabled: bool = True
     likes_enabled: bool = True
@@ -487,6 +502,16 @@ class BatchEngagementResponse(BaseModel):
     engagements: Dict[int, EventEngagementResponse]
 
 
+# Columnar reaction counts for many events: entry i says counts[i] viewers
+# reacted emojis[i] to event event_ids[i]. Events without reactions have no
+# entries; user_reacted is null for viewers without an identity.
+class BatchReactionsResponse(BaseModel):
+    event_ids: List[int]
+    emojis: List[str]
+    counts: List[int]
+    user_reacted: Optional[List[bool]] = None
+
+
 # Temp Club Credit Schemas
 class CreditType(str, Enum):
     total = "total"
@@ -722,6 +747,9 @@ class EventGalleryImageResponse(EventGalleryImageBase):
     id: int
     event_id: int
     image_url: str
+    thumbnail_url: Optional[str] = None  # Resized variants; None until generated (fall back to image_url)
+    medium_url: Optional[str] = None
+    full_url: Optional[str] = None
     is_active: bool = True
     uploaded_by_id: Optional[int] = None
     uploaded_by_name: Optional[str] = None
@@ -750,6 +778,7 @@ class EventGalleryImageLikeResponse(BaseModel):
 class BatchGalleryPreviewRequest(BaseModel):
     event_ids: List[int]
     anonymous_id: Optional[str] = None
+    limit: int = Field(default=5, ge=1, le=50)  # Preview images per event
 
 
 class BatchGalleryPreviewResponse(BaseModel):
@@ -0,0 +1,150 @@
+"""
+Keyset Pagination
+
+Results listings page on an ordered tuple of columns (e.g. race_time, id)
+instead of OFFSET: each page filters past the last row of the previous one,
+so every page is an index range scan of at most `limit` rows no matter how
+deep the client has paged.
+
+The position is handed to clients as an opaque next_cursor token (URL-safe
+base64 of the last row's key values) and passed back as ?cursor=.
+"""
+
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import and_, or_, false
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    """Inverse of _encode_value; ValueError for anything it can't have produced."""
+    if isinstance(value, dict):
+        if list(value) != ["dt"] or not isinstance(value["dt"], str):
+            raise ValueError(f"unexpected value {value!r}")
+        return datetime.fromisoformat(value["dt"])
+    if value is not None and not isinstance(value, (bool, int, float, str)):
+        raise ValueError(f"unexpected value {value!r}")
+    return value
+
+
+def encode_cursor(values) -> str:
+    """Encode a row's key values as an opaque cursor token."""
+    payload = json.dumps([_encode_value(v) for v in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token: str) -> list:
+    """
+    Decode a cursor token back into key values.
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list):
+            raise ValueError("not a list")
+        return [_decode_value(v) for v in values]
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+def _check_value(column, value):
+    """
+    Raise ValueError unless a decoded cursor value fits its column's type,
+    so a tampered cursor is rejected before it reaches the database.
+    """
+    if value is None:
+        return
+    try:
+        expected = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return  # expression without a known Python type
+    if expected is bool:
+        valid = isinstance(value, bool)
+    elif expected in (int, float, Decimal):
+        valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+        if expected is int:
+            valid = valid and float(value).is_integer()
+    else:
+        valid = isinstance(value, expected)
+    if not valid:
+        raise ValueError(f"Invalid cursor value for {column.key}")
+
+
+def _past(column, value, descending: bool):
+    """Rows whose `column` sorts strictly after `value`."""
+    # NULLs sort first ascending / last descending (MySQL and SQLite default)
+    if value is None:
+        return false() if descending else column.isnot(None)
+    if isinstance(value, bool):
+        value = int(value)  # Boolean columns are stored and ordered as 0/1
+    if descending:
+        return or_(column < value, column.is_(None))
+    return column > value
+
+
+def _equal(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def keyset_filter(columns, values, descending: bool = False):
+    """
+    Rows strictly after `values` in (columns...) order, expanded as
+    c1 > v1 OR (c1 = v1 AND c2 > v2) OR ... so the leading column can
+    drive an index range scan. Nullable columns are handled in the
+    dialects' default NULL ordering.
+    """
+    clauses = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        equal = [_equal(columns[j], values[j]) for j in range(i)]
+        past = _past(column, value, descending)
+        clauses.append(and_(*equal, past) if equal else past)
+    return or_(*clauses)
+
+
+def paginate(query, columns, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE, descending: bool = False):
+    """
+    Fetch one page of `query` ordered by `columns`.
+
+    `columns` must make the order total (end with a unique column) and each
+    must be readable from a result row under its .key (ORM attribute name
+    or label).
+
+    Returns:
+        (rows, next_cursor) - next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is malformed or its values don't fit the columns' types
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(columns):
+            raise ValueError("Invalid cursor")
+        for column, value in zip(columns, values):
+            _check_value(column, value)
+        query = query.filter(keyset_filter(columns, values, descending))
+
+    order_by = [column.desc() if descending else column.asc() for column in columns]
+    rows = query.order_by(*order_by).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([getattr(rows[-1], column.key) for column in columns])
+    return rows, next_cursor
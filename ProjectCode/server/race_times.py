@@ -0,0 +1,83 @@
+"""
+Race Result Parsing
+
+NYRR reports times as strings ("0:58:18", "59:59", pace "05:50"), which
+don't sort correctly as text ("1:02:03" < "59:59"), and packs gender and
+age into one gender_age string ("M50"). Every importer runs results through
+apply_derived_columns() so the numeric / indexed columns on Results stay in
+step with the raw values, and filtering, ranking and PR queries can run
+inside the database.
+"""
+
+import datetime
+from typing import Optional
+
+from database import Results
+
+
+def parse_time_to_seconds(value) -> Optional[int]:
+    """
+    Convert a race time to whole seconds.
+
+    Accepts "H:MM:SS", "MM:SS" or "SS" strings (fractional seconds are
+    dropped, trailing text like "/mi" is ignored) as well as datetime.time
+    and timedelta values, which pandas may produce when reading Excel sheets.
+
+    Returns:
+        Seconds as int, or None if the value is blank or unparseable
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime.timedelta):
+        return int(value.total_seconds())
+    if isinstance(value, datetime.time):
+        return value.hour * 3600 + value.minute * 60 + value.second
+
+    text = str(value).strip()
+    if not text or text.lower() in ('nan', 'none', 'nat', '-', 'dnf'):
+        return None
+
+    # Drop anything after the time itself (e.g. "05:50/mi")
+    text = text.split()[0].split('/')[0]
+
+    parts = text.split(':')
+    if len(parts) > 3:
+        return None
+    try:
+        numbers = [float(part) for part in parts]
+    except ValueError:
+        return None
+    if any(n < 0 for n in numbers):
+        return None
+
+    seconds = 0
+    for n in numbers:
+        seconds = seconds * 60 + n
+    return int(seconds)
+
+
+def parse_gender_age(value) -> tuple:
+    """
+    Split an NYRR gender_age string into (gender, age): "M50" -> ("M", 50).
+    Either part is None when missing or malformed.
+    """
+    text = str(value).strip() if value is not None else ''
+    gender = text[:1] if text[:1] in ('M', 'W') else None
+    age = int(text[1:]) if text[1:].isdigit() else None
+    return gender, age
+
+
+def apply_time_seconds(result: Results) -> Results:
+    """Fill a result's *_seconds columns from its time strings."""
+    result.finish_seconds = parse_time_to_seconds(result.overall_time)
+    result.gun_seconds = parse_time_to_seconds(result.gun_time)
+    result.age_graded_seconds = parse_time_to_seconds(result.age_graded_time)
+    result.pace_seconds = parse_time_to_seconds(result.pace)
+    return result
+
+
+def apply_derived_columns(result: Results) -> Results:
+    """Fill every derived column on a result (race_year, gender, age, *_seconds)."""
+    result.race_year = result.race_time.year if result.race_time else None
+    result.gender, result.age = parse_gender_age(result.gender_age)
+    return apply_time_seconds(result)
@@ -0,0 +1,176 @@
+"""
+Runner Identity Resolution
+
+Results rows are linked to a Runner (normalized name + gender + birth-year
+range) so member history lookups are one indexed join instead of a
+case-insensitive name scan. The importers create one RunnerResolver per run;
+it loads the runners table into memory once and resolves every imported row
+against that map.
+"""
+
+from typing import Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from database import Runner, Member, Results
+
+
+def normalize_name(name) -> str:
+    """Lowercase and collapse whitespace: "  Jane   DOE " -> "jane doe"."""
+    return ' '.join(str(name or '').split()).casefold()
+
+
+def member_result_gender(gender: Optional[str]) -> Optional[str]:
+    """Members store "M"/"F" while NYRR results use "M"/"W"."""
+    return 'W' if gender == 'F' else gender
+
+
+def birth_year_range(race_year: Optional[int], age: Optional[int]) -> tuple:
+    """
+    Birth years consistent with an age on race day: a runner aged 30 in 2024
+    was born in 1994, or 1993 if their birthday came after the race.
+
+    Returns:
+        (min, max) tuple, or (None, None) if age or year is unknown
+    """
+    if not race_year or not age:
+        return None, None
+    return race_year - age - 1, race_year - age
+
+
+class RunnerEntry:
+    """
+    The resolver's copy of a runner row. Plain attributes, not the ORM
+    object: importers commit as they go, and with expire_on_commit every
+    cached Runner would reload itself (one SELECT each) on its next read.
+    """
+
+    __slots__ = ("id", "name_key", "gender", "birth_year_min", "birth_year_max", "nyrr_member_id")
+
+    def __init__(self, id, name_key, gender, birth_year_min, birth_year_max, nyrr_member_id):
+        self.id = id
+        self.name_key = name_key
+        self.gender = gender
+        self.birth_year_min = birth_year_min
+        self.birth_year_max = birth_year_max
+        self.nyrr_member_id = nyrr_member_id
+
+
+def overlap(runner: RunnerEntry, low: int, high: int) -> int:
+    """Number of birth years a runner's range shares with [low, high] (0 if disjoint)."""
+    return max(0, min(runner.birth_year_max, high) - max(runner.birth_year_min, low) + 1)
+
+
+class RunnerResolver:
+    """Resolve result rows to runners through an in-memory map."""
+
+    def __init__(self, db: Session):
+        self.db = db
+        self._by_name = {}  # (name_key, gender) -> [RunnerEntry]
+        self._by_nyrr_id = {}  # nyrr_member_id -> RunnerEntry
+        rows = db.query(
+            Runner.id, Runner.name_key, Runner.gender,
+            Runner.birth_year_min, Runner.birth_year_max, Runner.nyrr_member_id
+        ).all()
+        for row in rows:
+            self._remember(RunnerEntry(*row))
+
+    def _remember(self, runner: RunnerEntry):
+        self._by_name.setdefault((runner.name_key, runner.gender), []).append(runner)
+        if runner.nyrr_member_id:
+            self._by_nyrr_id[runner.nyrr_member_id] = runner
+
+    def _save(self, runner: RunnerEntry, **values):
+        """Apply changes to the entry and its row (in the caller's transaction)."""
+        for column, value in values.items():
+            setattr(runner, column, value)
+        self.db.execute(
+            update(Runner).where(Runner.id == runner.id).values(**values).execution_options(synchronize_session=False)
+        )
+
+    def _match(self, name_key: str, gender: Optional[str], low: Optional[int], high: Optional[int]) -> Optional[RunnerEntry]:
+        candidates = self._by_name.get((name_key, gender), [])
+        if low is None:
+            # No age to disambiguate - attach when the name is unambiguous,
+            # otherwise share one age-less runner for this name
+            if len(candidates) == 1:
+                return candidates[0]
+            return next((r for r in candidates if r.birth_year_min is None), None)
+
+        # Runners whose range still intersects this result's; the tightest
+        # match wins, so a result for 1981-1982 goes to the 1981-1982
+        # runner rather than one at 1980-1981 that only touches it
+        ranged = [r for r in candidates if r.birth_year_min is not None and overlap(r, low, high)]
+        if ranged:
+            return max(ranged, key=lambda r: (overlap(r, low, high), r.birth_year_min - r.birth_year_max))
+        return next((r for r in candidates if r.birth_year_min is None), None)
+
+    def resolve(self, result: Results, nyrr_member_id: Optional[str] = None) -> RunnerEntry:
+        """
+        Attach a result to its runner, creating the runner if needed.
+
+        The result's derived columns (race_year, gender, age) must already be
+        filled. A runner's birth-year range is narrowed to the overlap of all
+        its results, since the true birth year satisfies every one of them.
+        """
+        name_key = normalize_name(result.name)
+        low, high = birth_year_range(result.race_year, result.age)
+
+        runner = self._by_nyrr_id.get(nyrr_member_id) if nyrr_member_id else None
+        if runner is None:
+            runner = self._match(name_key, result.gender, low, high)
+
+        if runner is None:
+            row = Runner(
+                name_key=name_key,
+                display_name=result.name,
+                gender=result.gender,
+                birth_year_min=low,
+                birth_year_max=high,
+                nyrr_member_id=nyrr_member_id
+            )
+            self.db.add(row)
+            self.db.flush([row])  # for its id
+            runner = RunnerEntry(row.id, name_key, result.gender, low, high, nyrr_member_id)
+            self._remember(runner)
+        else:
+            if low is not None:
+                if runner.birth_year_min is None:
+                    self._save(runner, birth_year_min=low, birth_year_max=high)
+                elif overlap(runner, low, high) and (low > runner.birth_year_min or high < runner.birth_year_max):
+                    self._save(
+                        runner,
+                        birth_year_min=max(runner.birth_year_min, low),
+                        birth_year_max=min(runner.birth_year_max, high)
+                    )
+            if nyrr_member_id and not runner.nyrr_member_id:
+                self._save(runner, nyrr_member_id=nyrr_member_id)
+                self._by_nyrr_id[nyrr_member_id] = runner
+
+        result.runner_id = runner.id
+        return runner
+
+    def link_member(self, member: Member) -> Optional[RunnerEntry]:
+        """
+        Link a member's NYRR ID to the runner matching their display name,
+        gender and birth year. Returns the linked runner, if any.
+        """
+        if not member.nyrr_member_id or not member.display_name:
+            return None
+        if member.nyrr_member_id in self._by_nyrr_id:
+            return self._by_nyrr_id[member.nyrr_member_id]
+
+        candidates = self._by_name.get((normalize_name(member.display_name), member_result_gender(member.gender)), [])
+        if member.birth_year:
+            candidates = [
+                r for r in candidates
+                if r.birth_year_min is not None and r.birth_year_min <= member.birth_year <= r.birth_year_max
+            ]
+        if len(candidates) != 1 or candidates[0].nyrr_member_id:
+            return None
+
+        runner = candidates[0]
+        self._save(runner, nyrr_member_id=member.nyrr_member_id)
+        self._by_nyrr_id[member.nyrr_member_id] = runner
+        return runner
@@ -4,19 +4,29 @@ Event Recurrence Scheduler
 This module handles the automated generation of recurring event instances
 using APScheduler. The scheduler runs a daily job at 2 AM to check for
 events with active recurrence rules and generates upcoming instances.
+
+It also runs an hourly job that reconciles the denormalized
+event_engagement_counters with the likes/reactions/comments tables, and
+refreshes the author name/photo snapshots on comments: right after a
+member's profile changes (schedule_comment_author_refresh) and in a nightly
+sweep that catches changes made outside the API.
 """
 
 import os
 import logging
-from datetime import date, timedelta
+import threading
+from datetime import date, datetime, timedelta
 import json
 from contextlib import contextmanager
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
 from sqlalchemy.orm import Session
 
 from database import SessionLocal, Event, EventRecurrenceRule
+from engagement import reconcile_engagement_counters
+from comment_authors import refresh_comment_authors
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -317,6 +327,99 @@ def generate_recurring_events():
         logger.info(f"Recurring events generation complete. Created {total_generated} instances.")
 
 
+def reconcile_engagement_counters_job():
+    """
+    Hourly job that repairs drift between event_engagement_counters and the
+    likes/reactions/comments rows they count.
+    """
+    logger.info("Starting engagement counters reconciliation job...")
+    with get_db_session() as db:
+        try:
+            stats = reconcile_engagement_counters(db)
+            logger.info(
+                f"Engagement counters reconciled: {stats['checked']} events checked, "
+                f"{stats['repaired']} repaired, {stats['created']} created"
+            )
+        except Exception as e:
+            logger.error(f"Error reconciling engagement counters: {e}")
+            db.rollback()
+
+
+# Members whose comment snapshots are waiting for the one-off refresh job,
+# and whether a run is already draining them
+_pending_author_refresh = set()
+_pending_author_lock = threading.Lock()
+_author_refresh_running = False
+
+
+def refresh_comment_authors_job(member_ids=None):
+    """
+    Rewrite stale comment author snapshots in bounded batches, for the
+    given members or (nightly) for everyone, and log rows touched and time
+    taken.
+    """
+    with get_db_session() as db:
+        try:
+            stats = refresh_comment_authors(db, member_ids)
+            logger.info(
+                f"Comment author snapshots refreshed: {stats['rows']} rows for {stats['members']} members "
+                f"in {stats['batches']} batches, {stats['seconds']:.2f}s"
+            )
+            return stats
+        except Exception as e:
+            logger.error(f"Error refreshing comment author snapshots: {e}")
+            db.rollback()
+
+
+def _refresh_pending_comment_authors():
+    """
+    Drain the pending set, looping until it is empty so changes queued
+    during a run are refreshed by that run rather than waiting for the
+    nightly sweep.
+    """
+    global _author_refresh_running
+    try:
+        while True:
+            with _pending_author_lock:
+                member_ids = set(_pending_author_refresh)
+                _pending_author_refresh.clear()
+                if not member_ids:
+                    _author_refresh_running = False
+                    return
+            refresh_comment_authors_job(member_ids)
+    except BaseException:
+        with _pending_author_lock:
+            _author_refresh_running = False
+        raise
+
+
+def schedule_comment_author_refresh(member_id: int):
+    """
+    Queue a refresh of a member's comment snapshots after a profile change.
+    Runs in the background right away; changes arriving while a run is
+    queued or in progress are picked up by that run. Without a running
+    scheduler (scripts) the nightly sweep picks the member up.
+    """
+    global _author_refresh_running
+    with _pending_author_lock:
+        _pending_author_refresh.add(member_id)
+        if _author_refresh_running or not scheduler.running:
+            return
+        _author_refresh_running = True
+    try:
+        scheduler.add_job(
+            _refresh_pending_comment_authors,
+            DateTrigger(run_date=datetime.now()),
+            id='refresh_comment_authors_pending',
+            replace_existing=True,
+            max_instances=2  # the previous run may not have returned yet
+        )
+    except Exception:
+        with _pending_author_lock:
+            _author_refresh_running = False
+        raise
+
+
 def start_scheduler():
     """
     Start the APScheduler with configured jobs.
@@ -335,9 +438,30 @@ def start_scheduler():
         max_instances=1
     )
 
+    # Repair engagement counter drift - runs hourly at :15
+    scheduler.add_job(
+        reconcile_engagement_counters_job,
+        CronTrigger(minute=15),
+        id='reconcile_engagement_counters',
+        replace_existing=True,
+        max_instances=1
+    )
+
+    # Sweep stale comment author snapshots - runs daily at 3 AM
+    scheduler.add_job(
+        refresh_comment_authors_job,
+        CronTrigger(hour=3, minute=0),
+        id='refresh_comment_authors',
+        replace_existing=True,
+        max_instances=1
+    )
+
     # Start the scheduler
     scheduler.start()
-    logger.info("Scheduler started - recurring events job scheduled for 2 AM daily")
+    logger.info(
+        "Scheduler started - recurring events job scheduled for 2 AM daily, engagement counters reconciled hourly, "
+        "comment author snapshots swept at 3 AM"
+    )
 
 
 def shutdown_scheduler():
@@ -22,6 +22,11 @@ from datetime import datetime
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import and_
 from database import engine, Results, Member
+from leaderboard import apply_results
+from age_grades import rebuild_age_grades
+from race_times import apply_derived_columns
+from runners import RunnerResolver
+from member_stats_cache import bump_import_generation
 import io
 import time
 import os
@@ -193,6 +198,7 @@ def sync_member_results(member_id=None, dry_run=False):
             query = query.filter(Member.id == member_id)
 
         members = query.all()
+        runner_resolver = RunnerResolver(session)
 
         print(f"\n{'DRY RUN - ' if dry_run else ''}Syncing results for {len(members)} members...\n")
 
@@ -208,6 +214,7 @@ def sync_member_results(member_id=None, dry_run=False):
                 continue
 
             stats['members_with_results'] += 1
+            new_results = []
 
             # Process each result
             for _, result_row in results_df.iterrows():
@@ -224,19 +231,32 @@ def sync_member_results(member_id=None, dry_run=False):
 
                 # Add new result
                 if not dry_run:
-                    new_result = Results(**result_data)
+                    new_result = apply_derived_columns(Results(**result_data))
+                    runner_resolver.resolve(new_result, member.nyrr_member_id)
                     session.add(new_result)
+                    new_results.append(new_result)
 
                 stats['new_results'] += 1
                 print(f"  ✅ New result: {result_data['race']} ({result_data['race_time'].strftime('%Y-%m-%d')})")
 
             # Commit after each member to avoid losing progress
             if not dry_run:
+                # Update the records leaderboard in the same transaction
+                session.flush()
+                apply_results(session, new_results)
+                if new_results:
+                    bump_import_generation(session)  # API caches of member stats are now stale
                 session.commit()
 
             # Be respectful to the API
             time.sleep(1)
 
+        # Age-grade rankings depend on every runner, so recompute them once per run
+        if not dry_run and stats['new_results']:
+            summary_rows = rebuild_age_grades(session)
+            session.commit()
+            print(f"\n  Age-grade summaries rebuilt: {summary_rows} rows")
+
         print(f"\n{'DRY RUN ' if dry_run else ''}Sync Complete!")
         print(f"  Members processed: {stats['members_processed']}")
         print(f"  Members with results: {stats['members_with_results']}")
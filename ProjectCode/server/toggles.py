@@ -0,0 +1,109 @@
+"""
+Atomic Toggles
+
+Likes, reactions, tip upvotes and gallery likes are toggled against the
+tables' unique constraints (target + member_id / target + anonymous_id)
+instead of SELECT-then-INSERT/DELETE:
+1. Lock the target row (the event, tip or gallery image) with SELECT ...
+   FOR UPDATE, so toggles of one target run one at a time.
+2. DELETE the actor's row. A rowcount of 1 means it was there: toggled off.
+3. Otherwise INSERT IGNORE (INSERT OR IGNORE on SQLite) the row.
+
+The target lock matters on MySQL: a DELETE that finds nothing still takes
+a gap lock on the unique index, so two unserialized clicks by one actor
+could both take it and then deadlock on their inserts, or the second
+INSERT IGNORE could land after the first and leave the row in place after
+two clicks. Behind the lock the second click waits, then its DELETE sees
+the first click's row. The returned rowcount delta is what the caller
+applies to the stored counts, so counts follow the rows that really
+changed.
+
+Callers run the whole toggle transaction through retry_on_deadlock, which
+rolls back and runs it once more if the database picked it as a deadlock
+victim anyway (e.g. against an unrelated transaction).
+"""
+
+from typing import Callable, Optional, Tuple, TypeVar
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from database import Member, insert_ignore
+
+T = TypeVar("T")
+
+MYSQL_DEADLOCK = 1213  # ER_LOCK_DEADLOCK
+SERIALIZATION_FAILURE = "40001"  # SQLSTATE
+
+ACTOR_COLUMNS = ("member_id", "anonymous_id", "firebase_uid")
+
+
+def actor_row(model, member: Optional[Member], anonymous_id: Optional[str], **target) -> dict:
+    """Insert mapping for an actor's row on target (same keys for members and anonymous users)."""
+    row = dict(target)
+    row["member_id"] = member.id if member else None
+    row["anonymous_id"] = anonymous_id if not member else None
+    if hasattr(model, "firebase_uid"):
+        row["firebase_uid"] = member.firebase_uid if member else None
+    return row
+
+
+def actor_match(model, row: dict) -> list:
+    """WHERE clauses selecting the row's target and actor (the unique key)."""
+    actor_column = "member_id" if row["member_id"] is not None else "anonymous_id"
+    clauses = [getattr(model, column) == value for column, value in row.items() if column not in ACTOR_COLUMNS]
+    clauses.append(getattr(model, actor_column) == row[actor_column])
+    return clauses
+
+
+def lock_target(db: Session, target_model, target_id: int):
+    """SELECT ... FOR UPDATE the target row (a no-op on SQLite, which serializes writers)."""
+    db.execute(select(target_model.id).where(target_model.id == target_id).with_for_update())
+
+
+def toggle_row(db: Session, model, row: dict, target: tuple) -> Tuple[bool, int]:
+    """
+    Flip the actor's row in the caller's transaction.
+
+    Args:
+        target: (model, id) of the row being liked/reacted to, locked first
+
+    Returns:
+        (active, delta) - whether the row exists afterwards, and the change
+        in the target's row count (-1, 0 or +1)
+    """
+    lock_target(db, *target)
+    if db.execute(delete(model).where(*actor_match(model, row))).rowcount:
+        return False, -1
+    if db.execute(insert_ignore(model).values(**row)).rowcount:
+        return True, 1
+    return True, 0
+
+
+def delete_row(db: Session, model, row: dict, target: tuple) -> bool:
+    """Delete the actor's row if present, under the target lock; True if one was deleted."""
+    lock_target(db, *target)
+    return db.execute(delete(model).where(*actor_match(model, row))).rowcount > 0
+
+
+def is_deadlock(error: DBAPIError) -> bool:
+    """True for a deadlock / serialization failure, where rerunning the transaction is safe."""
+    orig = error.orig
+    code = orig.args[0] if getattr(orig, "args", None) else None
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    return code == MYSQL_DEADLOCK or sqlstate == SERIALIZATION_FAILURE
+
+
+def retry_on_deadlock(db: Session, transaction: Callable[[], T]) -> T:
+    """
+    Run transaction (which commits), rolling back and running it once more
+    if it was chosen as a deadlock victim.
+    """
+    try:
+        return transaction()
+    except DBAPIError as e:
+        if not is_deadlock(e):
+            raise
+        db.rollback()
+    return transaction()
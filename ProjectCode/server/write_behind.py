@@ -0,0 +1,366 @@
+"""
+Write-Behind Engagement Toggles
+
+Optional mode for race-day bursts, enabled with ENGAGEMENT_WRITE_BEHIND=true.
+Event likes, reactions, training-tip upvotes and gallery-image likes are
+answered from in-process state. A background thread writes them to the
+database every ENGAGEMENT_FLUSH_INTERVAL_MS milliseconds, so a click no
+longer waits for a commit (only for a primary-key/unique-key lookup the
+first time an actor touches a target).
+
+Pending changes are kept per (kind, target, actor) as "stored in the
+database" vs "wanted". Toggling again before a flush flips "wanted" back,
+so a burst of clicks from one actor becomes at most one INSERT or DELETE.
+A flush writes every pending change in one transaction:
+- one grouped INSERT per kind that skips rows already present (the unique
+  constraints on (target, member) / (target, anonymous_id))
+- one DELETE per target for the actors that un-toggled
+- the stored counts of the touched targets are recomputed from the rows
+  (event_engagement_counters, training_tips.upvotes,
+  event_gallery_images.like_count)
+
+Guarantees:
+- Durability: a toggle is acknowledged before it is committed. Changes
+  still pending when the process dies are lost: normally at most one flush
+  interval's worth, more while the database is unreachable. A failed flush
+  is put back and retried on the next tick, and shutdown drains the buffer.
+  If the batch fails for any reason other than a database/connection
+  error (OperationalError), the changes are written one per transaction
+  so one bad row doesn't hold back the rest; a change that fails on its
+  own ENGAGEMENT_FLUSH_MAX_ATTEMPTS times is logged and dropped.
+- Ordering: per (target, actor) the last toggle this process received wins.
+  Nothing is ordered across actors or targets, or against writes that
+  bypass the buffer (remove_like/remove_reaction, admin deletes).
+- Visibility: the toggling client sees its change immediately. Read
+  endpoints read the database and lag by up to one flush.
+- Processes: the buffer is per process. With several workers the unique
+  constraints keep the rows correct and the post-flush recount keeps the
+  stored counts correct, but one worker's responses don't include another
+  worker's unflushed clicks.
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from database import (
+    SessionLocal, Like, Reaction, TrainingTip, TrainingTipUpvote, EventGalleryImage, EventGalleryImageLike, Member,
+    insert_ignore
+)
+from engagement import load_engagement_counts, refresh_engagement_counters
+from engagement_cache import engagement_cache
+from toggles import actor_row
+
+ENGAGEMENT_WRITE_BEHIND = os.getenv("ENGAGEMENT_WRITE_BEHIND", "false").lower() == "true"
+ENGAGEMENT_FLUSH_INTERVAL_MS = int(os.getenv("ENGAGEMENT_FLUSH_INTERVAL_MS", "200"))
+ENGAGEMENT_FLUSH_MAX_ATTEMPTS = int(os.getenv("ENGAGEMENT_FLUSH_MAX_ATTEMPTS", "3"))
+
+logger = logging.getLogger(__name__)
+
+# kind -> (row model, target columns)
+KINDS = {
+    "like": (Like, ("event_id",)),
+    "reaction": (Reaction, ("event_id", "emoji")),
+    "tip_upvote": (TrainingTipUpvote, ("tip_id",)),
+    "gallery_like": (EventGalleryImageLike, ("image_id",)),
+}
+
+
+def _actor(member: Optional[Member], anonymous_id: Optional[str]) -> tuple:
+    return ("member", member.id) if member else ("anonymous", anonymous_id)
+
+
+def _row(kind: str, target: tuple, member: Optional[Member], anonymous_id: Optional[str]) -> dict:
+    model, columns = KINDS[kind]
+    return actor_row(model, member, anonymous_id, **dict(zip(columns, target)))
+
+
+def _target_filter(kind: str, target: tuple) -> list:
+    model, columns = KINDS[kind]
+    return [getattr(model, column) == value for column, value in zip(columns, target)]
+
+
+def _actor_filter(model, actor: tuple):
+    return model.member_id == actor[1] if actor[0] == "member" else model.anonymous_id == actor[1]
+
+
+def _load_stored(db: Session, kind: str, target: tuple, actor: tuple) -> bool:
+    model = KINDS[kind][0]
+    return db.query(model.id).filter(*_target_filter(kind, target), _actor_filter(model, actor)).first() is not None
+
+
+def _load_count(db: Session, kind: str, target: tuple) -> int:
+    if kind == "like":
+        return load_engagement_counts(db, [target[0]])[target[0]]["likes"]
+    if kind == "reaction":
+        return load_engagement_counts(db, [target[0]])[target[0]]["reactions"].get(target[1], 0)
+    if kind == "tip_upvote":
+        return db.query(TrainingTip.upvotes).filter(TrainingTip.id == target[0]).scalar() or 0
+    return db.query(EventGalleryImage.like_count).filter(EventGalleryImage.id == target[0]).scalar() or 0
+
+
+def _recount_column(db: Session, parent, column, row_model, foreign_key, ids):
+    """UPDATE parent SET column = (SELECT COUNT(*) of its rows) for the given parent IDs."""
+    row_count = select(func.count(row_model.id)).where(foreign_key == parent.id).scalar_subquery()
+    db.query(parent).filter(parent.id.in_(ids)).update({column: row_count}, synchronize_session=False)
+
+
+class WriteBehindBuffer:
+    """Pending engagement toggles of this process plus the flush thread."""
+
+    def __init__(self, session_factory=SessionLocal, interval_ms: int = ENGAGEMENT_FLUSH_INTERVAL_MS):
+        self.session_factory = session_factory
+        self.interval = interval_ms / 1000
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {}   # (kind, target, actor) -> {"stored": bool, "wanted": bool, "row": dict, "attempts": int}
+        self._flushing = {}  # changes being written by the running flush
+        self._counts = {}    # (kind, target) -> count including unflushed changes
+        self._generation = 0  # bumped after every flush
+        self._stop = threading.Event()
+        self._thread = None
+
+    def toggle(
+        self,
+        db: Session,
+        kind: str,
+        target: tuple,
+        member: Optional[Member],
+        anonymous_id: Optional[str]
+    ) -> Tuple[bool, int]:
+        """
+        Flip the actor's toggle on target.
+
+        Returns:
+            (active, count) - whether the actor now has the like/reaction/
+            upvote, and the target's count including unflushed changes
+        """
+        key = (kind, target, _actor(member, anonymous_id))
+        target_key = (kind, target)
+        while True:
+            with self._lock:
+                change = self._change(key)
+                if change is not None:
+                    return self._apply(change, target_key)
+                generation = self._generation
+                count_known = target_key in self._counts
+
+            # First touch by this actor: read what the database holds
+            stored = _load_stored(db, kind, target, key[2])
+            count = None if count_known else _load_count(db, kind, target)
+
+            with self._lock:
+                if self._generation != generation:
+                    continue  # a flush committed in between; read again
+                change = self._change(key) or self._pending.setdefault(key, {
+                    "stored": stored, "wanted": stored, "row": _row(kind, target, member, anonymous_id), "attempts": 0
+                })
+                if target_key not in self._counts:
+                    if count is None:
+                        continue
+                    self._counts[target_key] = count
+                return self._apply(change, target_key)
+
+    def _change(self, key) -> Optional[dict]:
+        """Pending change for key; a change being flushed is continued from its wanted state."""
+        change = self._pending.get(key)
+        if change is None and key in self._flushing:
+            flushing = self._flushing[key]
+            change = self._pending[key] = {
+                "stored": flushing["wanted"], "wanted": flushing["wanted"], "row": flushing["row"], "attempts": 0
+            }
+        return change
+
+    def _apply(self, change: dict, target_key) -> Tuple[bool, int]:
+        change["wanted"] = not change["wanted"]
+        self._counts[target_key] = max(0, self._counts[target_key] + (1 if change["wanted"] else -1))
+        return change["wanted"], self._counts[target_key]
+
+    def counts(self, kind: str, prefix: tuple) -> Dict[tuple, int]:
+        """Buffered counts of targets starting with prefix (e.g. all reactions of one event)."""
+        with self._lock:
+            return {
+                target: count for (k, target), count in self._counts.items()
+                if k == kind and target[:len(prefix)] == prefix
+            }
+
+    def states(self, kind: str, prefix: tuple, member: Optional[Member], anonymous_id: Optional[str]) -> Dict[tuple, bool]:
+        """The actor's buffered toggle states for targets starting with prefix."""
+        actor = _actor(member, anonymous_id)
+        with self._lock:
+            changes = {**self._flushing, **self._pending}
+        return {
+            target: change["wanted"] for (k, target, a), change in changes.items()
+            if k == kind and a == actor and target[:len(prefix)] == prefix
+        }
+
+    def overlay_reactions(
+        self,
+        event_id: int,
+        counts: dict,
+        user_reactions: set,
+        member: Optional[Member],
+        anonymous_id: Optional[str]
+    ):
+        """Apply unflushed reaction toggles to an event's stored counts and the viewer's emojis, in place."""
+        for (_, emoji), count in self.counts("reaction", (event_id,)).items():
+            if count > 0:
+                counts["reactions"][emoji] = count
+            else:
+                counts["reactions"].pop(emoji, None)
+        for (_, emoji), active in self.states("reaction", (event_id,), member, anonymous_id).items():
+            if active:
+                user_reactions.add(emoji)
+            else:
+                user_reactions.discard(emoji)
+
+    def flush(self) -> int:
+        """
+        Write all pending changes in one transaction, falling back to one
+        transaction per change if the batch is rejected.
+
+        Returns:
+            Number of changes written (failed ones are put back for the next
+            attempt, or dropped after ENGAGEMENT_FLUSH_MAX_ATTEMPTS)
+        """
+        with self._flush_lock:
+            with self._lock:
+                self._flushing, self._pending = self._pending, {}
+                changes = {key: change for key, change in self._flushing.items() if change["wanted"] != change["stored"]}
+
+            failed = {}
+            if changes:
+                try:
+                    self._commit(changes)
+                except OperationalError:
+                    logger.exception("Write-behind flush of %d engagement changes failed; retrying", len(changes))
+                    failed = changes
+                except Exception:
+                    logger.exception(
+                        "Write-behind flush of %d engagement changes failed; writing them one by one", len(changes)
+                    )
+                    failed = self._commit_each(changes)
+            if failed:
+                self._restore(failed)
+
+            with self._lock:
+                self._flushing = {}
+                self._generation += 1
+                live = {(kind, target) for kind, target, _ in self._pending}
+                self._counts = {target_key: count for target_key, count in self._counts.items() if target_key in live}
+            return len(changes) - len(failed)
+
+    def _commit(self, changes: dict):
+        """Write changes in one transaction and drop the cached counts they touch."""
+        db = self.session_factory()
+        try:
+            self._write(db, changes)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        engagement_cache.invalidate(*{target[0] for kind, target, _ in changes if kind in ("like", "reaction")})
+
+    def _commit_each(self, changes: dict) -> dict:
+        """
+        Write changes one per transaction.
+
+        Returns:
+            The changes that failed. A change rejected by the database
+            (anything but an OperationalError) counts an attempt, and is
+            logged and dropped once it reaches ENGAGEMENT_FLUSH_MAX_ATTEMPTS.
+        """
+        failed = {}
+        for key, change in changes.items():
+            try:
+                self._commit({key: change})
+            except OperationalError:
+                failed[key] = change
+            except Exception:
+                change["attempts"] += 1
+                failed[key] = change
+                if change["attempts"] >= ENGAGEMENT_FLUSH_MAX_ATTEMPTS:
+                    logger.exception(
+                        "Dropping write-behind change %s (wanted=%s) after %d failed attempts",
+                        key, change["wanted"], change["attempts"]
+                    )
+        return failed
+
+    def _restore(self, failed: dict):
+        """
+        Put failed changes back in front of the ones that arrived meanwhile.
+        Dropped changes are not put back, but newer changes to the same key
+        still learn the state the database actually holds.
+        """
+        with self._lock:
+            for key, change in failed.items():
+                newer = self._pending.get(key)
+                if newer is not None:
+                    newer["stored"] = change["stored"]
+                elif change["attempts"] < ENGAGEMENT_FLUSH_MAX_ATTEMPTS:
+                    self._pending[key] = change
+            self._flushing = {}
+
+    def _write(self, db: Session, changes: dict):
+        inserts = {}
+        deletes = {}
+        for (kind, target, actor), change in changes.items():
+            if change["wanted"]:
+                inserts.setdefault(kind, []).append(change["row"])
+            else:
+                deletes.setdefault((kind, target), []).append(actor)
+
+        for kind, rows in inserts.items():
+            db.execute(insert_ignore(KINDS[kind][0]), rows)
+
+        for (kind, target), actors in deletes.items():
+            model = KINDS[kind][0]
+            member_ids = [value for actor_type, value in actors if actor_type == "member"]
+            anonymous_ids = [value for actor_type, value in actors if actor_type == "anonymous"]
+            db.query(model).filter(
+                *_target_filter(kind, target),
+                or_(model.member_id.in_(member_ids), model.anonymous_id.in_(anonymous_ids))
+            ).delete(synchronize_session=False)
+
+        touched = {}
+        for kind, target, _ in changes:
+            touched.setdefault(kind, set()).add(target[0])
+        event_ids = touched.get("like", set()) | touched.get("reaction", set())
+        if event_ids:
+            refresh_engagement_counters(db, event_ids)
+        if "tip_upvote" in touched:
+            _recount_column(db, TrainingTip, TrainingTip.upvotes, TrainingTipUpvote, TrainingTipUpvote.tip_id, touched["tip_upvote"])
+        if "gallery_like" in touched:
+            _recount_column(db, EventGalleryImage, EventGalleryImage.like_count, EventGalleryImageLike,
+                            EventGalleryImageLike.image_id, touched["gallery_like"])
+
+    def start(self):
+        """Start the background flush thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="engagement-write-behind", daemon=True)
+        self._thread.start()
+        logger.info(f"Engagement write-behind started (flush every {self.interval * 1000:.0f} ms)")
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def stop(self):
+        """Stop the flush thread and write whatever is still pending."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+
+write_behind = WriteBehindBuffer()